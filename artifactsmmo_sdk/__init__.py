@@ -1,8 +1,10 @@
 """Init Artifacts MMO SDK."""
 
+from .async_client import AsyncArtifactsClient
 from .client import ArtifactsClient
 
 
 __all__ = [
     "ArtifactsClient",
+    "AsyncArtifactsClient",
 ]
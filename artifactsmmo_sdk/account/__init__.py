@@ -1,8 +1,10 @@
 """Init Characters."""
 
+from .async_account import AsyncAccount
 from .account import Account
 
 
 __all__ = [
+    "AsyncAccount",
     "Account",
 ]
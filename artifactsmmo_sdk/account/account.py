@@ -1,100 +1,81 @@
 """Account."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
 from ..models.actions import (
     ListBankItemsResponseSchema,
     ListBankGoldsResponseSchema,
     ChangePasswordResponseSchema,
+    SimpleItemSchema,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Account:
+class Account(BaseApi):
     """Account."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_bank_items(
         self,
         item_code: Annotated[str, Field(description="Item to search in your bank.", pattern="^[a-zA-Z0-9_-]+$")],
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListBankItemsResponseSchema | None]:
+    ) -> Result[ListBankItemsResponseSchema]:
         """Fetch all items in your bank."""
-        try:
-            parameters = f"item_code={item_code}"
-            parameters += f"&page={page}"
-            parameters += f"&size={size}"
-
-            response = self.session.get(
-                url=f"{self.api_url}/my/bank/items?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched items.",
-                ListBankItemsResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Items not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"item_code={item_code}"
+        parameters += f"&page={page}"
+        parameters += f"&size={size}"
+
+        return self._request(
+            method="GET",
+            path=f"/my/bank/items?{parameters}",
+            schema=ListBankItemsResponseSchema,
+            message="Successfully fetched items.",
+            errors={
+                404: "Items not found.",
+            },
+        )
+
+    def iter_bank_items(
+        self,
+        item_code: Annotated[str, Field(description="Item to search in your bank.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[SimpleItemSchema]:
+        """Iterate over the bank items of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_bank_items(
+                item_code=item_code,
+                page=page,
+                size=size,
+            ),
+            "bank items",
+        )
 
     def get_bank_gold(
         self,
-    ) -> Tuple[str, ListBankGoldsResponseSchema | None]:
+    ) -> Result[ListBankGoldsResponseSchema]:
         """Fetch golds in your bank."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/my/bank/gold",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched golds.",
-                ListBankGoldsResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path="/my/bank/gold",
+            schema=ListBankGoldsResponseSchema,
+            message="Successfully fetched golds.",
+            errors={},
+        )
 
     def change_password(
         self,
-    ) -> Tuple[str, ChangePasswordResponseSchema | None]:
+    ) -> Result[ChangePasswordResponseSchema]:
         """Change your account password. Changing the password reset the account token."""
-        try:
-            response = self.session.post(
-                url=f"{self.api_url}/my/change_password",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Password changed successfully.",
-                ChangePasswordResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 458:
-                    return "Use a different password.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="POST",
+            path="/my/change_password",
+            schema=ChangePasswordResponseSchema,
+            message="Password changed successfully.",
+            errors={
+                458: "Use a different password.",
+            },
+        )
@@ -0,0 +1,81 @@
+"""Async Account."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.actions import (
+    ListBankItemsResponseSchema,
+    ListBankGoldsResponseSchema,
+    ChangePasswordResponseSchema,
+    SimpleItemSchema,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncAccount(AsyncBaseApi):
+    """Async Account."""
+
+    async def get_bank_items(
+        self,
+        item_code: Annotated[str, Field(description="Item to search in your bank.", pattern="^[a-zA-Z0-9_-]+$")],
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListBankItemsResponseSchema]:
+        """Fetch all items in your bank."""
+        parameters = f"item_code={item_code}"
+        parameters += f"&page={page}"
+        parameters += f"&size={size}"
+
+        return await self._request(
+            method="GET",
+            path=f"/my/bank/items?{parameters}",
+            schema=ListBankItemsResponseSchema,
+            message="Successfully fetched items.",
+            errors={
+                404: "Items not found.",
+            },
+        )
+
+    def iter_bank_items(
+        self,
+        item_code: Annotated[str, Field(description="Item to search in your bank.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[SimpleItemSchema]:
+        """Iterate over the bank items of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_bank_items(
+                item_code=item_code,
+                page=page,
+                size=size,
+            ),
+            "bank items",
+        )
+
+    async def get_bank_gold(
+        self,
+    ) -> Result[ListBankGoldsResponseSchema]:
+        """Fetch golds in your bank."""
+        return await self._request(
+            method="GET",
+            path="/my/bank/gold",
+            schema=ListBankGoldsResponseSchema,
+            message="Successfully fetched golds.",
+            errors={},
+        )
+
+    async def change_password(
+        self,
+    ) -> Result[ChangePasswordResponseSchema]:
+        """Change your account password. Changing the password reset the account token."""
+        return await self._request(
+            method="POST",
+            path="/my/change_password",
+            schema=ChangePasswordResponseSchema,
+            message="Password changed successfully.",
+            errors={
+                458: "Use a different password.",
+            },
+        )
@@ -1,8 +1,10 @@
 """Init Actions."""
 
+from .async_actions import AsyncActions
 from .actions import Actions
 
 
 __all__ = [
+    "AsyncActions",
     "Actions",
 ]
@@ -0,0 +1,494 @@
+"""Async Actions."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.actions import (
+    BankItemResponseSchema,
+    CharacterFightDataResponseSchema,
+    CharacterMovementDataResponseSchema,
+    CharactersResponseSchema,
+    DeleteItemResponseSchema,
+    EquipRequestResponseSchema,
+    GETransactionResponseSchema,
+    GoldTransactionResponseSchema,
+    LogsResponseSchema,
+    LogsSchema,
+    RecyclingDataResponseSchema,
+    SkillDataResponseSchema,
+    SlotEnum,
+    TaskDataResponseSchema,
+    TaskRewardDataResponseSchema,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncActions(AsyncBaseApi):
+    """Async Actions."""
+
+    async def move(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        x: Annotated[int, Field(description="The x coordinate of the destination.")],
+        y: Annotated[int, Field(description="The y coordinate of the destination.")],
+    ) -> Result[CharacterMovementDataResponseSchema]:
+        """Move a character on the map using the map's X and Y position."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/move",
+            json={
+                "x": x,
+                "y": y,
+            },
+            schema=CharacterMovementDataResponseSchema,
+            message="The character has moved successfully.",
+            errors={
+                404: "Map not found.",
+                486: "Character is locked. Action is already in progress.",
+                490: "Character already at destination.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+            },
+        )
+
+    async def equip_item(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        slot: Annotated[SlotEnum, Field(description="Item slot.")],
+    ) -> Result[EquipRequestResponseSchema]:
+        """Equip an item on your character."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/equip",
+            json={
+                "code": code,
+                "slot": slot,
+            },
+            schema=EquipRequestResponseSchema,
+            message="The item has been successfully equipped on your character.",
+            errors={
+                404: "Item not found.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                485: "This item is already equipped.",
+                486: "Character is locked. Action is already in progress.",
+                491: "Slot is not empty.",
+                496: "Character level is insufficient.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+            },
+        )
+
+    async def unequip_item(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        slot: Annotated[SlotEnum, Field(description="Item slot.")],
+    ) -> Result[EquipRequestResponseSchema]:
+        """Unequip an item on your character."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/unequip",
+            json={
+                "slot": slot,
+            },
+            schema=EquipRequestResponseSchema,
+            message="The item has been successfully unequipped and added in his inventory.",
+            errors={
+                404: "Item not found.",
+                486: "Character is locked. Action is already in progress.",
+                491: "Slot is empty.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+            },
+        )
+
+    async def fight(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[CharacterFightDataResponseSchema]:
+        """Start a fight against a monster on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/fight",
+            schema=CharacterFightDataResponseSchema,
+            message="The fight ended successfully.",
+            errors={
+                486: "Character is locked. Action is already in progress.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Monster not found on this map.",
+            },
+        )
+
+    async def gathering(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[SkillDataResponseSchema]:
+        """Harvest a resource on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/gathering",
+            schema=SkillDataResponseSchema,
+            message="The resource has been successfully gathered.",
+            errors={
+                404: "Item not found.",
+                486: "Character is locked. Action is already in progress.",
+                493: "Not skill level required.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Resource not found on this map.",
+            },
+        )
+
+    async def crafting(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Craft code.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Quantity of items to craft.", ge=1, default=1)] = 1,
+    ) -> Result[SkillDataResponseSchema]:
+        """Crafting an item. The character must be on a map with a workshop."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/crafting",
+            json={
+                "code": code,
+                "quantity": quantity,
+            },
+            schema=SkillDataResponseSchema,
+            message="The item was successfully crafted.",
+            errors={
+                404: "Craft not found.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                493: "Not skill level required.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Workshop not found on this map.",
+            },
+        )
+
+    async def deposit_bank(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, default=1)] = 1,
+    ) -> Result[BankItemResponseSchema]:
+        """Deposit an item in a bank on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/bank/deposit",
+            json={
+                "code": code,
+                "quantity": quantity,
+            },
+            schema=BankItemResponseSchema,
+            message="Item successfully deposited in your bank.",
+            errors={
+                404: "Item not found.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Bank not found on this map.",
+            },
+        )
+
+    async def deposit_bank_gold(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, default=1)] = 1,
+    ) -> Result[GoldTransactionResponseSchema]:
+        """Deposit golds in a bank on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/bank/deposit/gold",
+            json={
+                "quantity": quantity,
+            },
+            schema=GoldTransactionResponseSchema,
+            message="Golds successfully deposited in your bank.",
+            errors={
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                492: "Insufficient golds on your character.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Bank not found on this map.",
+            },
+        )
+
+    async def recycling(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Quantity of items to recycle.", ge=1, default=1)] = 1,
+    ) -> Result[RecyclingDataResponseSchema]:
+        """Recyling an item. The character must be on a map with a workshop (only for equipments and weapons)."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/recycling",
+            json={
+                "code": code,
+                "quantity": quantity,
+            },
+            schema=RecyclingDataResponseSchema,
+            message="The items were successfully recycled.",
+            errors={
+                404: "Item not found.",
+                473: "Quantity of items to recycle.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                493: "Not skill level required.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Workshop not found on this map.",
+            },
+        )
+
+    async def withdraw_bank(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, default=1)] = 1,
+    ) -> Result[BankItemResponseSchema]:
+        """Take an item from your bank and put it in the character's inventory."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/bank/withdraw",
+            json={
+                "code": code,
+                "quantity": quantity,
+            },
+            schema=BankItemResponseSchema,
+            message="Item successfully withdraw from your bank.",
+            errors={
+                404: "Item not found.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Bank not found on this map.",
+            },
+        )
+
+    async def withdraw_bank_gold(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, default=1)] = 1,
+    ) -> Result[GoldTransactionResponseSchema]:
+        """Withdraw gold from your bank."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/bank/withdraw/gold",
+            json={
+                "quantity": quantity,
+            },
+            schema=GoldTransactionResponseSchema,
+            message="Golds successfully withdraw from your bank.",
+            errors={
+                460: "Insufficient golds in your bank.",
+                486: "Character is locked. Action is already in progress.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Bank not found on this map.",
+            },
+        )
+
+    async def ge_buy_item(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        price: Annotated[int, Field(description="Item quantity.", ge=1)],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, le=50, default=1)] = 1,
+    ) -> Result[GETransactionResponseSchema]:
+        """Buy an item at the Grand Exchange on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/ge/buy",
+            json={
+                "code": code,
+                "quantity": quantity,
+                "price": price,
+            },
+            schema=GETransactionResponseSchema,
+            message="Item successfully buy from the Grand Exchange.",
+            errors={
+                480: "No stock for this item.",
+                482: "No item at this price.",
+                486: "Character is locked. Action is already in progress.",
+                492: "Insufficient golds on your character.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Grand Exchange not found on this map.",
+            },
+        )
+
+    async def ge_sell_item(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        price: Annotated[int, Field(description="Item quantity.", ge=1)],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, le=50, default=1)] = 1,
+    ) -> Result[GETransactionResponseSchema]:
+        """Sell an item at the Grand Exchange on the character's map."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/ge/sell",
+            json={
+                "code": code,
+                "quantity": quantity,
+                "price": price,
+            },
+            schema=GETransactionResponseSchema,
+            message="Item successfully sell at the Grand Exchange.",
+            errors={
+                404: "Item not found.",
+                478: "Missing item or insufficient quantity in your inventory.",
+                482: "No item at this price.",
+                486: "Character is locked. Action is already in progress.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Grand Exchange not found on this map.",
+            },
+        )
+
+    async def accept_new_task(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[TaskDataResponseSchema]:
+        """Accept a new task."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/task/new",
+            schema=TaskDataResponseSchema,
+            message="New task successfully accepted.",
+            errors={
+                486: "Character is locked. Action is already in progress.",
+                489: "Character already has a task.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Tasks Master not found on this map.",
+            },
+        )
+
+    async def complete_task(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[TaskRewardDataResponseSchema]:
+        """Complete a task."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/task/complete",
+            schema=TaskRewardDataResponseSchema,
+            message="The task has been successfully completed.",
+            errors={
+                486: "Character is locked. Action is already in progress.",
+                487: "Character has no task.",
+                488: "Character has not completed the task.",
+                497: "Character inventory is full.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Tasks Master not found on this map.",
+            },
+        )
+
+    async def task_exchange(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[TaskRewardDataResponseSchema]:
+        """Exchange 3 tasks coins for a random reward. Rewards are exclusive resources for crafting items."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/task/exchange",
+            schema=TaskRewardDataResponseSchema,
+            message="The tasks coins have been successfully exchanged.",
+            errors={
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                497: "Character inventory is full..",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+                598: "Tasks Master not found on this map.",
+            },
+        )
+
+    async def delete_item(
+        self,
+        name: Annotated[str, Field(description="Name of your character.", pattern="^[a-zA-Z0-9_-]+$")],
+        code: Annotated[str, Field(description="Item code.", pattern="^[a-zA-Z0-9_-]+$")],
+        quantity: Annotated[int, Field(description="Item quantity.", ge=1, default=1)] = 1,
+    ) -> Result[DeleteItemResponseSchema]:
+        """Delete an item from your character's inventory.."""
+        return await self._request(
+            method="POST",
+            path=f"/my/{name}/action/recycling",
+            json={
+                "code": code,
+                "quantity": quantity,
+            },
+            schema=DeleteItemResponseSchema,
+            message="Item successfully deleted from your character.",
+            errors={
+                478: "Missing item or insufficient quantity in your inventory.",
+                486: "Character is locked. Action is already in progress.",
+                498: "Character not found.",
+                499: "Character in cooldown.",
+            },
+        )
+
+    async def get_all_character_logs(
+        self,
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[LogsResponseSchema]:
+        """Get all character logs."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+
+        return await self._request(
+            method="GET",
+            path=f"/my/logs?{parameters}",
+            schema=LogsResponseSchema,
+            message="Successfully fetched logs.",
+            errors={
+                404: "Logs not found.",
+                498: "Character not found.",
+            },
+        )
+
+    def iter_character_logs(
+        self,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[LogsSchema]:
+        """Iterate over the character logs of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_character_logs(
+                page=page,
+                size=size,
+            ),
+            "character logs",
+        )
+
+    async def get_my_characters(
+        self,
+    ) -> Result[CharactersResponseSchema]:
+        """List of your characters."""
+        return await self._request(
+            method="GET",
+            path="/my/characters",
+            schema=CharactersResponseSchema,
+            message="Successfully fetched characters.",
+            errors={
+                404: "Character not found.",
+            },
+        )
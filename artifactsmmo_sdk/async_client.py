@@ -0,0 +1,193 @@
+"""Async client SDK for the Artifacts MMO Rest API."""
+
+import sys
+
+from os import environ
+from types import TracebackType
+from typing import Literal, Optional, Type, Union
+
+from dotenv import load_dotenv
+
+from .account import AsyncAccount
+from .actions import AsyncActions
+from .cache import ResponseCache
+from .characters import AsyncCharacters
+from .events import AsyncEvents
+from .grand_exchange import AsyncGrandExchange
+from .hooks import Hooks
+from .items import AsyncItems
+from .maps import AsyncMaps
+from .models.status import StatusReponseSchema
+from .monsters import AsyncMonsters
+from .pool import ConnectionPool
+from .rate_limiter import RateLimiter
+from .resources import AsyncResources
+from .retry import RetryPolicy
+from .server_clock import ServerClock
+from .session import DEFAULT_TIMEOUT, AsyncArtifactsSession, Timeout
+from .transport import Transport
+
+
+load_dotenv()
+
+
+class AsyncArtifactsClient:
+    """Async client SDK for the Artifacts MMO Rest API.
+
+    Mirrors `ArtifactsClient` on top of `httpx.AsyncClient`: every sub-client method is a coroutine
+    returning the same `(message, model)` tuple, so many calls can be in flight on one event loop.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        rate_limiter: Optional[Union[RateLimiter, Literal[False]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        hooks: Optional[Hooks] = None,
+        cache: Optional[ResponseCache] = None,
+        server_clock: Optional[ServerClock] = None,
+    ) -> None:
+        """Init the Client.
+
+        Requests are throttled by a default `RateLimiter()` (5 actions and 16 data requests per second, the
+        server limits); pass `rate_limiter=False` to send them unthrottled. Pass the same `rate_limiter` to
+        several clients to make them share one request budget.
+        Requests are not retried unless a `retry_policy` is given. `timeout` is the default (connect, read)
+        timeout of every request; use `with_options` on a sub-client for per-call timeouts and deadlines.
+        Pass the same `pool` to several clients to make them share their HTTP connections.
+        A `transport`, e.g. a `MemoryTransport`, replaces the network entirely.
+        `hooks` run around every sub-client call; `hooks.add_collector()` records per-endpoint metrics.
+        A `cache`, e.g. `ResponseCache()`, serves the items, monsters, resources and maps from memory once fetched.
+        A `server_clock`, e.g. `ServerClock()`, estimates the server clock offset from the `Date` of the responses.
+        """
+        self.api_url = environ.get("API_URL", api_url)
+        if not self.api_url:
+            print("API URL not found")
+            sys.exit(1)
+
+        self.token = environ.get("TOKEN", token)
+        if not self.token:
+            print("TOKEN not found")
+            sys.exit(1)
+
+        self.rate_limiter = None if rate_limiter is False else rate_limiter or RateLimiter()
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.cache = cache
+        self.server_clock = server_clock
+
+        self.shared_pool = pool is not None
+        self.session = AsyncArtifactsSession(
+            rate_limiter=self.rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            pool=pool,
+            transport=transport,
+            server_clock=server_clock,
+        )
+        self.session.headers.update(
+            {
+                "Accept": "Accept: application/json",
+                "Authorization": f"Bearer {self.token}",
+                "Content-Type": "application/json",
+            },
+        )
+
+        self.account = AsyncAccount(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.actions = AsyncActions(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.characters = AsyncCharacters(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.events = AsyncEvents(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.grand_exchange = AsyncGrandExchange(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.items = AsyncItems(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.maps = AsyncMaps(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.monsters = AsyncMonsters(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.resources = AsyncResources(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+    async def __aenter__(self) -> "AsyncArtifactsClient":
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the client when leaving the async context."""
+        await self.aclose()
+
+    async def aclose(
+        self,
+    ) -> None:
+        """Close the underlying HTTP connections, unless they are shared through a pool given to the client."""
+        await self.session.aclose()
+        if not self.shared_pool:
+            await self.session.pool.aclose()
+
+    async def status(
+        self,
+    ) -> StatusReponseSchema:
+        """Return the status of the game server."""
+        response = await self.session.get(
+            url=f"{self.api_url}/",
+        )
+
+        response.raise_for_status()
+
+        return StatusReponseSchema.model_validate(response.json())
@@ -0,0 +1,229 @@
+"""Base classes shared by the sub-clients."""
+
+import copy
+
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+import httpx
+import requests
+
+from pydantic import BaseModel
+
+from .cache import ResponseCache
+from .decoding import validate
+from .exceptions import DeadlineExceeded
+from .hooks import Hooks
+from .result import ApiError, ErrorCode, Result
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+ApiT = TypeVar("ApiT", bound="BaseApi")
+AsyncApiT = TypeVar("AsyncApiT", bound="AsyncBaseApi")
+
+
+class BaseApi:
+    """Base of the synchronous sub-clients."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: requests.Session,
+        hooks: Optional[Hooks] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        """Init."""
+        self.api_url = api_url
+        self.session = session
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.cache = cache
+        self.options: Dict[str, Any] = {}
+
+    def with_options(
+        self: ApiT,
+        timeout: float | Tuple[float, float] | None = None,
+        deadline: Optional[float] = None,
+    ) -> ApiT:
+        """Return a copy of the sub-client sending its requests with these options.
+
+        `timeout` overrides the (connect, read) timeout of each attempt, `deadline` caps the total number of
+        seconds a call may take, retries included.
+        """
+        api = copy.copy(self)
+        api.options = {**self.options}
+        if timeout is not None:
+            api.options["timeout"] = timeout
+        if deadline is not None:
+            api.options["deadline"] = deadline
+
+        return api
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        schema: Type[SchemaT],
+        message: str,
+        errors: Dict[int, str],
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Result[SchemaT]:
+        """Return the result of a request, from the cache when it holds it."""
+        if self.cache is None or method != "GET" or not self.cache.accepts(path):
+            return self._send(method, path, schema, message, errors, json)
+
+        result = self.cache.get(path)
+        if result is None:
+            result = self._send(method, path, schema, message, errors, json)
+            if result.ok:
+                self.cache.set(path, result)
+
+        return result
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        schema: Type[SchemaT],
+        message: str,
+        errors: Dict[int, str],
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Result[SchemaT]:
+        """Send a request and return the message with the validated schema, or the error message and code."""
+        call = self.hooks.start(method, path) if self.hooks else None
+        try:
+            response = self.session.request(
+                method=method,
+                url=f"{self.api_url}{path}",
+                json=json,
+                **self.options,
+            )
+            if call:
+                self.hooks.received(call, response.status_code, response.request.body, response.content)
+
+            response.raise_for_status()
+
+            result = validate(schema, response.content)
+            if call:
+                self.hooks.finish(call)
+
+            return Result(message, result, status_code=response.status_code)
+
+        except requests.exceptions.HTTPError as error:
+            if call:
+                self.hooks.finish(call)
+            code = error.response.status_code
+            message = errors.get(code, f"Unknown error: {error}")
+            return Result(message, None, ApiError(code, message, error.response.content))
+
+        except (requests.exceptions.Timeout, DeadlineExceeded) as error:
+            if call:
+                self.hooks.fail(call, error)
+            return Result("Request timed out.", None, ApiError(ErrorCode.TIMEOUT, "Request timed out."))
+
+        except Exception as error:
+            if call:
+                self.hooks.fail(call, error)
+            raise
+
+
+class AsyncBaseApi:
+    """Base of the asynchronous sub-clients."""
+
+    def __init__(
+        self,
+        api_url: str,
+        session: httpx.AsyncClient,
+        hooks: Optional[Hooks] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        """Init."""
+        self.api_url = api_url
+        self.session = session
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.cache = cache
+        self.options: Dict[str, Any] = {}
+
+    def with_options(
+        self: AsyncApiT,
+        timeout: float | Tuple[float, float] | None = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncApiT:
+        """Return a copy of the sub-client sending its requests with these options.
+
+        `timeout` overrides the (connect, read) timeout of each attempt, `deadline` caps the total number of
+        seconds a call may take, retries included.
+        """
+        api = copy.copy(self)
+        api.options = {**self.options}
+        if timeout is not None:
+            api.options["timeout"] = timeout
+        if deadline is not None:
+            api.options["deadline"] = deadline
+
+        return api
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        schema: Type[SchemaT],
+        message: str,
+        errors: Dict[int, str],
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Result[SchemaT]:
+        """Return the result of a request, from the cache when it holds it."""
+        if self.cache is None or method != "GET" or not self.cache.accepts(path):
+            return await self._send(method, path, schema, message, errors, json)
+
+        result = self.cache.get(path)
+        if result is None:
+            result = await self._send(method, path, schema, message, errors, json)
+            if result.ok:
+                self.cache.set(path, result)
+
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        schema: Type[SchemaT],
+        message: str,
+        errors: Dict[int, str],
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Result[SchemaT]:
+        """Send a request and return the message with the validated schema, or the error message and code."""
+        call = self.hooks.start(method, path) if self.hooks else None
+        try:
+            response = await self.session.request(
+                method=method,
+                url=f"{self.api_url}{path}",
+                json=json,
+                **self.options,
+            )
+            if call:
+                self.hooks.received(call, response.status_code, response.request.content, response.content)
+
+            response.raise_for_status()
+
+            result = validate(schema, response.content)
+            if call:
+                self.hooks.finish(call)
+
+            return Result(message, result, status_code=response.status_code)
+
+        except httpx.HTTPStatusError as error:
+            if call:
+                self.hooks.finish(call)
+            code = error.response.status_code
+            message = errors.get(code, f"Unknown error: {error}")
+            return Result(message, None, ApiError(code, message, error.response.content))
+
+        except (httpx.TimeoutException, DeadlineExceeded) as error:
+            if call:
+                self.hooks.fail(call, error)
+            return Result("Request timed out.", None, ApiError(ErrorCode.TIMEOUT, "Request timed out."))
+
+        except Exception as error:
+            if call:
+                self.hooks.fail(call, error)
+            raise
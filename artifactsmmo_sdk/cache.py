@@ -0,0 +1,124 @@
+"""Cache of the static game data."""
+
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+STATIC_PATHS = (
+    r"^/items(/|\?|$)",
+    r"^/monsters(/|\?|$)",
+    r"^/resources(/|\?|$)",
+    r"^/maps(/|\?|$)",
+)
+
+
+class ResponseCache:
+    """Bounded, thread-safe TTL/LRU cache of the successful GET results of the static endpoints.
+
+    Items, monsters, resources and maps only change on a wipe or a version bump, so their single lookups and
+    `get_all_*` pages are served from memory once fetched, until `ttl` seconds have passed. When `maxsize`
+    results are cached, the least recently used one is evicted. `paths` are the regexes of the cacheable
+    paths (query string included); the cached models are shared between the callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl: Optional[float] = 3600,
+        paths: Iterable[str] = STATIC_PATHS,
+    ) -> None:
+        """Init."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.paths = [re.compile(path) for path in paths]
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def accepts(
+        self,
+        path: str,
+    ) -> bool:
+        """Return whether the results of a path are cached."""
+        return any(pattern.search(path) for pattern in self.paths)
+
+    def get(
+        self,
+        path: str,
+    ) -> Optional[Any]:
+        """Return the cached result of a path, or None."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._entries[path]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return result
+
+    def set(
+        self,
+        path: str,
+        result: Any,
+    ) -> None:
+        """Cache the result of a path."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[path] = (expires_at, result)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(
+        self,
+        pattern: Optional[str] = None,
+    ) -> int:
+        """Drop the cached results whose path matches the regex (all of them by default); return their number."""
+        with self._lock:
+            if pattern is None:
+                paths = list(self._entries)
+            else:
+                regex = re.compile(pattern)
+                paths = [path for path in self._entries if regex.search(path)]
+
+            for path in paths:
+                del self._entries[path]
+
+            return len(paths)
+
+    def stats(
+        self,
+    ) -> Dict[str, int]:
+        """Return the size of the cache and its counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return the number of cached results."""
+        return len(self._entries)
@@ -1,8 +1,10 @@
 """Init Characters."""
 
+from .async_characters import AsyncCharacters
 from .characters import Characters
 
 
 __all__ = [
+    "AsyncCharacters",
     "Characters",
 ]
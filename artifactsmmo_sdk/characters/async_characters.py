@@ -0,0 +1,118 @@
+"""Async Characters."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.characters import (
+    CharacterResponseSchema,
+    CharacterSchema,
+    CharacterSkinEnum,
+    CharacterSortEnum,
+    ListCharacterResponseSchema,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncCharacters(AsyncBaseApi):
+    """Async Characters."""
+
+    async def create_character(
+        self,
+        name: Annotated[str, Field(
+            description="Your desired character name. It's unique and all players can see it.",
+            pattern="^[a-zA-Z0-9_-]+$",
+            min_length=3,
+            max_length=12,
+        )],
+        skin: Annotated[CharacterSkinEnum, Field(description="Your desired skin.")],
+    ) -> Result[CharacterResponseSchema]:
+        """Create new character on your account. You can create up to 5 characters."""
+        return await self._request(
+            method="POST",
+            path="/characters/create",
+            json={"name": name, "skin": skin},
+            schema=CharacterResponseSchema,
+            message="Successfully created character.",
+            errors={
+                494: "Name already used.",
+                495: "Maximum characters reached on your account.",
+            },
+        )
+
+    async def delete_character(
+        self,
+        name: Annotated[str, Field(
+            description="Character name.",
+            pattern="^[a-zA-Z0-9_-]+$",
+            min_length=3,
+            max_length=12,
+        )],
+    ) -> Result[CharacterResponseSchema]:
+        """Delete character on your account."""
+        return await self._request(
+            method="POST",
+            path="/characters/delete",
+            json={"name": name},
+            schema=CharacterResponseSchema,
+            message="Successfully deleted character.",
+            errors={
+                498: "Character not found.",
+            },
+        )
+
+    async def get_all_characters(
+        self,
+        sort: Annotated[str, Field(
+            description="Default sort by combat total XP.",
+            default="xp",
+        )] = CharacterSortEnum.GOLD.value,
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListCharacterResponseSchema]:
+        """Fetch characters details."""
+        parameters = f"sort={sort}"
+        parameters += f"&page={page}"
+        parameters += f"&size={size}"
+
+        return await self._request(
+            method="GET",
+            path=f"/characters?{parameters}",
+            schema=ListCharacterResponseSchema,
+            message="Successfully fetched characters details.",
+            errors={
+                404: "Characters not found.",
+            },
+        )
+
+    def iter_characters(
+        self,
+        sort: Annotated[str, Field(description="Default sort by combat total XP.")] = CharacterSortEnum.GOLD.value,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[CharacterSchema]:
+        """Iterate over the characters of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_characters(
+                sort=sort,
+                page=page,
+                size=size,
+            ),
+            "characters",
+        )
+
+    async def get_character(
+        self,
+        name: str,
+    ) -> Result[CharacterResponseSchema]:
+        """Retrieve the details of a character."""
+        return await self._request(
+            method="GET",
+            path=f"/characters/{name}",
+            schema=CharacterResponseSchema,
+            message="Successfully fetched character.",
+            errors={
+                404: "Character not found.",
+            },
+        )
@@ -1,31 +1,24 @@
 """Characters."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
 from ..models.characters import (
     CharacterResponseSchema,
+    CharacterSchema,
     CharacterSkinEnum,
     CharacterSortEnum,
     ListCharacterResponseSchema,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Characters:
+class Characters(BaseApi):
     """Characters."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def create_character(
         self,
         name: Annotated[str, Field(
@@ -35,29 +28,19 @@ def create_character(
             max_length=12,
         )],
         skin: Annotated[CharacterSkinEnum, Field(description="Your desired skin.")],
-    ) -> Tuple[str, CharacterResponseSchema | None]:
+    ) -> Result[CharacterResponseSchema]:
         """Create new character on your account. You can create up to 5 characters."""
-        try:
-            response = self.session.post(
-                url=f"{self.api_url}/characters/create",
-                json={"name": name, "skin": skin},
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully created character.",
-                CharacterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 494:
-                    return "Name already used.", None
-                case 495:
-                    return "Maximum characters reached on your account.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="POST",
+            path="/characters/create",
+            json={"name": name, "skin": skin},
+            schema=CharacterResponseSchema,
+            message="Successfully created character.",
+            errors={
+                494: "Name already used.",
+                495: "Maximum characters reached on your account.",
+            },
+        )
 
     def delete_character(
         self,
@@ -67,27 +50,18 @@ def delete_character(
             min_length=3,
             max_length=12,
         )],
-    ) -> Tuple[str, CharacterResponseSchema | None]:
+    ) -> Result[CharacterResponseSchema]:
         """Delete character on your account."""
-        try:
-            response = self.session.post(
-                url=f"{self.api_url}/characters/delete",
-                json={"name": name},
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully deleted character.",
-                CharacterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 498:
-                    return "Character not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="POST",
+            path="/characters/delete",
+            json={"name": name},
+            schema=CharacterResponseSchema,
+            message="Successfully deleted character.",
+            errors={
+                498: "Character not found.",
+            },
+        )
 
     def get_all_characters(
         self,
@@ -97,51 +71,48 @@ def get_all_characters(
         )] = CharacterSortEnum.GOLD.value,
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListCharacterResponseSchema | None]:
+    ) -> Result[ListCharacterResponseSchema]:
         """Fetch characters details."""
-        try:
-            parameters = f"sort={sort}"
-            parameters += f"&page={page}"
-            parameters += f"&size={size}"
-
-            response = self.session.get(
-                url=f"{self.api_url}/characters?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched characters details.",
-                ListCharacterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Characters not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"sort={sort}"
+        parameters += f"&page={page}"
+        parameters += f"&size={size}"
+
+        return self._request(
+            method="GET",
+            path=f"/characters?{parameters}",
+            schema=ListCharacterResponseSchema,
+            message="Successfully fetched characters details.",
+            errors={
+                404: "Characters not found.",
+            },
+        )
+
+    def iter_characters(
+        self,
+        sort: Annotated[str, Field(description="Default sort by combat total XP.")] = CharacterSortEnum.GOLD.value,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[CharacterSchema]:
+        """Iterate over the characters of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_characters(
+                sort=sort,
+                page=page,
+                size=size,
+            ),
+            "characters",
+        )
 
     def get_character(
         self,
         name: str,
-    ) -> Tuple[str, CharacterResponseSchema | None]:
+    ) -> Result[CharacterResponseSchema]:
         """Retrieve the details of a character."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/characters/{name}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched character.",
-                CharacterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Character not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/characters/{name}",
+            schema=CharacterResponseSchema,
+            message="Successfully fetched character.",
+            errors={
+                404: "Character not found.",
+            },
+        )
@@ -3,21 +3,28 @@
 import sys
 
 from os import environ
-from typing import Optional
-
-import requests
+from typing import Literal, Optional, Union
 
 from dotenv import load_dotenv
 
 from .account import Account
 from .actions import Actions
+from .cache import ResponseCache
 from .characters import Characters
 from .events import Events
+from .grand_exchange import GrandExchange
+from .hooks import Hooks
 from .items import Items
 from .maps import Maps
 from .models.status import StatusReponseSchema
 from .monsters import Monsters
+from .pool import ConnectionPool
+from .rate_limiter import RateLimiter
 from .resources import Resources
+from .retry import RetryPolicy
+from .server_clock import ServerClock
+from .session import DEFAULT_TIMEOUT, ArtifactsSession, Timeout
+from .transport import Transport
 
 
 load_dotenv()
@@ -30,8 +37,28 @@ def __init__(
         self,
         token: Optional[str] = None,
         api_url: Optional[str] = None,
+        rate_limiter: Optional[Union[RateLimiter, Literal[False]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        hooks: Optional[Hooks] = None,
+        cache: Optional[ResponseCache] = None,
+        server_clock: Optional[ServerClock] = None,
     ) -> None:
-        """Init the Client."""
+        """Init the Client.
+
+        Requests are throttled by a default `RateLimiter()` (5 actions and 16 data requests per second, the
+        server limits); pass `rate_limiter=False` to send them unthrottled. Pass the same `rate_limiter` to
+        several clients to make them share one request budget.
+        Requests are not retried unless a `retry_policy` is given. `timeout` is the default (connect, read)
+        timeout of every request; use `with_options` on a sub-client for per-call timeouts and deadlines.
+        Pass the same `pool` to several clients to make them share their HTTP connections.
+        A `transport`, e.g. a `MemoryTransport`, replaces the network entirely.
+        `hooks` run around every sub-client call; `hooks.add_collector()` records per-endpoint metrics.
+        A `cache`, e.g. `ResponseCache()`, serves the items, monsters, resources and maps from memory once fetched.
+        A `server_clock`, e.g. `ServerClock()`, estimates the server clock offset from the `Date` of the responses.
+        """
         self.api_url = environ.get("API_URL", api_url)
         if not self.api_url:
             print("API URL not found")
@@ -42,7 +69,19 @@ def __init__(
             print("TOKEN not found")
             sys.exit(1)
 
-        self.session = requests.Session()
+        self.rate_limiter = None if rate_limiter is False else rate_limiter or RateLimiter()
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.cache = cache
+        self.server_clock = server_clock
+
+        self.session = ArtifactsSession(
+            rate_limiter=self.rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            pool=pool,
+            transport=transport,
+            server_clock=server_clock,
+        )
         self.session.headers.update(
             {
                 "Accept": "Accept: application/json",
@@ -54,41 +93,64 @@ def __init__(
         self.account = Account(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.actions = Actions(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.characters = Characters(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.events = Events(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
+        )
+
+        self.grand_exchange = GrandExchange(
+            api_url=self.api_url,
+            session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.items = Items(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.maps = Maps(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.monsters = Monsters(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
         self.resources = Resources(
             api_url=self.api_url,
             session=self.session,
+            hooks=self.hooks,
+            cache=self.cache,
         )
 
     def status(
@@ -0,0 +1,261 @@
+"""Planning of the actions needed to craft an item."""
+
+import math
+
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .drops import DropIndex
+from .recipes import RecipeGraph
+
+
+@dataclass(frozen=True)
+class ActionCosts:
+    """Cooldown in seconds of a gathering, a fight, one craft and one bank withdrawal or deposit."""
+
+    gathering: float = 25.0
+    fight: float = 20.0
+    crafting: float = 5.0
+    bank: float = 3.0
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """An action of a plan.
+
+    - `withdraw` and `deposit`: `quantity` items of `code`.
+    - `gather` and `fight`: `quantity` actions on the resource or monster `code` (expected, drops are random).
+    - `craft`: `quantity` crafts of `code`, as sent to `Actions.crafting`.
+    """
+
+    action: str
+    code: str
+    quantity: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class CraftPlan:
+    """Actions to obtain a quantity of an item, in order, with their total cooldown (movements excluded).
+
+    `missing` are the items neither held, crafted nor dropped by a reachable source, and `levels` the skill
+    levels (`combat` being the character level) the plan requires.
+    """
+
+    code: str
+    quantity: int
+    steps: Tuple[PlanStep, ...] = ()
+    seconds: float = 0.0
+    missing: Dict[str, int] = field(default_factory=dict)
+    levels: Dict[str, int] = field(default_factory=dict)
+
+
+class CraftPlanner:
+    """Plan the withdrawals, gatherings, fights, crafts and deposit needed to obtain an item.
+
+    The items held in the inventory are used first, then those in the bank, and the rest is crafted or
+    dropped. Demands are accumulated over the recipe graph from the target down to the raw materials, so each
+    intermediate item is crafted in one batch, rounded up to whole crafts. The items involved in each target
+    are memoised, and so are the last `maxsize` plans, keyed by their inputs, so that planning the same target
+    again is a lookup (counted in `hits` and `misses`). Each call returns its own copy of the plan.
+    """
+
+    def __init__(
+        self,
+        recipes: RecipeGraph,
+        drops: DropIndex,
+        costs: ActionCosts = ActionCosts(),
+        maxsize: int = 1024,
+    ) -> None:
+        """Init."""
+        self.recipes = recipes
+        self.drops = drops
+        self.costs = costs
+        self.maxsize = maxsize
+
+        self.hits = 0
+        self.misses = 0
+
+        self._closures: Dict[str, List[str]] = {}
+        self._plans: OrderedDict[Tuple, CraftPlan] = OrderedDict()
+
+    def _closure(
+        self,
+        code: str,
+    ) -> List[str]:
+        """Return an item and every item it is crafted from, products before their materials."""
+        if code not in self._closures:
+            reachable = {code}
+            stack = [code]
+            while stack:
+                for material in self.recipes.materials.get(stack.pop(), ()):
+                    if material not in reachable:
+                        reachable.add(material)
+                        stack.append(material)
+            order = [item for item in reversed(self.recipes.order) if item in reachable]
+            self._closures[code] = order or [code]
+
+        return self._closures[code]
+
+    def plan(
+        self,
+        code: str,
+        quantity: int = 1,
+        inventory: Mapping[str, int] | Iterable[Any] = (),
+        bank: Mapping[str, int] | Iterable[Any] = (),
+        levels: Optional[Mapping[str, int]] = None,
+        deposit: bool = False,
+    ) -> CraftPlan:
+        """Return the plan to obtain `quantity` items of `code`, and deposit them in the bank if `deposit`.
+
+        `inventory` and `bank` are item counts by code, or the slots of `CharacterSchema.inventory` and
+        `Account.get_bank_items`. With `levels` (see `drops.character_levels`), only the sources reachable
+        at these levels are used.
+        """
+        held, banked = item_counts(inventory), item_counts(bank)
+        key = (
+            code,
+            quantity,
+            tuple(sorted(held.items())),
+            tuple(sorted(banked.items())),
+            tuple(sorted(levels.items())) if levels is not None else None,
+            deposit,
+        )
+        plan = self._plans.get(key)
+        if plan is not None:
+            self.hits += 1
+            self._plans.move_to_end(key)
+        else:
+            self.misses += 1
+            plan = self._plans[key] = self._plan(code, quantity, held, banked, levels, deposit)
+            if len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+
+        # The steps are immutable, the dicts are copied so that callers cannot alter the cached plan.
+        return replace(plan, missing=dict(plan.missing), levels=dict(plan.levels))
+
+    def _plan(
+        self,
+        code: str,
+        quantity: int,
+        held: Dict[str, int],
+        banked: Dict[str, int],
+        levels: Optional[Mapping[str, int]],
+        deposit: bool,
+    ) -> CraftPlan:
+        """Return a new plan."""
+        demand = {code: quantity}
+        tally = _Tally()
+        for item in self._closure(code):
+            needed = demand.get(item, 0)
+            needed -= min(needed, held.get(item, 0))
+            withdrawn = min(needed, banked.get(item, 0))
+            if withdrawn:
+                tally.withdrawals[item] = withdrawn
+                needed -= withdrawn
+            if needed and not self._craft(item, needed, demand, tally):
+                self._drop(item, needed, levels, tally)
+
+        steps = self._steps(code, quantity, tally, deposit)
+        return CraftPlan(
+            code=code,
+            quantity=quantity,
+            steps=tuple(steps),
+            seconds=sum(step.seconds for step in steps),
+            missing=tally.missing,
+            levels=tally.required,
+        )
+
+    def _craft(
+        self,
+        item: str,
+        needed: int,
+        demand: Dict[str, int],
+        tally: "_Tally",
+    ) -> bool:
+        """Craft the items needed and demand their materials, or return False when the item has no recipe."""
+        recipe = self.recipes.recipe(item)
+        if recipe is None:
+            return False
+
+        count = tally.crafts[item] = self.recipes.crafts(item, needed)
+        for material, per_craft in self.recipes.materials[item].items():
+            demand[material] = demand.get(material, 0) + per_craft * count
+        tally.require(recipe.skill, recipe.level)
+        return True
+
+    def _drop(
+        self,
+        item: str,
+        needed: int,
+        levels: Optional[Mapping[str, int]],
+        tally: "_Tally",
+    ) -> None:
+        """Gather or fight the best source of the items needed, or count them as missing without any."""
+        source = self.drops.best_source(item, levels=levels)
+        if source is None:
+            tally.missing[item] = needed
+            return
+
+        # A gathering or a fight yields all the drops of its source at once.
+        key = ("gather" if source.kind == "resource" else "fight", source.code)
+        tally.actions[key] = max(tally.actions.get(key, 0), math.ceil(source.expected_actions(needed)))
+        tally.require(source.skill, source.level)
+
+    def _steps(
+        self,
+        code: str,
+        quantity: int,
+        tally: "_Tally",
+        deposit: bool,
+    ) -> List[PlanStep]:
+        """Return the steps of a plan: the withdrawals, the gatherings and fights, the crafts then the deposit."""
+        steps = [
+            PlanStep("withdraw", item, count, self.costs.bank) for item, count in sorted(tally.withdrawals.items())
+        ]
+        for (action, source_code), count in sorted(tally.actions.items()):
+            seconds = self.costs.gathering if action == "gather" else self.costs.fight
+            steps.append(PlanStep(action, source_code, count, seconds * count))
+        for item in reversed(self._closure(code)):
+            if item in tally.crafts:
+                steps.append(PlanStep("craft", item, tally.crafts[item], self.costs.crafting * tally.crafts[item]))
+        if deposit:
+            steps.append(PlanStep("deposit", code, quantity, self.costs.bank))
+
+        return steps
+
+
+@dataclass
+class _Tally:
+    """Withdrawals, crafts, gatherings and fights, missing items and required levels of a plan being built."""
+
+    withdrawals: Dict[str, int] = field(default_factory=dict)
+    crafts: Dict[str, int] = field(default_factory=dict)
+    actions: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    missing: Dict[str, int] = field(default_factory=dict)
+    required: Dict[str, int] = field(default_factory=dict)
+
+    def require(
+        self,
+        skill: str,
+        level: int,
+    ) -> None:
+        """Raise the level a skill needs for the plan."""
+        self.required[skill] = max(self.required.get(skill, 0), level)
+
+
+def item_counts(
+    items: Mapping[str, int] | Iterable[Any],
+) -> Dict[str, int]:
+    """Return item counts by code, from a mapping or from slots with a `code` and a `quantity`."""
+    if isinstance(items, Mapping):
+        return {code: count for code, count in items.items() if count > 0}
+
+    counts: Dict[str, int] = {}
+    slot: Any
+    for slot in items:
+        if slot.code and slot.quantity > 0:
+            counts[slot.code] = counts.get(slot.code, 0) + slot.quantity
+
+    return counts
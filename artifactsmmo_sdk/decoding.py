@@ -0,0 +1,56 @@
+"""Validation of the response bodies."""
+
+import json
+
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+JSON_BACKENDS = ("pydantic", "orjson", "json")
+
+_LOADS: Optional[Callable[[bytes], Any]] = None
+
+
+def set_json_backend(
+    backend: str,
+) -> None:
+    """Select how the response bodies are parsed.
+
+    - `pydantic` (default): the schemas validate the raw bytes with their own JSON parser, without building
+      an intermediate dict tree.
+    - `orjson`: the bodies are parsed by orjson (`pip install artifactsmmo-sdk[orjson]`) then validated.
+    - `json`: the bodies are parsed by the standard library then validated, as before.
+    """
+    global _LOADS  # pylint: disable=global-statement
+
+    match backend:
+        case "pydantic":
+            _LOADS = None
+        case "orjson":
+            if orjson is None:
+                raise ImportError("The orjson backend requires the orjson package.")
+            _LOADS = orjson.loads
+        case "json":
+            _LOADS = json.loads
+        case _:
+            raise ValueError(f"Unknown JSON backend {backend!r}, expected one of {JSON_BACKENDS}.")
+
+
+def validate(
+    schema: Type[SchemaT],
+    content: bytes,
+) -> SchemaT:
+    """Validate a response body with a schema."""
+    if _LOADS is None:
+        return schema.model_validate_json(content)
+
+    return schema.model_validate(_LOADS(content))
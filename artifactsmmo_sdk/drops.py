@@ -0,0 +1,137 @@
+"""Index of the drops of the monsters and resources."""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .models.characters import CharacterSchema
+from .models.monsters import MonsterSchema
+from .models.resources import ResourceSchema
+
+
+COMBAT = "combat"
+
+
+@dataclass(frozen=True)
+class DropSource:
+    """A monster or a resource yielding an item.
+
+    `skill` is the skill whose `level` is required: the gathering skill of a resource, or `combat` (the
+    character level) for a monster. An action (a fight or a gathering) drops the item once in `rate` times,
+    between `min_quantity` and `max_quantity` of it.
+    """
+
+    kind: str
+    code: str
+    item: str
+    skill: str
+    level: int
+    rate: int
+    min_quantity: int
+    max_quantity: int
+
+    @property
+    def expected_quantity(
+        self,
+    ) -> float:
+        """Return the quantity of the item expected per action."""
+        return (self.min_quantity + self.max_quantity) / 2 / self.rate
+
+    def expected_actions(
+        self,
+        quantity: int,
+    ) -> float:
+        """Return the number of actions expected to obtain a quantity of the item."""
+        return quantity / self.expected_quantity
+
+
+class DropIndex:
+    """Inverted index from an item code to the monsters and resources dropping it.
+
+    The sources of an item are sorted by decreasing expected quantity per action, then by level, so that
+    sourcing decisions are made from memory instead of `get_all_monsters(drop=...)` and
+    `get_all_resources(drop=...)` calls.
+    """
+
+    def __init__(
+        self,
+        monsters: Iterable[MonsterSchema] = (),
+        resources: Iterable[ResourceSchema] = (),
+    ) -> None:
+        """Init."""
+        self.sources: Dict[str, List[DropSource]] = {}
+        for monster in monsters:
+            self._add("monster", monster.code, COMBAT, monster.level, monster.drops)
+        for resource in resources:
+            self._add("resource", resource.code, resource.skill, resource.level, resource.drops)
+
+        for sources in self.sources.values():
+            sources.sort(key=lambda source: (-source.expected_quantity, source.level, source.code))
+
+    def _add(
+        self,
+        kind: str,
+        code: str,
+        skill: str,
+        level: int,
+        drops: Iterable,
+    ) -> None:
+        """Index the drops of a monster or a resource."""
+        for drop in drops:
+            source = DropSource(
+                kind=kind,
+                code=code,
+                item=drop.code,
+                skill=skill,
+                level=level,
+                rate=drop.rate,
+                min_quantity=drop.min_quantity,
+                max_quantity=drop.max_quantity,
+            )
+            self.sources.setdefault(drop.code, []).append(source)
+
+    def sources_of(
+        self,
+        item: str,
+        kind: Optional[str] = None,
+        levels: Optional[Mapping[str, int]] = None,
+    ) -> List[DropSource]:
+        """Return the sources of an item, best first.
+
+        `kind` keeps the monsters or the resources only; `levels` (skill name, or `combat`, to level) keeps the
+        sources whose required level is reached.
+        """
+        return [
+            source
+            for source in self.sources.get(item, ())
+            if (kind is None or source.kind == kind) and (levels is None or levels.get(source.skill, 0) >= source.level)
+        ]
+
+    def best_source(
+        self,
+        item: str,
+        kind: Optional[str] = None,
+        levels: Optional[Mapping[str, int]] = None,
+    ) -> Optional[DropSource]:
+        """Return the source of an item with the highest expected quantity per action, or None."""
+        sources = self.sources_of(item, kind, levels)
+
+        return sources[0] if sources else None
+
+    def __contains__(
+        self,
+        item: object,
+    ) -> bool:
+        """Return whether an item is dropped by a monster or a resource."""
+        return item in self.sources
+
+
+def character_levels(
+    character: CharacterSchema,
+) -> Dict[str, int]:
+    """Return the levels of a character by skill, `combat` being the character level."""
+    levels = {COMBAT: character.level}
+    for name in type(character).model_fields:
+        if name.endswith("_level"):
+            levels[name[: -len("_level")]] = getattr(character, name)
+
+    return levels
@@ -1,8 +1,10 @@
 """Init Events."""
 
+from .async_events import AsyncEvents
 from .events import Events
 
 
 __all__ = [
+    "AsyncEvents",
     "Events",
 ]
@@ -0,0 +1,49 @@
+"""Async Events."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.events import (
+    ActiveEventSchema,
+    ListActiveEventResponseSchema,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncEvents(AsyncBaseApi):
+    """Async Events."""
+
+    async def get_all_events(
+        self,
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListActiveEventResponseSchema]:
+        """Fetch events details."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+
+        return await self._request(
+            method="GET",
+            path=f"/events?{parameters}",
+            schema=ListActiveEventResponseSchema,
+            message="Successfully fetched events details.",
+            errors={
+                404: "Events not found..",
+            },
+        )
+
+    def iter_events(
+        self,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[ActiveEventSchema]:
+        """Iterate over the events of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_events(
+                page=page,
+                size=size,
+            ),
+            "events",
+        )
@@ -1,52 +1,49 @@
 """Events."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
 from ..models.events import (
-    ListActiveEventResponseSchema
+    ActiveEventSchema,
+    ListActiveEventResponseSchema,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Events:
+class Events(BaseApi):
     """Events."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_all_events(
         self,
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListActiveEventResponseSchema | None]:
+    ) -> Result[ListActiveEventResponseSchema]:
         """Fetch events details."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-
-            response = self.session.get(
-                url=f"{self.api_url}/events?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched events details.",
-                ListActiveEventResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Events not found..", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+
+        return self._request(
+            method="GET",
+            path=f"/events?{parameters}",
+            schema=ListActiveEventResponseSchema,
+            message="Successfully fetched events details.",
+            errors={
+                404: "Events not found..",
+            },
+        )
+
+    def iter_events(
+        self,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[ActiveEventSchema]:
+        """Iterate over the events of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_events(
+                page=page,
+                size=size,
+            ),
+            "events",
+        )
@@ -0,0 +1,13 @@
+"""Exceptions."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """The deadline of a call ran out before it could complete, retries included."""
+
+
+class PageError(Exception):
+    """A page of a collection could not be fetched."""
+
+
+class RecipeCycleError(Exception):
+    """Recipes depend on each other, so their items cannot be crafted."""
@@ -0,0 +1,159 @@
+"""Offline estimation of the fights."""
+
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence, Tuple
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+ELEMENTS = ("fire", "earth", "water", "air")
+
+MAX_TURNS = 100
+
+SECONDS_PER_TURN = 2.0
+
+CHARACTER_STATS = (
+    "hp",
+    "haste",
+    "critical_strike",
+    *(f"attack_{element}" for element in ELEMENTS),
+    *(f"dmg_{element}" for element in ELEMENTS),
+    *(f"res_{element}" for element in ELEMENTS),
+)
+
+MONSTER_STATS = (
+    "hp",
+    *(f"attack_{element}" for element in ELEMENTS),
+    *(f"res_{element}" for element in ELEMENTS),
+)
+
+
+@dataclass
+class FightOutcomes:
+    """Expected outcomes of the fights of characters (rows) against monsters (columns), as NumPy arrays.
+
+    - `wins`: whether the character is expected to win.
+    - `turns`: turns of the fight, both sides included.
+    - `hp_left`: HP of the character at the end of the fight (0 on a loss).
+    - `seconds`: cooldown of the fight.
+    - `character_damage` and `monster_damage`: expected damage of a turn of each side.
+    """
+
+    wins: Any
+    turns: Any
+    hp_left: Any
+    seconds: Any
+    character_damage: Any
+    monster_damage: Any
+
+
+def stats_array(
+    entities: Sequence[Any],
+    names: Sequence[str],
+) -> Any:
+    """Return the (entities, names) array of the stats of models or mappings."""
+    return np.array(
+        [
+            [entity[name] if isinstance(entity, Mapping) else getattr(entity, name) for name in names]
+            for entity in entities
+        ],
+        dtype=np.float64,
+    ).reshape(len(entities), len(names))
+
+
+def estimate_fights(
+    characters: Sequence[Any],
+    monsters: Sequence[Any],
+    max_turns: int = MAX_TURNS,
+) -> FightOutcomes:
+    """Estimate the fights of every character against every monster at once.
+
+    Characters and monsters are `CharacterSchema` and `MonsterSchema` (or mappings of their stats, e.g. to try
+    another equipment). The character strikes first, then the sides alternate. Every turn, each element of the
+    attacker hits with its attack raised by its damage bonus and lowered by the defender's resistance. It is
+    blocked with a probability of resistance / 10 %, and the character's hits are critical (x1.5) with a
+    probability of `critical_strike` %. The estimate uses the expected damage of a turn. The side that needs
+    fewer turns wins, and a fight lasting more than `max_turns` turns is lost.
+    Requires NumPy (`pip install artifactsmmo-sdk[numpy]`).
+    """
+    if np is None:
+        raise ImportError("The fight estimation requires the numpy package.")
+
+    return estimate_fights_from_stats(
+        stats_array(characters, CHARACTER_STATS),
+        stats_array(monsters, MONSTER_STATS),
+        max_turns,
+    )
+
+
+def estimate_fights_from_stats(
+    character: Any,
+    monster: Any,
+    max_turns: int = MAX_TURNS,
+) -> FightOutcomes:
+    """Estimate the fights from the (characters, `CHARACTER_STATS`) and (monsters, `MONSTER_STATS`) arrays."""
+    character_damage, monster_damage = _turn_damage(character, monster)
+    character_hp = _column(character, CHARACTER_STATS, "hp")[:, None]
+    with np.errstate(divide="ignore"):
+        character_hits = np.ceil(_column(monster, MONSTER_STATS, "hp")[None, :] / np.maximum(character_damage, 0))
+        monster_hits = np.ceil(character_hp / np.maximum(monster_damage, 0))
+
+    # The character strikes on the odd turns, the monster on the even ones.
+    win_turn = 2 * character_hits - 1
+    lose_turn = 2 * monster_hits
+    wins = (win_turn < lose_turn) & (win_turn <= max_turns)
+    turns = np.minimum(np.where(wins, win_turn, lose_turn), max_turns).astype(np.int64)
+    monster_blows = np.where(wins, character_hits - 1, 0)
+
+    return FightOutcomes(
+        wins=wins,
+        turns=turns,
+        hp_left=np.where(wins, np.maximum(character_hp - monster_damage * monster_blows, 0), 0),
+        seconds=SECONDS_PER_TURN * turns * (1 - _column(character, CHARACTER_STATS, "haste")[:, None] / 100),
+        character_damage=character_damage,
+        monster_damage=monster_damage,
+    )
+
+
+def _turn_damage(
+    character: Any,
+    monster: Any,
+) -> Tuple[Any, Any]:
+    """Return the (characters, monsters) arrays of the expected damage of a turn of each side."""
+    # (characters, monsters, elements) arrays.
+    character_attack = _block(character, CHARACTER_STATS, "attack")[:, None, :]
+    character_bonus = 1 + _block(character, CHARACTER_STATS, "dmg")[:, None, :] / 100
+    character_res = _block(character, CHARACTER_STATS, "res")[:, None, :]
+    monster_attack = _block(monster, MONSTER_STATS, "attack")[None, :, :]
+    monster_res = _block(monster, MONSTER_STATS, "res")[None, :, :]
+
+    critical = 1 + 0.5 * _column(character, CHARACTER_STATS, "critical_strike")[:, None] / 100
+    character_damage = (
+        character_attack * character_bonus * (1 - monster_res / 100) * (1 - monster_res / 1000)
+    ).sum(axis=2) * critical
+    monster_damage = (monster_attack * (1 - character_res / 100) * (1 - character_res / 1000)).sum(axis=2)
+
+    return character_damage, monster_damage
+
+
+def _column(
+    stats: Any,
+    names: Sequence[str],
+    name: str,
+) -> Any:
+    """Return the column of a stat."""
+    return stats[:, names.index(name)]
+
+
+def _block(
+    stats: Any,
+    names: Sequence[str],
+    prefix: str,
+) -> Any:
+    """Return the (entities, elements) columns of the elemental stats with a prefix."""
+    start = names.index(f"{prefix}_{ELEMENTS[0]}")
+    return stats[:, start: start + len(ELEMENTS)]
@@ -0,0 +1,469 @@
+"""Choice of the equipment of a character."""
+
+import itertools
+import math
+
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .craft_planner import item_counts
+from .drops import character_levels
+from .fights import CHARACTER_STATS, MONSTER_STATS, estimate_fights_from_stats, stats_array
+from .models.actions import ItemSchema
+from .models.characters import CharacterSchema
+from .recipes import RecipeGraph
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+GATHERING_SKILLS = ("mining", "woodcutting", "fishing")
+
+STATS = (*CHARACTER_STATS, *GATHERING_SKILLS)
+
+# Slots filled from the same candidates, e.g. both rings.
+SLOT_GROUPS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("weapon", ("weapon",)),
+    ("shield", ("shield",)),
+    ("helmet", ("helmet",)),
+    ("body_armor", ("body_armor",)),
+    ("leg_armor", ("leg_armor",)),
+    ("boots", ("boots",)),
+    ("ring", ("ring1", "ring2")),
+    ("amulet", ("amulet",)),
+    ("artifact", ("artifact1", "artifact2", "artifact3")),
+)
+
+
+@dataclass(frozen=True)
+class GearCall:
+    """An `Actions.equip_item` call (`code` into `slot`) or an `Actions.unequip_item` call (`code` out of `slot`)."""
+
+    action: str
+    slot: str
+    code: str = ""
+
+
+@dataclass
+class Loadout:
+    """Best equipment found, by slot (empty string for an empty slot), and the calls to put it on.
+
+    `sources` tells where each newly equipped item comes from: `inventory`, `bank` (withdraw it first),
+    `craft` (craft it first) or `equipped` (moved from another slot). `score` is the expected fight outcome
+    (`wins`, `turns`, `hp_left`) for a monster, or the gathering cooldown effect for a skill.
+    """
+
+    equipment: Dict[str, str] = field(default_factory=dict)
+    calls: List[GearCall] = field(default_factory=list)
+    sources: Dict[str, str] = field(default_factory=dict)
+    score: Dict[str, float] = field(default_factory=dict)
+
+
+class GearOptimizer:
+    """Pick the best equipment of a character against a monster, or for a gathering skill.
+
+    The candidates of each slot group are the items of its type, within the character level, held in the
+    inventory, the bank or the equipment, or craftable at the character's skill levels when `recipes` is
+    given. Candidates whose relevant stats are matched by as many other candidates as the group has slots are
+    dropped (dominance). The loadouts are then extended slot by slot, each combination of a group built once,
+    and scored at once with the fight estimator; whenever extending them would make more than `max_loadouts`,
+    only the `beam_width` best partial loadouts are extended (beam search), so that the product of the slot
+    options is never built. Equal outcomes go to the loadout with more of the relevant stats, then to the one
+    closest to the current equipment, so that the fewest calls are needed. The consumable slots are left as they
+    are: their effects are used up during the fights, which the fight estimator does not model.
+    Requires NumPy (`pip install artifactsmmo-sdk[numpy]`).
+    """
+
+    def __init__(
+        self,
+        items: Iterable[ItemSchema],
+        recipes: Optional[RecipeGraph] = None,
+        max_loadouts: int = 50_000,
+        beam_width: int = 256,
+    ) -> None:
+        """Init."""
+        if np is None:
+            raise ImportError("The gear optimizer requires the numpy package.")
+
+        self.items: Dict[str, ItemSchema] = {item.code: item for item in items}
+        self.recipes = recipes
+        self.max_loadouts = max_loadouts
+        self.beam_width = beam_width
+        # Gathering effects are cooldown reductions: the lower, the better.
+        self.sign = np.where(np.isin(STATS, GATHERING_SKILLS), -1, 1)
+        self.effects = {code: self._effects(item) for code, item in self.items.items()}
+
+    def _effects(
+        self,
+        item: ItemSchema,
+    ) -> Any:
+        """Return the stats vector of the effects of an item."""
+        vector = np.zeros(len(STATS))
+        for effect in item.effects:
+            if effect.name in STATS:
+                vector[STATS.index(effect.name)] += effect.value
+
+        return vector
+
+    def _available(
+        self,
+        character: CharacterSchema,
+        inventory: Mapping[str, int],
+        bank: Mapping[str, int],
+    ) -> Dict[str, Tuple[float, str]]:
+        """Return the count and the source of every item the character can equip."""
+        available: Dict[str, Tuple[float, str]] = {}
+        levels = character_levels(character)
+        for code, item in self.items.items():
+            if item.level > character.level:
+                continue
+
+            recipe = self.recipes.recipe(code) if self.recipes else None
+            if code in inventory:
+                available[code] = (inventory[code], "inventory")
+            elif code in bank:
+                available[code] = (bank[code], "bank")
+            elif recipe is not None and levels.get(recipe.skill, 0) >= recipe.level:
+                available[code] = (math.inf, "craft")
+
+        for _, slots in SLOT_GROUPS:
+            for slot in slots:
+                code = getattr(character, f"{slot}_slot")
+                if code in self.items:
+                    count, source = available.get(code, (0, "equipped"))
+                    available[code] = (count + 1, source)
+
+        return available
+
+    def optimize(
+        self,
+        character: CharacterSchema,
+        monster: Optional[Any] = None,
+        skill: Optional[str] = None,
+        inventory: Optional[Mapping[str, int] | Iterable[Any]] = None,
+        bank: Mapping[str, int] | Iterable[Any] = (),
+    ) -> Loadout:
+        """Return the best loadout of a character against a `monster`, or for a gathering `skill`.
+
+        `inventory` defaults to the character's inventory; `bank` holds item counts or the slots of
+        `Account.get_bank_items`.
+        """
+        if (monster is None) == (skill is None):
+            raise ValueError("Give either a monster or a gathering skill.")
+
+        held = item_counts(character.inventory if inventory is None else inventory)
+        available = self._available(character, held, item_counts(bank))
+        current = {slot: getattr(character, f"{slot}_slot") for _, slots in SLOT_GROUPS for slot in slots}
+        beam, groups = self._search(character, available, current, monster, skill)
+
+        best = int(self._rank(beam.totals, beam.unchanged, monster, skill)[0])
+        equipment = _equipment(beam.picks[best], groups, current)
+
+        return Loadout(
+            equipment=equipment,
+            calls=_calls(current, equipment),
+            sources={
+                code: available[code][1]
+                for slot, code in equipment.items()
+                if code and code != current[slot]
+            },
+            score=self._score(beam.totals[best: best + 1], monster, skill),
+        )
+
+    def _search(
+        self,
+        character: CharacterSchema,
+        available: Dict[str, Tuple[float, str]],
+        current: Dict[str, str],
+        monster: Optional[Any],
+        skill: Optional[str],
+    ) -> Tuple["_Beam", List["_Group"]]:
+        """Return the loadouts left once every slot is filled, with the slots and the candidates of each group."""
+        relevant = self._relevant(monster, skill)
+        groups: List[_Group] = [
+            (slots, codes, *self._arrays(group, codes, available))
+            for group, slots in SLOT_GROUPS
+            for codes in [self._candidates(group, len(slots), available, relevant, current)]
+        ]
+
+        rank = partial(self._rank, monster=monster, skill=skill)
+        beam = _Beam(
+            totals=self._base(character, current)[None, :],
+            unchanged=np.zeros(1),
+            picks=np.zeros((1, 0), dtype=np.int64),
+            last=np.zeros(1, dtype=np.int64),
+            run=np.zeros(1, dtype=np.int64),
+        )
+        for group in groups:
+            beam = self._extend(beam, group, rank, current)
+
+        return beam, groups
+
+    def _base(
+        self,
+        character: CharacterSchema,
+        current: Dict[str, str],
+    ) -> Any:
+        """Return the stats of a character without its equipment."""
+        base = np.concatenate([stats_array([character], CHARACTER_STATS)[0], np.zeros(len(GATHERING_SKILLS))])
+        for code in current.values():
+            if code in self.effects:
+                base = base - self.effects[code]
+
+        return base
+
+    def _arrays(
+        self,
+        group: str,
+        codes: List[str],
+        available: Dict[str, Tuple[float, str]],
+    ) -> Tuple[Any, Any]:
+        """Return the stats vectors and the counts of the candidates of a group, followed by an empty slot."""
+        vectors = np.array([self.effects[code] for code in codes] + [np.zeros(len(STATS))])
+        counts = np.array([available[code][0] for code in codes] + [math.inf])
+        if group == "artifact":
+            counts[:-1] = np.minimum(counts[:-1], 1)
+
+        return vectors, counts
+
+    def _relevant(
+        self,
+        monster: Optional[Any],
+        skill: Optional[str],
+    ) -> Any:
+        """Return the mask of the stats that matter for the target."""
+        if skill is not None:
+            return np.array([name == skill for name in STATS])
+
+        # A resistance only matters against an element the monster attacks with.
+        attacks = dict(zip(MONSTER_STATS, stats_array([monster], MONSTER_STATS)[0]))
+        return np.array(
+            [
+                name in CHARACTER_STATS and (not name.startswith("res_") or attacks[f"attack_{name[4:]}"] > 0)
+                for name in STATS
+            ]
+        )
+
+    def _candidates(
+        self,
+        group: str,
+        size: int,
+        available: Dict[str, Tuple[float, str]],
+        relevant: Any,
+        current: Dict[str, str],
+    ) -> List[str]:
+        """Return the items of a slot group that as many other items as the group has slots do not dominate."""
+        equipped = set(current.values())
+        codes = sorted(
+            (code for code in available if self.items[code].type == group),
+            key=lambda code: (code in equipped, code),
+        )
+        if not codes:
+            return []
+
+        vectors = np.array([self.effects[code] * self.sign for code in codes])[:, relevant]
+
+        # Item i (row) dominates item j (column) when at least as good, and better or later (the equipped items
+        # come last, so that one of equal items is kept, preferably the equipped one). Copies count.
+        order = np.arange(len(codes))
+        dominates = (vectors[:, None, :] >= vectors[None, :, :]).all(axis=2) & (
+            (vectors[:, None, :] > vectors[None, :, :]).any(axis=2) | (order[:, None] > order[None, :])
+        )
+        copies = np.minimum([available[code][0] for code in codes], size)
+
+        return [code for code, matched in zip(codes, copies @ dominates) if matched < size]
+
+    def _extend(
+        self,
+        beam: "_Beam",
+        group: "_Group",
+        rank: Callable[[Any, Any], Any],
+        current: Dict[str, str],
+    ) -> "_Beam":
+        """Fill the slots of a group in the partial loadouts with every combination of its candidates."""
+        slots, codes, vectors, counts = group
+        beam = replace(beam, last=np.zeros_like(beam.last), run=np.zeros_like(beam.run))
+        for position in range(len(slots)):
+            rows, picked = np.nonzero(_allowed(beam, position, counts))
+            if len(rows) > self.max_loadouts:
+                rows, picked = self._prune(beam, rows, picked, vectors, rank)
+
+            beam = _Beam(
+                totals=beam.totals[rows] + vectors[picked],
+                unchanged=beam.unchanged[rows],
+                picks=np.column_stack([beam.picks[rows], picked]),
+                last=picked,
+                run=np.where(picked == beam.last[rows], beam.run[rows] + 1, 1),
+            )
+
+        return replace(beam, unchanged=beam.unchanged + _unchanged(beam.picks[:, -len(slots):], slots, codes, current))
+
+    def _prune(
+        self,
+        beam: "_Beam",
+        rows: Any,
+        picked: Any,
+        vectors: Any,
+        rank: Callable[[Any, Any], Any],
+    ) -> Tuple[Any, Any]:
+        """Return the `beam_width` best extensions of the partial loadouts, ranked `max_loadouts` at a time."""
+        best_rows, best_picked = rows[:0], picked[:0]
+        for start in range(0, len(rows), self.max_loadouts):
+            chunk_rows = np.concatenate([best_rows, rows[start: start + self.max_loadouts]])
+            chunk_picked = np.concatenate([best_picked, picked[start: start + self.max_loadouts]])
+            order = rank(beam.totals[chunk_rows] + vectors[chunk_picked], beam.unchanged[chunk_rows])
+            best_rows, best_picked = chunk_rows[order[: self.beam_width]], chunk_picked[order[: self.beam_width]]
+
+        return best_rows, best_picked
+
+    def _rank(
+        self,
+        totals: Any,
+        unchanged: Any,
+        monster: Optional[Any],
+        skill: Optional[str],
+    ) -> Any:
+        """Return the indexes of the loadouts, best first."""
+        if skill is not None:
+            return np.lexsort((-unchanged, totals[:, STATS.index(skill)]))
+
+        # Wins are best when short, losses when long (closest to a win); equal outcomes with more of the relevant
+        # stats, so that a dominated loadout never wins a tie.
+        outcomes = self._fights(totals, monster)
+        wins, turns = outcomes.wins[:, 0], outcomes.turns[:, 0]
+        stats = totals[:, self._relevant(monster, skill)].sum(axis=1)
+        return np.lexsort((-unchanged, -stats, -outcomes.hp_left[:, 0], np.where(wins, turns, -turns), ~wins))
+
+    def _fights(
+        self,
+        totals: Any,
+        monster: Any,
+    ) -> Any:
+        """Return the fight outcomes of loadouts against the monster."""
+        return estimate_fights_from_stats(totals[:, : len(CHARACTER_STATS)], stats_array([monster], MONSTER_STATS))
+
+    def _score(
+        self,
+        totals: Any,
+        monster: Optional[Any],
+        skill: Optional[str],
+    ) -> Dict[str, float]:
+        """Return the score of a loadout."""
+        if skill is not None:
+            return {skill: float(totals[0, STATS.index(skill)])}
+
+        outcomes = self._fights(totals, monster)
+        return {
+            "wins": float(outcomes.wins[0, 0]),
+            "turns": float(outcomes.turns[0, 0]),
+            "hp_left": float(outcomes.hp_left[0, 0]),
+        }
+
+
+# Slots of a group, its candidates, their stats vectors and their counts (an empty slot last).
+_Group = Tuple[Sequence[str], List[str], Any, Any]
+
+
+@dataclass
+class _Beam:
+    """Partial loadouts: their stats, their slots left as they are and the candidate picked in each slot so far.
+
+    `last` is the candidate picked last in the group being filled and `run` the times it was picked in a row.
+    """
+
+    totals: Any
+    unchanged: Any
+    picks: Any
+    last: Any
+    run: Any
+
+
+def _allowed(
+    beam: _Beam,
+    position: int,
+    counts: Any,
+) -> Any:
+    """Return the candidates (columns, the last one for an empty slot) each partial loadout (rows) may pick next.
+
+    The candidates of a group are picked in order, so that each combination is built once, and no more times
+    than there are `counts` of them.
+    """
+    if not position:
+        return np.ones((len(beam.last), len(counts)), dtype=bool)
+
+    choices = np.arange(len(counts))
+    same = choices[None, :] == beam.last[:, None]
+
+    return (choices[None, :] >= beam.last[:, None]) & (~same | (beam.run[:, None] < counts[None, :]))
+
+
+def _unchanged(
+    picks: Any,
+    slots: Sequence[str],
+    codes: List[str],
+    current: Dict[str, str],
+) -> Any:
+    """Return the number of slots of a group each loadout leaves as they are, from its picks in the group."""
+    options, inverse = np.unique(picks, axis=0, return_inverse=True)
+    kept = [_kept(tuple(codes[i] for i in option if i < len(codes)), slots, current) for option in options]
+
+    return np.array(kept)[inverse.reshape(-1)]
+
+
+def _equipment(
+    picks: Any,
+    groups: List[_Group],
+    current: Dict[str, str],
+) -> Dict[str, str]:
+    """Return the equipment of a loadout, by slot, from its picks in every group."""
+    remaining = iter(picks.tolist())
+    equipment: Dict[str, str] = {}
+    for slots, codes, *_ in groups:
+        option = tuple(codes[i] for i in itertools.islice(remaining, len(slots)) if i < len(codes))
+        equipment.update(_assign(option, slots, current))
+
+    return equipment
+
+
+def _kept(
+    option: Tuple[str, ...],
+    slots: Sequence[str],
+    current: Dict[str, str],
+) -> int:
+    """Return the number of slots of a group left as they are when equipping a combination of items."""
+    return sum(current[slot] == code for slot, code in _assign(option, slots, current).items())
+
+
+def _assign(
+    option: Tuple[str, ...],
+    slots: Sequence[str],
+    current: Dict[str, str],
+) -> Dict[str, str]:
+    """Spread a combination of items over the slots of a group, keeping the items already in place."""
+    remaining = list(option)
+    assignment: Dict[str, str] = {}
+    for slot in slots:
+        if current[slot] in remaining:
+            assignment[slot] = current[slot]
+            remaining.remove(current[slot])
+    for slot in slots:
+        if slot not in assignment:
+            assignment[slot] = remaining.pop(0) if remaining else ""
+
+    return assignment
+
+
+def _calls(
+    current: Dict[str, str],
+    equipment: Dict[str, str],
+) -> List[GearCall]:
+    """Return the unequip calls then the equip calls turning an equipment into another."""
+    changed = [slot for slot in equipment if equipment[slot] != current[slot]]
+
+    return [GearCall("unequip", slot, current[slot]) for slot in changed if current[slot]] + [
+        GearCall("equip", slot, equipment[slot]) for slot in changed if equipment[slot]
+    ]
@@ -1,8 +1,10 @@
 """Init Grand Excahnge."""
 
+from .async_grand_exchange import AsyncGrandExchange
 from .grand_exchange import GrandExchange
 
 
 __all__ = [
+    "AsyncGrandExchange",
     "GrandExchange",
 ]
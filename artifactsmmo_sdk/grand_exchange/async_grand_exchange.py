@@ -0,0 +1,65 @@
+"""Async Grand Exchange."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.grand_exchange import (
+    GEItemResponseSchema,
+    GEItemSchema,
+    ListActiveEventResponseSchema,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncGrandExchange(AsyncBaseApi):
+    """Async Grand Exchange."""
+
+    async def get_ge_item(
+        self,
+        code: Annotated[str, Field(description="The code of the item.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[GEItemResponseSchema]:
+        """Retrieve the details of a Grand Exchange item.."""
+        return await self._request(
+            method="GET",
+            path=f"/ge/{code}",
+            schema=GEItemResponseSchema,
+            message="Successfully fetched Grand Exchange item.",
+            errors={
+                404: "Item not found.",
+            },
+        )
+
+    async def get_all_ge_item(
+        self,
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListActiveEventResponseSchema]:
+        """Fetch Grand Exchange items details."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+
+        return await self._request(
+            method="GET",
+            path=f"/ge?{parameters}",
+            schema=ListActiveEventResponseSchema,
+            message="Fetch Grand Exchange items details.",
+            errors={
+                404: "Item not found.",
+            },
+        )
+
+    def iter_ge_items(
+        self,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[GEItemSchema]:
+        """Iterate over the Grand Exchange items of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_ge_item(
+                page=page,
+                size=size,
+            ),
+            "Grand Exchange items",
+        )
@@ -1,77 +1,65 @@
 """Grand Exchange."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
 from ..models.grand_exchange import (
     GEItemResponseSchema,
+    GEItemSchema,
     ListActiveEventResponseSchema,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class GrandExchange:
+class GrandExchange(BaseApi):
     """Grand Excahnge."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_ge_item(
         self,
         code: Annotated[str, Field(description="The code of the item.", pattern="^[a-zA-Z0-9_-]+$")],
-    ) -> Tuple[str, GEItemResponseSchema | None]:
+    ) -> Result[GEItemResponseSchema]:
         """Retrieve the details of a Grand Exchange item.."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/ge/{code}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched Grand Exchange item.",
-                GEItemResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Item not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/ge/{code}",
+            schema=GEItemResponseSchema,
+            message="Successfully fetched Grand Exchange item.",
+            errors={
+                404: "Item not found.",
+            },
+        )
 
     def get_all_ge_item(
         self,
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListActiveEventResponseSchema | None]:
+    ) -> Result[ListActiveEventResponseSchema]:
         """Fetch Grand Exchange items details."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-
-            response = self.session.get(
-                url=f"{self.api_url}/ge?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Fetch Grand Exchange items details.",
-                ListActiveEventResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Item not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+
+        return self._request(
+            method="GET",
+            path=f"/ge?{parameters}",
+            schema=ListActiveEventResponseSchema,
+            message="Fetch Grand Exchange items details.",
+            errors={
+                404: "Item not found.",
+            },
+        )
+
+    def iter_ge_items(
+        self,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[GEItemSchema]:
+        """Iterate over the Grand Exchange items of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_ge_item(
+                page=page,
+                size=size,
+            ),
+            "Grand Exchange items",
+        )
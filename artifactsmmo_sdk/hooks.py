@@ -0,0 +1,328 @@
+"""Instrumentation hooks and metrics collector."""
+
+import bisect
+import re
+import threading
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+ENDPOINTS = (
+    (re.compile(r"^/my/[^/]+/action/"), "/my/{name}/action/"),
+    (re.compile(r"^/characters/(?!create$|delete$)[^/]+$"), "/characters/{name}"),
+    (re.compile(r"^/(items|monsters|resources|ge)/[^/]+$"), r"/\1/{code}"),
+    (re.compile(r"^/maps/-?\d+/-?\d+$"), "/maps/{x}/{y}"),
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def endpoint(
+    method: str,
+    path: str,
+) -> str:
+    """Return the endpoint of a request, e.g. `POST /my/{name}/action/fight` for `POST /my/billy1/action/fight`."""
+    path = path.split("?", 1)[0]
+    for pattern, template in ENDPOINTS:
+        path = pattern.sub(template, path, count=1)
+
+    return f"{method.upper()} {path}"
+
+
+@dataclass
+class Call:
+    """A sub-client call, filled in as it progresses.
+
+    `network_seconds` is the time spent in the session (rate limiting, retries and transfers included),
+    `validation_seconds` the time spent validating the response body.
+    """
+
+    method: str
+    path: str
+    endpoint: str
+    started_at: float = field(default_factory=time.perf_counter)
+    status_code: Optional[int] = None
+    network_seconds: float = 0
+    validation_seconds: float = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+
+BeforeRequest = Callable[[Call], None]
+AfterResponse = Callable[[Call], None]
+OnError = Callable[[Call, BaseException], None]
+
+
+class Hooks:
+    """Callbacks run around every sub-client call.
+
+    - `before_request(call)`: before the request is sent.
+    - `after_response(call)`: once a response is received and, on success, validated. Runs for the error
+      statuses too (`call.status_code` >= 400).
+    - `on_error(call, error)`: when no response could be used: timeout, connection or validation error.
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+        """Init."""
+        self.before_request: List[BeforeRequest] = []
+        self.after_response: List[AfterResponse] = []
+        self.on_error: List[OnError] = []
+
+    def __bool__(
+        self,
+    ) -> bool:
+        """Return whether any callback is registered."""
+        return bool(self.before_request or self.after_response or self.on_error)
+
+    def add(
+        self,
+        before_request: Optional[BeforeRequest] = None,
+        after_response: Optional[AfterResponse] = None,
+        on_error: Optional[OnError] = None,
+    ) -> None:
+        """Register callbacks."""
+        if before_request:
+            self.before_request.append(before_request)
+        if after_response:
+            self.after_response.append(after_response)
+        if on_error:
+            self.on_error.append(on_error)
+
+    def add_collector(
+        self,
+        collector: Optional["MetricsCollector"] = None,
+    ) -> "MetricsCollector":
+        """Register a metrics collector (a new one by default) and return it."""
+        collector = collector or MetricsCollector()
+        self.add(after_response=collector.after_response, on_error=collector.on_error)
+
+        return collector
+
+    def start(
+        self,
+        method: str,
+        path: str,
+    ) -> Call:
+        """Start a call and run the `before_request` callbacks."""
+        call = Call(method=method, path=path, endpoint=endpoint(method, path))
+        for callback in self.before_request:
+            callback(call)
+
+        return call
+
+    def received(
+        self,
+        call: Call,
+        status_code: int,
+        request_body: Any,
+        response_body: bytes,
+    ) -> None:
+        """Record the response of a call."""
+        call.network_seconds = time.perf_counter() - call.started_at
+        call.status_code = status_code
+        call.request_bytes = len(request_body or b"")
+        call.response_bytes = len(response_body)
+
+    def finish(
+        self,
+        call: Call,
+    ) -> None:
+        """Record the validation time and run the `after_response` callbacks."""
+        call.validation_seconds = time.perf_counter() - call.started_at - call.network_seconds
+        for callback in self.after_response:
+            callback(call)
+
+    def fail(
+        self,
+        call: Call,
+        error: BaseException,
+    ) -> None:
+        """Run the `on_error` callbacks."""
+        if not call.network_seconds:
+            call.network_seconds = time.perf_counter() - call.started_at
+        for callback in self.on_error:
+            callback(call, error)
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, in the Prometheus style."""
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Init."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(
+        self,
+        value: float,
+    ) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(
+        self,
+        q: float,
+    ) -> float:
+        """Return the upper bound of the bucket holding the quantile `q` (0 to 1)."""
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank and count:
+                return bound
+
+        return 0.0
+
+    def snapshot(
+        self,
+    ) -> Dict[str, Any]:
+        """Return the cumulative counts per upper bound, with the count and sum."""
+        cumulative, seen = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = seen
+
+        return {"buckets": cumulative, "count": self.count, "sum": self.sum}
+
+
+class EndpointMetrics:
+    """Metrics of one endpoint."""
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Init."""
+        self.network = Histogram(buckets)
+        self.validation = Histogram(buckets)
+        self.statuses: Dict[int, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def snapshot(
+        self,
+    ) -> Dict[str, Any]:
+        """Return the metrics as plain data."""
+        return {
+            "calls": self.network.count,
+            "network_seconds": self.network.snapshot(),
+            "validation_seconds": self.validation.snapshot(),
+            "p50_seconds": self.network.quantile(0.5),
+            "p99_seconds": self.network.quantile(0.99),
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+        }
+
+
+class MetricsCollector:
+    """Per-endpoint latency histograms, status and error counters and payload sizes.
+
+    Register it with `Hooks.add_collector`; several clients may share one collector.
+    """
+
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """Init."""
+        self.buckets = buckets
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _metrics(
+        self,
+        call: Call,
+    ) -> EndpointMetrics:
+        """Return the metrics of the endpoint of a call, creating them as needed."""
+        metrics = self.endpoints.get(call.endpoint)
+        if metrics is None:
+            metrics = self.endpoints[call.endpoint] = EndpointMetrics(self.buckets)
+
+        return metrics
+
+    def after_response(
+        self,
+        call: Call,
+    ) -> None:
+        """Record a call that received a response."""
+        with self._lock:
+            metrics = self._metrics(call)
+            metrics.network.observe(call.network_seconds)
+            if call.status_code is not None and call.status_code < 400:
+                metrics.validation.observe(call.validation_seconds)
+            metrics.statuses[call.status_code or 0] = metrics.statuses.get(call.status_code or 0, 0) + 1
+            metrics.request_bytes += call.request_bytes
+            metrics.response_bytes += call.response_bytes
+
+    def on_error(
+        self,
+        call: Call,
+        error: BaseException,
+    ) -> None:
+        """Record a failed call."""
+        with self._lock:
+            metrics = self._metrics(call)
+            metrics.network.observe(call.network_seconds)
+            name = type(error).__name__
+            metrics.errors[name] = metrics.errors.get(name, 0) + 1
+
+    def snapshot(
+        self,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics of every endpoint as plain data, sorted by total network time."""
+        with self._lock:
+            endpoints = sorted(self.endpoints.items(), key=lambda item: item[1].network.sum, reverse=True)
+            return {name: metrics.snapshot() for name, metrics in endpoints}
+
+    def reset(
+        self,
+    ) -> None:
+        """Forget the recorded metrics."""
+        with self._lock:
+            self.endpoints.clear()
+
+    def export_prometheus(
+        self,
+        prefix: str = "artifactsmmo",
+    ) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+        snapshot = self.snapshot()
+        for histogram in ("network_seconds", "validation_seconds"):
+            lines.append(f"# TYPE {prefix}_{histogram} histogram")
+            for name, metrics in snapshot.items():
+                labels = f'endpoint="{name}"'
+                for bound, count in metrics[histogram]["buckets"].items():
+                    lines.append(f'{prefix}_{histogram}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{prefix}_{histogram}_sum{{{labels}}} {metrics[histogram]['sum']}")
+                lines.append(f"{prefix}_{histogram}_count{{{labels}}} {metrics[histogram]['count']}")
+
+        lines.append(f"# TYPE {prefix}_responses_total counter")
+        for name, metrics in snapshot.items():
+            for status, count in metrics["statuses"].items():
+                lines.append(f'{prefix}_responses_total{{endpoint="{name}",status="{status}"}} {count}')
+
+        lines.append(f"# TYPE {prefix}_errors_total counter")
+        for name, metrics in snapshot.items():
+            for error, count in metrics["errors"].items():
+                lines.append(f'{prefix}_errors_total{{endpoint="{name}",error="{error}"}} {count}')
+
+        for direction in ("request", "response"):
+            lines.append(f"# TYPE {prefix}_{direction}_bytes_total counter")
+            for name, metrics in snapshot.items():
+                lines.append(f'{prefix}_{direction}_bytes_total{{endpoint="{name}"}} {metrics[f"{direction}_bytes"]}')
+
+        return "\n".join(lines) + "\n"
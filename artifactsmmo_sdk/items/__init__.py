@@ -1,8 +1,10 @@
 """Init Items."""
 
+from .async_items import AsyncItems
 from .items import Items
 
 
 __all__ = [
+    "AsyncItems",
     "Items",
 ]
@@ -0,0 +1,94 @@
+"""Async Items."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.actions import ItemSchema
+from ..models.items import (
+    CraftSkillEnum,
+    ListItemsResponseSchema,
+    SingleItemResponseSchema,
+    TypeItemEnum,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncItems(AsyncBaseApi):
+    """Async Items."""
+
+    async def get_item(
+        self,
+        code: Annotated[str, Field(description="The code of the item.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[SingleItemResponseSchema]:
+        """Retrieve the details of a item."""
+        return await self._request(
+            method="GET",
+            path=f"/items/{code}",
+            schema=SingleItemResponseSchema,
+            message="Successfully fetched item.",
+            errors={
+                404: "Item not found.",
+            },
+        )
+
+    async def get_all_items(
+        self,
+        craft_material: Annotated[str, Field(
+            description="Item code of items used as material for crafting.",
+            pattern="^[a-zA-Z0-9_-]+$",
+        )],
+        craft_skill: Annotated[CraftSkillEnum | str, Field(description="Skill to craft items.")],
+        max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)],
+        min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
+        name: Annotated[str, Field(description="Name of the item.", pattern="^[a-zA-Z0-9_-]+$")],
+        type_item: Annotated[TypeItemEnum | str, Field(description="Type of items.", alias="type")],
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListItemsResponseSchema]:
+        """Fetch items details."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&type={type_item}" if type_item else ""
+        parameters += f"&craft_material={craft_material}" if craft_material else ""
+        parameters += f"&craft_skill={craft_skill}" if craft_skill else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+        parameters += f"&name={name}" if name else ""
+
+        return await self._request(
+            method="GET",
+            path=f"/items?{parameters}",
+            schema=ListItemsResponseSchema,
+            message="Fetch items details.",
+            errors={
+                404: "Monsters not found.",
+            },
+        )
+
+    def iter_items(
+        self,
+        craft_material: Annotated[str, Field(description="Item code of items used as material for crafting.")] = "",
+        craft_skill: Annotated[CraftSkillEnum | str, Field(description="Skill to craft items.")] = "",
+        max_level: Annotated[int, Field(description="Item maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Item minimum level.", ge=0)] = 0,
+        name: Annotated[str, Field(description="Name of the item.")] = "",
+        type_item: Annotated[TypeItemEnum | str, Field(description="Type of items.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[ItemSchema]:
+        """Iterate over the items of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_items(
+                craft_material=craft_material,
+                craft_skill=craft_skill,
+                max_level=max_level,
+                min_level=min_level,
+                name=name,
+                type_item=type_item,
+                page=page,
+                size=size,
+            ),
+            "items",
+        )
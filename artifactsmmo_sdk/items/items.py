@@ -1,54 +1,38 @@
 """Items."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
+from ..models.actions import ItemSchema
 from ..models.items import (
     CraftSkillEnum,
     ListItemsResponseSchema,
     SingleItemResponseSchema,
     TypeItemEnum,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Items:
+class Items(BaseApi):
     """Items."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_item(
         self,
         code: Annotated[str, Field(description="The code of the item.", pattern="^[a-zA-Z0-9_-]+$")],
-    ) -> Tuple[str, SingleItemResponseSchema | None]:
+    ) -> Result[SingleItemResponseSchema]:
         """Retrieve the details of a item."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/items/{code}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched item.",
-                SingleItemResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Item not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/items/{code}",
+            schema=SingleItemResponseSchema,
+            message="Successfully fetched item.",
+            errors={
+                404: "Item not found.",
+            },
+        )
 
     def get_all_items(
         self,
@@ -56,39 +40,55 @@ def get_all_items(
             description="Item code of items used as material for crafting.",
             pattern="^[a-zA-Z0-9_-]+$",
         )],
-        craft_skill: Annotated[CraftSkillEnum, Field(description="Skill to craft items.")],
+        craft_skill: Annotated[CraftSkillEnum | str, Field(description="Skill to craft items.")],
         max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)],
         min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
         name: Annotated[str, Field(description="Name of the item.", pattern="^[a-zA-Z0-9_-]+$")],
-        type_item: Annotated[TypeItemEnum, Field(description="Type of items.", alias="type")],
+        type_item: Annotated[TypeItemEnum | str, Field(description="Type of items.", alias="type")],
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListItemsResponseSchema | None]:
+    ) -> Result[ListItemsResponseSchema]:
         """Fetch items details."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-            parameters += f"&type={type_item}"
-            parameters += f"&craft_material={craft_material}" if craft_material else ""
-            parameters += f"&craft_skill={craft_skill}" if craft_skill else ""
-            parameters += f"&max_level={max_level}" if max_level else ""
-            parameters += f"&min_level={min_level}" if min_level else ""
-            parameters += f"&name={name}" if name else ""
-
-            response = self.session.get(
-                url=f"{self.api_url}/items?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Fetch items details.",
-                ListItemsResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Monsters not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&type={type_item}" if type_item else ""
+        parameters += f"&craft_material={craft_material}" if craft_material else ""
+        parameters += f"&craft_skill={craft_skill}" if craft_skill else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+        parameters += f"&name={name}" if name else ""
+
+        return self._request(
+            method="GET",
+            path=f"/items?{parameters}",
+            schema=ListItemsResponseSchema,
+            message="Fetch items details.",
+            errors={
+                404: "Monsters not found.",
+            },
+        )
+
+    def iter_items(
+        self,
+        craft_material: Annotated[str, Field(description="Item code of items used as material for crafting.")] = "",
+        craft_skill: Annotated[CraftSkillEnum | str, Field(description="Skill to craft items.")] = "",
+        max_level: Annotated[int, Field(description="Item maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Item minimum level.", ge=0)] = 0,
+        name: Annotated[str, Field(description="Name of the item.")] = "",
+        type_item: Annotated[TypeItemEnum | str, Field(description="Type of items.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[ItemSchema]:
+        """Iterate over the items of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_items(
+                craft_material=craft_material,
+                craft_skill=craft_skill,
+                max_level=max_level,
+                min_level=min_level,
+                name=name,
+                type_item=type_item,
+                page=page,
+                size=size,
+            ),
+            "items",
+        )
@@ -0,0 +1,202 @@
+"""Spatial index of the maps."""
+
+import heapq
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+Position = Tuple[int, int]
+
+
+def manhattan(
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+) -> int:
+    """Return the number of tiles walked between two positions."""
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+class MapIndex:
+    """In-memory grid index of the maps, for tile lookups and nearest-content queries.
+
+    Tiles are looked up by position in a dict. The tiles holding a content are bucketed, per content code and
+    per content type, into square cells of `cell_size` tiles; a nearest query visits the cells in rings around
+    the position and stops as soon as no farther ring can hold a closer tile. Distances are Manhattan distances
+    (tiles walked), and ties are broken by position so that the answers are deterministic.
+    """
+
+    def __init__(
+        self,
+        maps: Iterable[Any],
+        cell_size: int = 8,
+    ) -> None:
+        """Init."""
+        self.cell_size = cell_size
+        self.tiles: Dict[Position, Any] = {}
+        self.buckets: Dict[Tuple[str, str], Dict[Position, List[Position]]] = {}
+
+        for tile in maps:
+            self.tiles[(tile.x, tile.y)] = tile
+            if tile.content:
+                for key in (("code", tile.content.code), ("type", content_type_name(tile.content.type))):
+                    self.buckets.setdefault(key, {}).setdefault(self._cell(tile.x, tile.y), []).append((tile.x, tile.y))
+
+        cells = [self._cell(x, y) for x, y in self.tiles] or [(0, 0)]
+        self.bounds = (
+            min(cx for cx, _ in cells),
+            min(cy for _, cy in cells),
+            max(cx for cx, _ in cells),
+            max(cy for _, cy in cells),
+        )
+
+    def _cell(
+        self,
+        x: int,
+        y: int,
+    ) -> Position:
+        """Return the cell of a position."""
+        return x // self.cell_size, y // self.cell_size
+
+    def _key(
+        self,
+        code: Optional[str],
+        content_type: Optional[str],
+    ) -> Tuple[str, str]:
+        """Return the bucket key of a query."""
+        if (code is None) == (content_type is None):
+            raise ValueError("Give either a content code or a content type.")
+
+        if code is not None:
+            return "code", code
+
+        return "type", content_type_name(content_type)
+
+    def at(
+        self,
+        x: int,
+        y: int,
+    ) -> Optional[Any]:
+        """Return the tile at a position, or None."""
+        return self.tiles.get((x, y))
+
+    def positions(
+        self,
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> List[Position]:
+        """Return the positions of the tiles holding a content code or a content type."""
+        cells = self.buckets.get(self._key(code, content_type), {})
+
+        return sorted(position for positions in cells.values() for position in positions)
+
+    def _nearest(
+        self,
+        cells: Dict[Position, List[Position]],
+        x: int,
+        y: int,
+        k: int,
+    ) -> List[Tuple[int, Position]]:
+        """Return the k nearest (distance, position) of the bucket cells, nearest first."""
+        if not cells:
+            return []
+
+        cx, cy = self._cell(x, y)
+        min_cx, min_cy, max_cx, max_cy = self.bounds
+        last_ring = max(abs(cx - min_cx), abs(cx - max_cx), abs(cy - min_cy), abs(cy - max_cy))
+
+        best: List[Tuple[int, int, int]] = []  # max-heap of (-distance, -x, -y)
+        for ring in range(last_ring + 1):
+            # Every tile of a cell `ring` cells away is at least this many tiles away.
+            if len(best) == k and -best[0][0] < (ring - 1) * self.cell_size + 1:
+                break
+
+            for cell in _ring(cx, cy, ring):
+                _keep_nearest(best, cells.get(cell, ()), x, y, k)
+
+        return sorted((-distance, (-px, -py)) for distance, px, py in best)
+
+    def nearest(
+        self,
+        x: int,
+        y: int,
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+        k: int = 1,
+    ) -> List[Tuple[int, Any]]:
+        """Return the k tiles holding a content code or a content type nearest to a position, as (distance, tile)."""
+        cells = self.buckets.get(self._key(code, content_type), {})
+
+        return [(distance, self.tiles[position]) for distance, position in self._nearest(cells, x, y, k)]
+
+    def closest(
+        self,
+        x: int,
+        y: int,
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Return the tile holding a content code or a content type nearest to a position, or None."""
+        found = self.nearest(x, y, code=code, content_type=content_type)
+
+        return found[0][1] if found else None
+
+    def nearest_many(
+        self,
+        positions: Sequence[Position],
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+        k: int = 1,
+    ) -> List[List[Tuple[int, Any]]]:
+        """Answer `nearest` for many positions at once (e.g. all the characters); shared positions are searched once."""
+        cells = self.buckets.get(self._key(code, content_type), {})
+        answers: Dict[Position, List[Tuple[int, Any]]] = {}
+        for x, y in positions:
+            if (x, y) not in answers:
+                answers[(x, y)] = [
+                    (distance, self.tiles[position]) for distance, position in self._nearest(cells, x, y, k)
+                ]
+
+        return [answers[position] for position in positions]
+
+
+def content_type_name(
+    content_type: Any,
+) -> str:
+    """Return the name of a content type, given as an enum member or a string."""
+    return str(getattr(content_type, "value", content_type))
+
+
+def _keep_nearest(
+    best: List[Tuple[int, int, int]],
+    positions: Iterable[Position],
+    x: int,
+    y: int,
+    k: int,
+) -> None:
+    """Push positions into a max-heap of the (-distance, -x, -y) of the k positions nearest to (x, y)."""
+    for px, py in positions:
+        entry = (-manhattan(x, y, px, py), -px, -py)
+        if len(best) < k:
+            heapq.heappush(best, entry)
+        elif entry > best[0]:
+            heapq.heapreplace(best, entry)
+
+
+def _ring(
+    cx: int,
+    cy: int,
+    ring: int,
+) -> Iterable[Position]:
+    """Yield the cells at a Chebyshev distance `ring` of a cell."""
+    if ring == 0:
+        yield cx, cy
+        return
+
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
@@ -1,8 +1,10 @@
 """Init Maps."""
 
+from .async_maps import AsyncMaps
 from .maps import Maps
 
 
 __all__ = [
+    "AsyncMaps",
     "Maps",
 ]
@@ -0,0 +1,73 @@
+"""Async Maps."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.maps import ListMapResponseSchema, MapContentTypeSchema, MapResponseSchema, MapSchema
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncMaps(AsyncBaseApi):
+    """Async Maps."""
+
+    async def get_map(
+        self,
+        x: Annotated[int, Field(description="The position X of the map.")],
+        y: Annotated[int, Field(description="The position Y of the map.")],
+    ) -> Result[MapResponseSchema]:
+        """Retrieve the details of a map."""
+        return await self._request(
+            method="GET",
+            path=f"/maps/{x}/{y}",
+            schema=MapResponseSchema,
+            message="Successfully fetched map.",
+            errors={
+                404: "Map not found.",
+            },
+        )
+
+    async def get_all_maps(
+        self,
+        content_code: Annotated[str, Field(description="Content code on the map.", pattern="^[a-zA-Z0-9_-]+$")],
+        content_type: Annotated[MapContentTypeSchema | str, Field(
+            description="Type of content on the map.",
+            pattern="^[a-zA-Z0-9_-]+$",
+        )],
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListMapResponseSchema]:
+        """Fetch maps details."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&content_code={content_code}" if content_code else ""
+        parameters += f"&content_type={content_type}" if content_type else ""
+
+        return await self._request(
+            method="GET",
+            path=f"/maps?{parameters}",
+            schema=ListMapResponseSchema,
+            message="Successfully fetched maps details.",
+            errors={
+                404: "Maps not found.",
+            },
+        )
+
+    def iter_maps(
+        self,
+        content_code: Annotated[str, Field(description="Content code on the map.")] = "",
+        content_type: Annotated[MapContentTypeSchema | str, Field(description="Type of content on the map.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[MapSchema]:
+        """Iterate over the maps of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_maps(
+                content_code=content_code,
+                content_type=content_type,
+                page=page,
+                size=size,
+            ),
+            "maps",
+        )
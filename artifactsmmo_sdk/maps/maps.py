@@ -1,82 +1,73 @@
 """Maps."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
-from ..models.maps import ListMapResponseSchema, MapContentTypeSchema, MapResponseSchema
+from ..base import BaseApi
+from ..models.maps import ListMapResponseSchema, MapContentTypeSchema, MapResponseSchema, MapSchema
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Maps:
+class Maps(BaseApi):
     """Maps."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_map(
         self,
         x: Annotated[int, Field(description="The position X of the map.")],
         y: Annotated[int, Field(description="The position Y of the map.")],
-    ) -> Tuple[str, MapResponseSchema | None]:
+    ) -> Result[MapResponseSchema]:
         """Retrieve the details of a map."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/maps/{x}/{y}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched map.",
-                MapResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Map not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/maps/{x}/{y}",
+            schema=MapResponseSchema,
+            message="Successfully fetched map.",
+            errors={
+                404: "Map not found.",
+            },
+        )
 
     def get_all_maps(
         self,
         content_code: Annotated[str, Field(description="Content code on the map.", pattern="^[a-zA-Z0-9_-]+$")],
-        content_type: Annotated[MapContentTypeSchema, Field(
+        content_type: Annotated[MapContentTypeSchema | str, Field(
             description="Type of content on the map.",
             pattern="^[a-zA-Z0-9_-]+$",
         )],
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListMapResponseSchema | None]:
+    ) -> Result[ListMapResponseSchema]:
         """Fetch maps details."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-            parameters += f"&content_code={content_code}" if content_code else ""
-            parameters += f"&content_type={content_type}" if content_type else ""
-
-            response = self.session.get(
-                url=f"{self.api_url}/maps?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched maps details.",
-                ListMapResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Maps not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&content_code={content_code}" if content_code else ""
+        parameters += f"&content_type={content_type}" if content_type else ""
+
+        return self._request(
+            method="GET",
+            path=f"/maps?{parameters}",
+            schema=ListMapResponseSchema,
+            message="Successfully fetched maps details.",
+            errors={
+                404: "Maps not found.",
+            },
+        )
+
+    def iter_maps(
+        self,
+        content_code: Annotated[str, Field(description="Content code on the map.")] = "",
+        content_type: Annotated[MapContentTypeSchema | str, Field(description="Type of content on the map.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[MapSchema]:
+        """Iterate over the maps of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_maps(
+                content_code=content_code,
+                content_type=content_type,
+                page=page,
+                size=size,
+            ),
+            "maps",
+        )
@@ -290,7 +290,7 @@ class GoldTransactionSchema(BaseModel):
     """Gold Transaction Schema."""
 
     cooldown: CooldownSchema
-    item: ItemSchema
+    item: Optional[ItemSchema] = None
     bank: GoldSchema
     character: CharacterSchema
 
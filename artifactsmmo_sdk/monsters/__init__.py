@@ -1,8 +1,10 @@
 """Init Monsters."""
 
+from .async_monsters import AsyncMonsters
 from .monsters import Monsters
 
 
 __all__ = [
+    "AsyncMonsters",
     "Monsters",
 ]
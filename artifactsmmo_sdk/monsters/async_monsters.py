@@ -0,0 +1,73 @@
+"""Async Monsters."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.monsters import ListMonsterResponseSchema, MonsterResponseSchema, MonsterSchema
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncMonsters(AsyncBaseApi):
+    """Async Monsters."""
+
+    async def get_monster(
+        self,
+        code: Annotated[str, Field(description="The code of the monster.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[MonsterResponseSchema]:
+        """Retrieve the details of a monster."""
+        return await self._request(
+            method="GET",
+            path=f"/monsters/{code}",
+            schema=MonsterResponseSchema,
+            message="Successfully fetched monster.",
+            errors={
+                404: "Monster not found.",
+            },
+        )
+
+    async def get_all_monsters(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.", pattern="^[a-zA-Z0-9_-]+$")],
+        max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)],
+        min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListMonsterResponseSchema]:
+        """Fetch monsters details."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&drop={drop}" if drop else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+
+        return await self._request(
+            method="GET",
+            path=f"/monsters?{parameters}",
+            schema=ListMonsterResponseSchema,
+            message="Successfully fetched monsters details.",
+            errors={
+                404: "Monsters not found.",
+            },
+        )
+
+    def iter_monsters(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.")] = "",
+        max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)] = 0,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[MonsterSchema]:
+        """Iterate over the monsters of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_monsters(
+                drop=drop,
+                max_level=max_level,
+                min_level=min_level,
+                page=page,
+                size=size,
+            ),
+            "monsters",
+        )
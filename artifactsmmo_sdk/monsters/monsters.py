@@ -1,49 +1,32 @@
 """Monsters."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
-from ..models.monsters import ListMonsterResponseSchema, MonsterResponseSchema
+from ..base import BaseApi
+from ..models.monsters import ListMonsterResponseSchema, MonsterResponseSchema, MonsterSchema
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Monsters:
+class Monsters(BaseApi):
     """Monsters."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_monster(
         self,
         code: Annotated[str, Field(description="The code of the monster.", pattern="^[a-zA-Z0-9_-]+$")],
-    ) -> Tuple[str, MonsterResponseSchema | None]:
+    ) -> Result[MonsterResponseSchema]:
         """Retrieve the details of a monster."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/monsters/{code}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched monster.",
-                MonsterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Monster not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/monsters/{code}",
+            schema=MonsterResponseSchema,
+            message="Successfully fetched monster.",
+            errors={
+                404: "Monster not found.",
+            },
+        )
 
     def get_all_monsters(
         self,
@@ -52,29 +35,39 @@ def get_all_monsters(
         min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListMonsterResponseSchema | None]:
+    ) -> Result[ListMonsterResponseSchema]:
         """Fetch monsters details."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-            parameters += f"&drop={drop}" if drop else ""
-            parameters += f"&max_level={max_level}" if max_level else ""
-            parameters += f"&min_level={min_level}" if min_level else ""
-
-            response = self.session.get(
-                url=f"{self.api_url}/monsters?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched monsters details.",
-                ListMonsterResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Monsters not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&drop={drop}" if drop else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+
+        return self._request(
+            method="GET",
+            path=f"/monsters?{parameters}",
+            schema=ListMonsterResponseSchema,
+            message="Successfully fetched monsters details.",
+            errors={
+                404: "Monsters not found.",
+            },
+        )
+
+    def iter_monsters(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.")] = "",
+        max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)] = 0,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[MonsterSchema]:
+        """Iterate over the monsters of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_monsters(
+                drop=drop,
+                max_level=max_level,
+                min_level=min_level,
+                page=page,
+                size=size,
+            ),
+            "monsters",
+        )
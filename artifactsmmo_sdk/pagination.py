@@ -0,0 +1,112 @@
+"""Fetching of the paginated collections."""
+
+import asyncio
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from .exceptions import PageError
+
+
+PageFetcher = Callable[[int], Any]
+AsyncPageFetcher = Callable[[int], Awaitable[Any]]
+
+MAX_PAGE_SIZE = 100
+
+
+def check_page(
+    name: str,
+    page: int,
+    result: Any,
+) -> Any:
+    """Return the data of a fetched page, raising `PageError` when the call failed."""
+    message, data = result
+    if data is None:
+        raise PageError(f"Could not fetch page {page} of the {name}: {message}")
+
+    return data
+
+
+def fetch_all_pages(
+    fetchers: Dict[str, PageFetcher],
+    concurrency: int = 8,
+) -> Dict[str, List[Any]]:
+    """Fetch every page of several collections with at most `concurrency` requests in flight.
+
+    The first page of every collection is requested at once; as soon as one arrives, the remaining pages of
+    its collection (read from `pages`) are queued, so the total time follows the slowest collection.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        first: Dict[Future, str] = {executor.submit(fetch, 1): name for name, fetch in fetchers.items()}
+        pages: Dict[str, List[Future]] = {}
+        for future in as_completed(first):
+            name = first[future]
+            data = check_page(name, 1, future.result())
+            pages[name] = [future] + [executor.submit(fetchers[name], page) for page in range(2, data.pages + 1)]
+
+        return {
+            name: [
+                model
+                for page, future in enumerate(pages[name], start=1)
+                for model in check_page(name, page, future.result()).data
+            ]
+            for name in fetchers
+        }
+
+
+async def fetch_all_pages_async(
+    fetchers: Dict[str, AsyncPageFetcher],
+    concurrency: int = 8,
+) -> Dict[str, List[Any]]:
+    """Fetch every page of several collections with at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(name: str, page: int) -> Any:
+        async with semaphore:
+            return check_page(name, page, await fetchers[name](page))
+
+    async def fetch_collection(name: str) -> List[Any]:
+        first = await fetch(name, 1)
+        rest = await asyncio.gather(*(fetch(name, page) for page in range(2, first.pages + 1)))
+        return [model for data in (first, *rest) for model in data.data]
+
+    collections = await asyncio.gather(*(fetch_collection(name) for name in fetchers))
+
+    return dict(zip(fetchers, collections))
+
+
+def iter_pages(
+    fetch: PageFetcher,
+    name: str = "collection",
+) -> Iterator[Any]:
+    """Yield the models of every page of a collection, fetching the next page while the current one is consumed.
+
+    At most two pages are held at once, so the memory used does not grow with the collection.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = 1
+        future: Optional[Future] = executor.submit(fetch, page)
+        while future is not None:
+            data = check_page(name, page, future.result())
+            future = executor.submit(fetch, page + 1) if page < data.pages else None
+            yield from data.data
+            page += 1
+
+
+async def iter_pages_async(
+    fetch: AsyncPageFetcher,
+    name: str = "collection",
+) -> AsyncIterator[Any]:
+    """Yield the models of every page of a collection, fetching the next page while the current one is consumed."""
+    page = 1
+    task: Optional[asyncio.Task] = asyncio.ensure_future(fetch(page))
+    try:
+        while task is not None:
+            data = check_page(name, page, await task)
+            task = asyncio.ensure_future(fetch(page + 1)) if page < data.pages else None
+            for model in data.data:
+                yield model
+            page += 1
+    finally:
+        if task is not None:
+            task.cancel()
@@ -0,0 +1,117 @@
+"""HTTP connection pool shared by the sessions."""
+
+import threading
+
+from typing import Optional
+
+import httpx
+
+from requests.adapters import HTTPAdapter
+
+
+class ConnectionPool:
+    """HTTP connection pool settings and the transports built from them.
+
+    The adapter (sync clients) and the transport (async clients) are created once and reused by every
+    session given this pool, so several clients, e.g. one per account token, share their TCP/TLS connections.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keepalive_expiry: Optional[float] = 30,
+    ) -> None:
+        """Init.
+
+        - `pool_connections`: number of hosts kept in the pool.
+        - `pool_maxsize`: maximum number of connections kept (and, with `pool_block`, opened) per host.
+        - `pool_block`: wait for a free connection instead of opening extra, non-pooled ones.
+        - `keep_alive`: reuse connections between requests.
+        - `keepalive_expiry`: seconds an idle connection is kept (async clients only).
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.keepalive_expiry = keepalive_expiry
+
+        self._adapter: Optional[HTTPAdapter] = None
+        self._async_transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._lock = threading.Lock()
+
+    def adapter(
+        self,
+    ) -> HTTPAdapter:
+        """Return the requests adapter of the pool."""
+        with self._lock:
+            if self._adapter is None:
+                self._adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                )
+
+            return self._adapter
+
+    def async_transport(
+        self,
+    ) -> httpx.AsyncBaseTransport:
+        """Return a handle on the httpx transport of the pool.
+
+        Closing a client only closes its handle; call `aclose` on the pool to close the connections.
+        """
+        with self._lock:
+            if self._async_transport is None:
+                self._async_transport = httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=self.pool_maxsize * self.pool_connections if self.pool_block else None,
+                        max_keepalive_connections=self.pool_maxsize if self.keep_alive else 0,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                )
+
+            return _SharedAsyncTransport(self._async_transport)
+
+    def close(
+        self,
+    ) -> None:
+        """Close the connections of the sync adapter."""
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close()
+
+    async def aclose(
+        self,
+    ) -> None:
+        """Close the connections of the async transport."""
+        with self._lock:
+            transport, self._async_transport = self._async_transport, None
+
+        if transport is not None:
+            await transport.aclose()
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Handle on a shared transport that leaves it open when a client closes."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+    ) -> None:
+        """Init."""
+        self.transport = transport
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send the request through the shared transport."""
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(
+        self,
+    ) -> None:
+        """Keep the shared transport open."""
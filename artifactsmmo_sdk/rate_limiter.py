@@ -0,0 +1,169 @@
+"""Client-side rate limiter."""
+
+import asyncio
+import re
+import threading
+import time
+
+from typing import Mapping, Optional
+
+
+ACTION_PATH = re.compile(r"/my/[^/]+/action/")
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens are reserved rather than polled: `reserve` always takes a token and returns how long the caller
+    has to wait before using it, so concurrent callers are served in order without busy-waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+    ) -> None:
+        """Init."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(
+        self,
+        now: float,
+    ) -> None:
+        """Add the tokens earned since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(
+        self,
+        tokens: float = 1,
+    ) -> float:
+        """Take tokens from the bucket and return the number of seconds to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= tokens
+            delay = max(0.0, -self.tokens / self.rate)
+
+            return max(delay, self.paused_until - now)
+
+    def pause(
+        self,
+        seconds: float,
+    ) -> None:
+        """Stop handing out tokens for the given number of seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = min(self.tokens, 0.0)
+
+    def sync(
+        self,
+        remaining: float,
+    ) -> None:
+        """Never hold more tokens than the server says are left."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with separate buckets for action and data endpoints.
+
+    One instance can be shared by several clients (and their sessions) to respect a single account budget.
+    """
+
+    def __init__(
+        self,
+        action_rate: float = 5,
+        action_burst: float = 5,
+        data_rate: float = 16,
+        data_burst: float = 16,
+    ) -> None:
+        """Init."""
+        self.action_bucket = TokenBucket(rate=action_rate, capacity=action_burst)
+        self.data_bucket = TokenBucket(rate=data_rate, capacity=data_burst)
+
+    def bucket(
+        self,
+        path: str,
+    ) -> TokenBucket:
+        """Return the bucket used by an endpoint path."""
+        if ACTION_PATH.search(path):
+            return self.action_bucket
+
+        return self.data_bucket
+
+    def acquire(
+        self,
+        path: str,
+    ) -> None:
+        """Block until a request to the path may be sent."""
+        delay = self.bucket(path).reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(
+        self,
+        path: str,
+    ) -> None:
+        """Wait, without blocking the event loop, until a request to the path may be sent."""
+        delay = self.bucket(path).reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(
+        self,
+        path: str,
+        status_code: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Adapt the bucket of the path to the rate limit headers returned by the server."""
+        bucket = self.bucket(path)
+
+        retry_after = _parse_seconds(headers.get("Retry-After"))
+        if status_code == 429:
+            bucket.pause(retry_after if retry_after is not None else 1 / bucket.rate)
+            return
+
+        remaining = _parse_number(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+
+        bucket.sync(remaining)
+        if remaining <= 0:
+            reset = _parse_seconds(headers.get("X-RateLimit-Reset"))
+            bucket.pause(reset if reset is not None else 1 / bucket.rate)
+
+
+def _parse_number(
+    value: Optional[str],
+) -> Optional[float]:
+    """Parse a numeric header value."""
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_seconds(
+    value: Optional[str],
+) -> Optional[float]:
+    """Parse a header holding either a delay in seconds or a unix timestamp."""
+    number = _parse_number(value)
+    if number is None:
+        return None
+
+    if number > 1_000_000_000:
+        return max(0.0, number - time.time())
+
+    return max(0.0, number)
@@ -0,0 +1,145 @@
+"""Graph of the crafting recipes."""
+
+import heapq
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .exceptions import RecipeCycleError
+from .models.actions import CraftSchema, ItemSchema
+
+
+class RecipeGraph:
+    """Directed acyclic graph of the recipes, from the materials to the items crafted with them.
+
+    Built once from the whole item set (e.g. `World.items`), it answers without any request: the recipe of an
+    item, the raw materials (items without recipe) needed for a quantity of it, and the items using a material.
+    Expansions are memoised per (item, quantity), so repeated questions are dictionary lookups. A recipe cycle
+    raises `RecipeCycleError`; materials missing from the item set are treated as raw.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[ItemSchema],
+    ) -> None:
+        """Init."""
+        self.items: Dict[str, ItemSchema] = {item.code: item for item in items}
+        self.recipes: Dict[str, CraftSchema] = {code: item.craft for code, item in self.items.items() if item.craft}
+        self.materials: Dict[str, Dict[str, int]] = {}
+        self.users: Dict[str, Set[str]] = {}
+        for code, recipe in self.recipes.items():
+            materials = self.materials[code] = {}
+            for material in recipe.items:
+                materials[material.code] = materials.get(material.code, 0) + material.quantity
+                self.users.setdefault(material.code, set()).add(code)
+
+        self.order = self._topological_order()
+
+        self._raw: Dict[Tuple[str, int], Dict[str, int]] = {}
+        self._all_users: Dict[str, List[str]] = {}
+
+    def _topological_order(
+        self,
+    ) -> List[str]:
+        """Return every item code, each after its materials (Kahn's algorithm, by code on ties)."""
+        codes = set(self.items) | set(self.users)
+        missing = {code: len(self.materials.get(code, ())) for code in codes}
+        ready = [code for code, count in missing.items() if not count]
+        heapq.heapify(ready)
+
+        order = []
+        while ready:
+            code = heapq.heappop(ready)
+            order.append(code)
+            for user in self.users.get(code, ()):
+                missing[user] -= 1
+                if not missing[user]:
+                    heapq.heappush(ready, user)
+
+        if len(order) != len(codes):
+            raise RecipeCycleError(f"Recipe cycle: {' -> '.join(self._cycle({c for c, n in missing.items() if n}))}")
+
+        return order
+
+    def _cycle(
+        self,
+        blocked: Set[str],
+    ) -> List[str]:
+        """Return a cycle among the items left out of the topological order."""
+        path: List[str] = []
+        code = min(blocked)
+        while code not in path:
+            path.append(code)
+            code = min(material for material in self.materials[code] if material in blocked)
+
+        return path[path.index(code):] + [code]
+
+    def recipe(
+        self,
+        code: str,
+    ) -> Optional[CraftSchema]:
+        """Return the recipe of an item, or None for a raw material."""
+        return self.recipes.get(code)
+
+    def is_raw(
+        self,
+        code: str,
+    ) -> bool:
+        """Return whether an item has no recipe."""
+        return code not in self.recipes
+
+    def crafts(
+        self,
+        code: str,
+        quantity: int = 1,
+    ) -> int:
+        """Return the number of crafts yielding at least `quantity` items."""
+        return -(-quantity // self.recipes[code].quantity)
+
+    def raw_materials(
+        self,
+        code: str,
+        quantity: int = 1,
+    ) -> Dict[str, int]:
+        """Return the raw materials needed to craft `quantity` items, intermediate crafts included."""
+        return dict(self._raw_materials(code, quantity))
+
+    def _raw_materials(
+        self,
+        code: str,
+        quantity: int,
+    ) -> Dict[str, int]:
+        """Return the memoised raw materials of a quantity of an item."""
+        key = (code, quantity)
+        if key in self._raw:
+            return self._raw[key]
+
+        if code not in self.recipes:
+            raw = {code: quantity}
+        else:
+            raw = {}
+            crafts = self.crafts(code, quantity)
+            for material, needed in self.materials[code].items():
+                for raw_code, raw_quantity in self._raw_materials(material, needed * crafts).items():
+                    raw[raw_code] = raw.get(raw_code, 0) + raw_quantity
+
+        self._raw[key] = raw
+
+        return raw
+
+    def uses(
+        self,
+        material: str,
+        recursive: bool = False,
+    ) -> List[str]:
+        """Return the items crafted with a material, or also from the items crafted with it when `recursive`."""
+        if not recursive:
+            return sorted(self.users.get(material, ()))
+
+        if material not in self._all_users:
+            users: Set[str] = set()
+            for user in self.users.get(material, ()):
+                users.add(user)
+                users.update(self.uses(user, recursive=True))
+            self._all_users[material] = sorted(users)
+
+        return list(self._all_users[material])
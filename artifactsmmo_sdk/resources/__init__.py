@@ -1,8 +1,10 @@
 """Init Resources."""
 
+from .async_resources import AsyncResources
 from .resources import Resources
 
 
 __all__ = [
+    "AsyncResources",
     "Resources",
 ]
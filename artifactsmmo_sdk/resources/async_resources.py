@@ -0,0 +1,82 @@
+"""Async Resources."""
+
+from typing import Annotated, AsyncIterator
+
+from pydantic import Field
+
+from ..base import AsyncBaseApi
+from ..models.resources import (
+    ListResourceResponseSchema,
+    ResourceResponseSchema,
+    ResourceSchema,
+    SkillEnum,
+)
+from ..pagination import MAX_PAGE_SIZE, iter_pages_async
+from ..result import Result
+
+
+class AsyncResources(AsyncBaseApi):
+    """Async Resources."""
+
+    async def get_resource(
+        self,
+        code: Annotated[str, Field(description="The code of the monster.", pattern="^[a-zA-Z0-9_-]+$")],
+    ) -> Result[ResourceResponseSchema]:
+        """Retrieve the details of a resource."""
+        return await self._request(
+            method="GET",
+            path=f"/resources/{code}",
+            schema=ResourceResponseSchema,
+            message="Successfully fetched resource.",
+            errors={
+                404: "Ressource not found.",
+            },
+        )
+
+    async def get_all_resources(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.", pattern="^[a-zA-Z0-9_-]+$")],
+        max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)],
+        min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
+        skill: Annotated[SkillEnum | str, Field(description="The code of the skill.")],
+        page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
+    ) -> Result[ListResourceResponseSchema]:
+        """Return resources."""
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&drop={drop}" if drop else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+        parameters += f"&skill={skill}" if skill else ""
+
+        return await self._request(
+            method="GET",
+            path=f"/resources?{parameters}",
+            schema=ListResourceResponseSchema,
+            message="",
+            errors={
+                404: "Ressources not found.",
+            },
+        )
+
+    def iter_resources(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.")] = "",
+        max_level: Annotated[int, Field(description="Resource maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Resource minimum level.", ge=0)] = 0,
+        skill: Annotated[SkillEnum | str, Field(description="The code of the skill.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> AsyncIterator[ResourceSchema]:
+        """Iterate over the resources of every page, fetching the next page while one is consumed."""
+        return iter_pages_async(
+            lambda page: self.get_all_resources(
+                drop=drop,
+                max_level=max_level,
+                min_level=min_level,
+                skill=skill,
+                page=page,
+                size=size,
+            ),
+            "resources",
+        )
@@ -1,86 +1,82 @@
 """Resources."""
 
-from typing import Annotated, Tuple
-
-import requests
+from typing import Annotated, Iterator
 
 from pydantic import Field
 
+from ..base import BaseApi
 from ..models.resources import (
     ListResourceResponseSchema,
     ResourceResponseSchema,
+    ResourceSchema,
     SkillEnum,
 )
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+from ..result import Result
 
 
-class Resources:
+class Resources(BaseApi):
     """Resources."""
 
-    def __init__(
-        self,
-        api_url: str,
-        session: requests.Session,
-    ) -> None:
-        """Init."""
-        self.api_url = api_url
-        self.session = session
-
     def get_resource(
         self,
         code: Annotated[str, Field(description="The code of the monster.", pattern="^[a-zA-Z0-9_-]+$")],
-    ) -> Tuple[str, ResourceResponseSchema | None]:
+    ) -> Result[ResourceResponseSchema]:
         """Retrieve the details of a resource."""
-        try:
-            response = self.session.get(
-                url=f"{self.api_url}/resources/{code}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "Successfully fetched resource.",
-                ResourceResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Ressource not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        return self._request(
+            method="GET",
+            path=f"/resources/{code}",
+            schema=ResourceResponseSchema,
+            message="Successfully fetched resource.",
+            errors={
+                404: "Ressource not found.",
+            },
+        )
 
     def get_all_resources(
         self,
         drop: Annotated[str, Field(description="Item code of the drop.", pattern="^[a-zA-Z0-9_-]+$")],
         max_level: Annotated[int, Field(description="Monster maximum level.", ge=0)],
         min_level: Annotated[int, Field(description="Monster minimum level.", ge=0)],
-        skill: Annotated[SkillEnum, Field(description="The code of the skill.")],
+        skill: Annotated[SkillEnum | str, Field(description="The code of the skill.")],
         page: Annotated[int, Field(description="Page number.", ge=1, default=1)] = 1,
         size: Annotated[int, Field(description="Page size.", ge=1, le=100, default=50)] = 50,
-    ) -> Tuple[str, ListResourceResponseSchema | None]:
+    ) -> Result[ListResourceResponseSchema]:
         """Return resources."""
-        try:
-            parameters = f"page={page}"
-            parameters += f"&size={size}"
-            parameters += f"&drop={drop}" if drop else ""
-            parameters += f"&max_level={max_level}" if max_level else ""
-            parameters += f"&min_level={min_level}" if min_level else ""
-            parameters += f"&skill={skill}" if skill else ""
-
-            response = self.session.get(
-                url=f"{self.api_url}/resources?{parameters}",
-            )
-
-            response.raise_for_status()
-
-            return (
-                "",
-                ListResourceResponseSchema.model_validate(response.json())
-            )
-
-        except requests.exceptions.HTTPError as error:
-            match error.response.status_code:
-                case 404:
-                    return "Ressources not found.", None
-                case _:
-                    return f"Unknown error: {error}", None
+        parameters = f"page={page}"
+        parameters += f"&size={size}"
+        parameters += f"&drop={drop}" if drop else ""
+        parameters += f"&max_level={max_level}" if max_level else ""
+        parameters += f"&min_level={min_level}" if min_level else ""
+        parameters += f"&skill={skill}" if skill else ""
+
+        return self._request(
+            method="GET",
+            path=f"/resources?{parameters}",
+            schema=ListResourceResponseSchema,
+            message="",
+            errors={
+                404: "Ressources not found.",
+            },
+        )
+
+    def iter_resources(
+        self,
+        drop: Annotated[str, Field(description="Item code of the drop.")] = "",
+        max_level: Annotated[int, Field(description="Resource maximum level.", ge=0)] = 0,
+        min_level: Annotated[int, Field(description="Resource minimum level.", ge=0)] = 0,
+        skill: Annotated[SkillEnum | str, Field(description="The code of the skill.")] = "",
+        size: Annotated[int, Field(description="Page size.", ge=1, le=100)] = MAX_PAGE_SIZE,
+    ) -> Iterator[ResourceSchema]:
+        """Iterate over the resources of every page, fetching the next page while one is consumed."""
+        return iter_pages(
+            lambda page: self.get_all_resources(
+                drop=drop,
+                max_level=max_level,
+                min_level=min_level,
+                skill=skill,
+                page=page,
+                size=size,
+            ),
+            "resources",
+        )
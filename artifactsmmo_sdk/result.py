@@ -0,0 +1,126 @@
+"""Results returned by the sub-clients."""
+
+import json
+
+from enum import IntEnum
+from typing import Any, Generic, Optional, TypeVar
+
+from .retry import cooldown_seconds
+
+
+DataT = TypeVar("DataT")
+
+
+class ErrorCode(IntEnum):
+    """Status codes answered by the server (and 408 for the client-side timeouts)."""
+
+    TIMEOUT = 408
+    NOT_FOUND = 404
+    INVALID_PAYLOAD = 422
+    TOO_MANY_REQUESTS = 429
+    INSUFFICIENT_BANK_GOLD = 460
+    CANNOT_RECYCLE = 473
+    MISSING_ITEM = 478
+    NO_STOCK = 480
+    NO_ITEM_AT_PRICE = 482
+    ALREADY_EQUIPPED = 485
+    CHARACTER_LOCKED = 486
+    NO_TASK = 487
+    TASK_NOT_COMPLETED = 488
+    ALREADY_HAS_TASK = 489
+    ALREADY_AT_DESTINATION = 490
+    SLOT = 491
+    INSUFFICIENT_GOLD = 492
+    SKILL_LEVEL_TOO_LOW = 493
+    NAME_ALREADY_USED = 494
+    MAX_CHARACTERS = 495
+    LEVEL_TOO_LOW = 496
+    INVENTORY_FULL = 497
+    CHARACTER_NOT_FOUND = 498
+    CHARACTER_IN_COOLDOWN = 499
+    CONTENT_NOT_ON_MAP = 598
+
+
+class ApiError:
+    """Error of a call.
+
+    - `code`: status code of the response, `ErrorCode.TIMEOUT` when none was received in time.
+    - `message`: the message returned in the result tuple.
+    - `body`: the decoded error body sent by the server, if any.
+    - `cooldown`: seconds left before the character's cooldown expires (499 answers only).
+    """
+
+    def __init__(
+        self,
+        code: int,
+        message: str,
+        content: bytes = b"",
+    ) -> None:
+        """Init."""
+        self.code = code
+        self.message = message
+        try:
+            self.body: Any = json.loads(content) if content else None
+        except ValueError:
+            self.body = None
+        self.cooldown: Optional[float] = cooldown_seconds(content) if code == ErrorCode.CHARACTER_IN_COOLDOWN else None
+
+    @property
+    def server_message(
+        self,
+    ) -> Optional[str]:
+        """Return the message sent by the server."""
+        try:
+            return self.body["error"]["message"]
+        except (KeyError, TypeError):
+            return None
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Representation."""
+        return f"ApiError(code={self.code}, message={self.message!r}, cooldown={self.cooldown})"
+
+
+class Result(tuple, Generic[DataT]):
+    """Outcome of a call.
+
+    It is the `(message, data)` tuple the sub-clients have always returned, so it unpacks as before, and it
+    also carries the `status_code` of the response and, on failure, a structured `error` to branch on
+    without parsing the message: `if result.error and result.error.code == ErrorCode.CHARACTER_IN_COOLDOWN`.
+    """
+
+    message: str
+    data: Optional[DataT]
+    error: Optional[ApiError]
+    status_code: Optional[int]
+
+    def __new__(
+        cls,
+        message: str,
+        data: Optional[DataT] = None,
+        error: Optional[ApiError] = None,
+        status_code: Optional[int] = None,
+    ) -> "Result[DataT]":
+        """Create the result."""
+        result = super().__new__(cls, (message, data))
+        result.message = message
+        result.data = data
+        result.error = error
+        result.status_code = status_code if status_code is not None else error.code if error else None
+
+        return result
+
+    @property
+    def ok(
+        self,
+    ) -> bool:
+        """Return whether the call succeeded."""
+        return self.error is None
+
+    @property
+    def code(
+        self,
+    ) -> Optional[int]:
+        """Return the error code, or None on success."""
+        return self.error.code if self.error else None
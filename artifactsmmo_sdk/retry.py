@@ -0,0 +1,133 @@
+"""Retry policy for transient failures, locked and cooling down characters."""
+
+import json
+import random
+import re
+
+from typing import Dict, Iterable, Optional
+
+
+ACTION_REQUEST = r"^POST /my/[^/]+/action/"
+
+COOLDOWN_SECONDS = re.compile(r"(\d+(?:\.\d+)?)\s*seconds?")
+
+
+class RetryPolicy:
+    """Retry policy used by the sessions.
+
+    - 5xx (and 429) responses and connection errors are retried with jittered exponential backoff.
+    - 499 (character in cooldown) is retried exactly when the cooldown returned by the server expires.
+    - 486 (character locked) is retried after a short delay.
+
+    `overrides` maps a regex, searched in `"<METHOD> <path>"`, to the policy used by the matching requests.
+    By default idempotent requests retry every transient failure, while actions only retry the 499 and 486
+    answers that guarantee the action was not executed. Subclass and override `delay_for_response` or
+    `delay_for_error` to plug a custom strategy.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        retry_connection_errors: bool = True,
+        retry_cooldown: bool = True,
+        max_cooldown: float = 60,
+        cooldown_margin: float = 0,
+        lock_delay: float = 0.5,
+        overrides: Optional[Dict[str, "RetryPolicy"]] = None,
+    ) -> None:
+        """Init."""
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.retry_cooldown = retry_cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown_margin = cooldown_margin
+        self.lock_delay = lock_delay
+
+        if overrides is None:
+            overrides = {
+                ACTION_REQUEST: RetryPolicy(
+                    max_attempts=3,
+                    retry_statuses=(),
+                    retry_connection_errors=False,
+                    max_cooldown=max_cooldown,
+                    cooldown_margin=cooldown_margin,
+                    lock_delay=lock_delay,
+                    overrides={},
+                ),
+            }
+        self.overrides = {re.compile(pattern): policy for pattern, policy in overrides.items()}
+
+    def for_request(
+        self,
+        method: str,
+        path: str,
+    ) -> "RetryPolicy":
+        """Return the policy to use for a request."""
+        request = f"{method.upper()} {path}"
+        for pattern, policy in self.overrides.items():
+            if pattern.search(request):
+                return policy.for_request(method, path)
+
+        return self
+
+    def backoff(
+        self,
+        attempt: int,
+    ) -> float:
+        """Return a full-jitter exponential backoff for the attempt (starting at 1)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1)))
+
+    def delay_for_response(
+        self,
+        attempt: int,
+        status_code: int,
+        body: bytes = b"",
+    ) -> Optional[float]:
+        """Return the seconds to wait before retrying a response, or None to return it."""
+        if attempt >= self.max_attempts:
+            return None
+
+        match status_code:
+            case 499 if self.retry_cooldown:
+                cooldown = cooldown_seconds(body)
+                if cooldown is None or cooldown > self.max_cooldown:
+                    return None
+                return cooldown + self.cooldown_margin
+            case 486:
+                return self.lock_delay
+            case _ if status_code in self.retry_statuses:
+                return self.backoff(attempt)
+            case _:
+                return None
+
+    def delay_for_error(
+        self,
+        attempt: int,
+    ) -> Optional[float]:
+        """Return the seconds to wait before retrying after a connection error, or None to raise it."""
+        if attempt >= self.max_attempts or not self.retry_connection_errors:
+            return None
+
+        return self.backoff(attempt)
+
+
+def cooldown_seconds(
+    body: bytes,
+) -> Optional[float]:
+    """Extract the remaining cooldown from a 499 error body."""
+    try:
+        message = json.loads(body)["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    match = COOLDOWN_SECONDS.search(str(message))
+    if not match:
+        return None
+
+    return float(match.group(1))
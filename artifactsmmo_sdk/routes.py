@@ -0,0 +1,259 @@
+"""Ordering of the stops of a trip."""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .map_index import Position, manhattan
+from .travel import TravelModel
+
+
+@dataclass(frozen=True)
+class Stop:
+    """A place to visit: `after` names the stops to visit before it, and a `last` stop ends the trip."""
+
+    name: str
+    x: int
+    y: int
+    after: Tuple[str, ...] = ()
+    last: bool = False
+
+
+@dataclass
+class Route:
+    """Stops in visiting order, with the total movement cooldown and whether the order is proven optimal."""
+
+    stops: List[Stop] = field(default_factory=list)
+    seconds: float = 0.0
+    exact: bool = True
+
+
+class RoutePlanner:
+    """Order the stops of a trip to minimise the total movement cooldown from a start position.
+
+    Up to `exact_limit` stops, the order is optimal (Held-Karp dynamic programming over the subsets of
+    stops, extended with the precedence constraints). Beyond, it is built greedily, always walking to the
+    nearest stop whose predecessors were visited, then improved by relocating single stops and reversing
+    segments while this shortens the trip and keeps the constraints.
+    """
+
+    def __init__(
+        self,
+        model: Optional[TravelModel] = None,
+        exact_limit: int = 12,
+    ) -> None:
+        """Init."""
+        self.model = model or TravelModel()
+        self.exact_limit = exact_limit
+
+    def plan(
+        self,
+        start: Position,
+        stops: Sequence[Stop],
+    ) -> Route:
+        """Return the best order found for the stops."""
+        if not stops:
+            return Route()
+
+        predecessors = _predecessors(stops)
+        points = [start] + [(stop.x, stop.y) for stop in stops]
+        costs = [[float(self.model.seconds(manhattan(*a, *b))) for b in points[1:]] for a in points]
+
+        if len(stops) <= self.exact_limit:
+            order, seconds = _held_karp(costs, predecessors)
+            exact = True
+        else:
+            order = _improve(_greedy(costs, predecessors), costs, predecessors)
+            seconds = _cost(order, costs)
+            exact = False
+
+        return Route(stops=[stops[i] for i in order], seconds=seconds, exact=exact)
+
+
+def plan_route(
+    start: Position,
+    stops: Sequence[Stop],
+    model: Optional[TravelModel] = None,
+) -> Route:
+    """Return the best order found for the stops of a trip (see `RoutePlanner`)."""
+    return RoutePlanner(model).plan(start, stops)
+
+
+def _predecessors(
+    stops: Sequence[Stop],
+) -> List[int]:
+    """Return, for each stop, the bit mask of the stops to visit before it."""
+    indexes: Dict[str, int] = {}
+    for i, stop in enumerate(stops):
+        if stop.name in indexes:
+            raise ValueError(f"Duplicate stop {stop.name!r}.")
+        indexes[stop.name] = i
+
+    not_last = sum(1 << i for i, stop in enumerate(stops) if not stop.last)
+    masks = []
+    for stop in stops:
+        unknown = [name for name in stop.after if name not in indexes]
+        if unknown:
+            raise ValueError(f"Stop {stop.name!r} comes after unknown stops {unknown}.")
+        masks.append(sum(1 << indexes[name] for name in stop.after) | (not_last if stop.last else 0))
+
+    return masks
+
+
+def _held_karp(
+    costs: List[List[float]],
+    predecessors: List[int],
+) -> Tuple[List[int], float]:
+    """Return the optimal order of the stops and its cost."""
+    best, parent = _walks(costs, predecessors)
+    full = len(best) - 1
+    cost, end = min((cost, j) for j, cost in enumerate(best[full]))
+    if cost == float("inf"):
+        raise ValueError("The stops cannot be ordered: their constraints form a cycle.")
+
+    order = []
+    mask = full
+    while end != -1:
+        order.append(end)
+        mask, end = mask & ~(1 << end), parent[mask][end]
+
+    return order[::-1], cost
+
+
+def _walks(
+    costs: List[List[float]],
+    predecessors: List[int],
+) -> Tuple[List[List[float]], List[List[int]]]:
+    """Return the cost of the cheapest walks by visited stops and last stop, and the stop each one comes from."""
+    n = len(predecessors)
+    full = (1 << n) - 1
+    inf = float("inf")
+
+    # best[mask][j]: cheapest walk from the start visiting the stops of `mask`, ending at `j`.
+    best = [[inf] * n for _ in range(1 << n)]
+    parent = [[-1] * n for _ in range(1 << n)]
+    for j in range(n):
+        if not predecessors[j]:
+            best[1 << j][j] = costs[0][j]
+
+    for mask in range(1, full + 1):
+        row = best[mask]
+        ends = [(j, row[j]) for j in range(n) if row[j] < inf]
+        if not ends:
+            continue
+
+        for k in range(n):
+            bit = 1 << k
+            if mask & bit or predecessors[k] & mask != predecessors[k]:
+                continue
+
+            step = costs[1 + k]
+            cost, j = min((cost + step[j], j) for j, cost in ends)
+            if cost < best[mask | bit][k]:
+                best[mask | bit][k] = cost
+                parent[mask | bit][k] = j
+
+    return best, parent
+
+
+def _greedy(
+    costs: List[List[float]],
+    predecessors: List[int],
+) -> List[int]:
+    """Return the order walking to the nearest stop whose predecessors were visited."""
+    n = len(predecessors)
+    order: List[int] = []
+    visited = 0
+    here = 0
+    for _ in range(n):
+        candidates = [k for k in range(n) if not visited >> k & 1 and predecessors[k] & visited == predecessors[k]]
+        if not candidates:
+            raise ValueError("The stops cannot be ordered: their constraints form a cycle.")
+
+        k = min(candidates, key=costs[here].__getitem__)
+        order.append(k)
+        visited |= 1 << k
+        here = 1 + k
+
+    return order
+
+
+def _cost(
+    order: List[int],
+    costs: List[List[float]],
+) -> float:
+    """Return the cost of walking the stops in order from the start."""
+    return costs[0][order[0]] + sum(costs[1 + a][b] for a, b in zip(order, order[1:]))
+
+
+def _feasible(
+    order: List[int],
+    predecessors: List[int],
+) -> bool:
+    """Return whether every stop comes after its predecessors."""
+    visited = 0
+    for k in order:
+        if predecessors[k] & visited != predecessors[k]:
+            return False
+        visited |= 1 << k
+
+    return True
+
+
+def _improve(
+    order: List[int],
+    costs: List[List[float]],
+    predecessors: List[int],
+) -> List[int]:
+    """Relocate single stops and reverse segments while this shortens the walk and keeps the constraints.
+
+    The costs are symmetric between stops, so a change is priced by the legs it replaces only.
+    """
+
+    def leg(a: int, b: int) -> float:
+        # -1 stands for the start, and a walk ends at its last stop.
+        return 0.0 if b == -1 else costs[1 + a][b] if a != -1 else costs[0][b]
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order)):
+            for j in range(len(order)):
+                candidate = _shortened(order, i, j, leg, predecessors) if i != j else None
+                if candidate is not None:
+                    order, improved = candidate, True
+
+    return order
+
+
+def _shortened(
+    order: List[int],
+    i: int,
+    j: int,
+    leg: Callable[[int, int], float],
+    predecessors: List[int],
+) -> Optional[List[int]]:
+    """Return a shorter order keeping the constraints, or None.
+
+    The stop `i` is moved to position `j`, or else the stops `i` to `j` are reversed.
+    """
+    walk = [-1] + order + [-1]
+    stop = walk[i + 1]
+    removed = leg(walk[i], walk[i + 2]) - leg(walk[i], stop) - leg(stop, walk[i + 2])
+    rest = walk[: i + 1] + walk[i + 2:]
+    inserted = leg(rest[j], stop) + leg(stop, rest[j + 1]) - leg(rest[j], rest[j + 1])
+    if removed + inserted < -1e-9:
+        candidate = rest[1: j + 1] + [stop] + rest[j + 1: -1]
+        if _feasible(candidate, predecessors):
+            return candidate
+
+    if i < j:
+        reversal = (
+            leg(walk[i], walk[j + 1]) + leg(walk[i + 1], walk[j + 2])
+            - leg(walk[i], walk[i + 1]) - leg(walk[j + 1], walk[j + 2])
+        )
+        if reversal < -1e-9:
+            candidate = order[:i] + order[i: j + 1][::-1] + order[j + 1:]
+            if _feasible(candidate, predecessors):
+                return candidate
+
+    return None
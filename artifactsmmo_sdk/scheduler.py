@@ -0,0 +1,357 @@
+"""Cooldown-aware scheduling of the actions of many characters."""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .models.actions import CooldownSchema
+from .result import ErrorCode, Result
+from .server_clock import ServerClock
+
+
+MAX_RETRY_DELAY = 60.0
+
+
+@dataclass
+class CharacterStats:
+    """Activity of a character in a scheduler.
+
+    - `actions`: actions dispatched (retries after a 499 answer excluded).
+    - `cooldown`: seconds spent in cooldown.
+    - `idle`: seconds between the end of a cooldown (or the first submission) and the next dispatch.
+    """
+
+    actions: int = 0
+    cooldown: float = 0.0
+    idle: float = 0.0
+
+
+def result_cooldown(
+    result: Any,
+    server_clock: Optional[ServerClock] = None,
+) -> float:
+    """Return the seconds a character is in cooldown after an action, from its result (0 if unknown).
+
+    With a `server_clock`, they are counted until the `expiration` of the cooldown rather than rounded, at the
+    latest local time it may happen.
+    """
+    if not isinstance(result, Result):
+        return 0.0
+    if result.error is not None:
+        return result.error.cooldown or 0.0
+
+    cooldown = _cooldown(result)
+    if cooldown is None:
+        return 0.0
+    if server_clock is not None:
+        return max(0.0, server_clock.seconds_until(cooldown.expiration, latest=True))
+
+    return float(cooldown.remaining_seconds)
+
+
+def _cooldown(
+    result: Result,
+) -> Optional[CooldownSchema]:
+    """Return the cooldown of the result of an action, if any."""
+    cooldown = getattr(getattr(result.data, "data", None), "cooldown", None)
+
+    return cooldown if isinstance(cooldown, CooldownSchema) else None
+
+
+class _Scheduler:
+    """Queues of the characters and heap of the times they are next free, shared by both schedulers."""
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        server_clock: Optional[ServerClock] = None,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """Init."""
+        self.clock = clock
+        self.server_clock = server_clock
+        self.retry_delay = retry_delay
+        self.stats: Dict[str, CharacterStats] = {}
+
+        self._queues: Dict[str, Deque[Tuple[Callable[[], Any], Any]]] = {}
+        self._free_at: Dict[str, float] = {}
+        self._retries: Dict[str, int] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scheduled: Set[str] = set()
+        self._counter = itertools.count()
+        self._stopped = False
+
+    def _enqueue(
+        self,
+        name: str,
+        action: Callable[[], Any],
+        future: Any,
+    ) -> None:
+        """Queue an action, and schedule the character if it was waiting for work."""
+        self._queues.setdefault(name, deque()).append((action, future))
+        self._free_at.setdefault(name, self.clock())
+        self.stats.setdefault(name, CharacterStats())
+        if name not in self._scheduled:
+            self._push(name)
+
+    def _push(
+        self,
+        name: str,
+    ) -> None:
+        """Schedule the next action of a character at the end of its cooldown."""
+        self._scheduled.add(name)
+        heapq.heappush(self._heap, (self._free_at[name], next(self._counter), name))
+
+    def _delay(
+        self,
+    ) -> Optional[float]:
+        """Return the seconds before the next character is free, or None when nothing is queued."""
+        return self._heap[0][0] - self.clock() if self._heap else None
+
+    def _pop(
+        self,
+    ) -> Tuple[str, Callable[[], Any], Any]:
+        """Take the next action of the first free character."""
+        _, _, name = heapq.heappop(self._heap)
+        action, future = self._queues[name].popleft()
+        stats = self.stats[name]
+        stats.idle += max(0.0, self.clock() - self._free_at[name])
+
+        return name, action, future
+
+    def _sent(
+        self,
+    ) -> float:
+        """Return the local time an action is sent at, for the server clock."""
+        return self.server_clock.clock() if self.server_clock else 0.0
+
+    def _done(
+        self,
+        name: str,
+        action: Callable[[], Any],
+        future: Any,
+        result: Any,
+        sent_at: float = 0.0,
+    ) -> bool:
+        """Record the cooldown started by an action and reschedule the character; return whether it is final.
+
+        An action answered 499 (character in cooldown) is put back in front of the queue. When the answer does not
+        tell the cooldown, it is sent again after `retry_delay` seconds, doubled at each consecutive retry up to
+        `MAX_RETRY_DELAY`.
+        """
+        cooldown_schema = _cooldown(result) if isinstance(result, Result) else None
+        if self.server_clock and cooldown_schema is not None:
+            self.server_clock.observe_cooldown(cooldown_schema, sent_at, self.server_clock.clock())
+        cooldown = result_cooldown(result, self.server_clock)
+        retry = isinstance(result, Result) and result.code == ErrorCode.CHARACTER_IN_COOLDOWN
+        retries = self._retries.pop(name, 0)
+        if retry and cooldown <= 0:
+            cooldown = min(self.retry_delay * 2**retries, MAX_RETRY_DELAY)
+            self._retries[name] = retries + 1
+        self._free_at[name] = self.clock() + cooldown
+        if retry:
+            self._queues[name].appendleft((action, future))
+        elif not future.cancelled():
+            self.stats[name].actions += 1
+            self.stats[name].cooldown += cooldown
+
+        if self._queues[name]:
+            self._push(name)
+        else:
+            self._scheduled.discard(name)
+
+        return not retry
+
+    def free_at(
+        self,
+        name: str,
+    ) -> Optional[float]:
+        """Return the `clock` time at which a character's cooldown ends, or None for an unknown character."""
+        return self._free_at.get(name)
+
+    def pending(
+        self,
+        name: Optional[str] = None,
+    ) -> int:
+        """Return the number of queued actions, of a character or of all of them."""
+        if name is not None:
+            return len(self._queues.get(name, ()))
+
+        return sum(len(queue) for queue in self._queues.values())
+
+
+class ActionScheduler(_Scheduler):
+    """Dispatch the queued actions of many characters on one thread, each as soon as its cooldown ends.
+
+    `submit` queues a call (e.g. `functools.partial(client.actions.fight, name="billy1")`) and returns a
+    `Future` of its result. `run` pops the character whose cooldown ends first from a heap, waits on a
+    condition until then (woken early by new submissions, never polling), sends its next action and
+    reschedules it with the cooldown of the result. Actions answered 499 are sent again when the cooldown
+    they report ends, or after a growing `retry_delay` when they report none. `stats` holds the actions,
+    cooldown and idle time of each character.
+
+    With a `server_clock` (e.g. the client's), the cooldowns last until their `expiration`, converted to the
+    latest local time it may be, instead of their whole number of `remaining_seconds`. The clock narrows down
+    as responses come, and the cooldowns are observed to refine it too.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        server_clock: Optional[ServerClock] = None,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """Init."""
+        super().__init__(clock, server_clock, retry_delay)
+        self._condition = threading.Condition()
+
+    def submit(
+        self,
+        name: str,
+        action: Callable[[], Any],
+    ) -> "Future[Any]":
+        """Queue an action of a character and return the future of its result."""
+        future: Future[Any] = Future()
+        with self._condition:
+            self._enqueue(name, action, future)
+            self._condition.notify()
+
+        return future
+
+    def run(
+        self,
+        wait: bool = False,
+    ) -> None:
+        """Dispatch the actions until the queues are empty, or with `wait` until `stop` is called."""
+        while True:
+            with self._condition:
+                delay = self._delay()
+                while not self._stopped and (delay is None or delay > 0):
+                    if delay is None and not wait:
+                        return
+                    self._condition.wait(delay)
+                    delay = self._delay()
+                if self._stopped:
+                    return
+                name, action, future = self._pop()
+
+            if not future.running() and not future.set_running_or_notify_cancel():
+                with self._condition:
+                    self._done(name, action, future, None)
+                continue
+
+            sent_at = self._sent()
+            try:
+                result = action()
+            except Exception as error:
+                with self._condition:
+                    self._done(name, action, future, None)
+                future.set_exception(error)
+                continue
+
+            with self._condition:
+                final = self._done(name, action, future, result, sent_at)
+            if final:
+                future.set_result(result)
+
+    def stop(
+        self,
+    ) -> None:
+        """Make `run` return once the action in progress, if any, is done."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+
+class AsyncActionScheduler(_Scheduler):
+    """Asyncio version of `ActionScheduler`: the actions are coroutine functions, sent as concurrent tasks.
+
+    The event loop sleeps until the first cooldown ends or a new action is submitted, so that one loop drives
+    every character, each with at most one action in flight.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        server_clock: Optional[ServerClock] = None,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """Init."""
+        super().__init__(clock, server_clock, retry_delay)
+        self._wakeup = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight = 0
+
+    def submit(
+        self,
+        name: str,
+        action: Callable[[], Awaitable[Any]],
+    ) -> "asyncio.Future[Any]":
+        """Queue an action of a character and return the future of its result."""
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._enqueue(name, action, future)
+        self._wakeup.set()
+
+        return future
+
+    async def run(
+        self,
+        wait: bool = False,
+    ) -> None:
+        """Dispatch the actions until the queues are empty, or with `wait` until `stop` is called."""
+        while not self._stopped:
+            self._wakeup.clear()
+            delay = self._delay()
+            if delay is not None and delay <= 0:
+                self._in_flight += 1
+                task = asyncio.ensure_future(self._dispatch(*self._pop()))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+                continue
+            if delay is None and not self._in_flight and not wait:
+                return
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(
+        self,
+        name: str,
+        action: Callable[[], Awaitable[Any]],
+        future: "asyncio.Future[Any]",
+    ) -> None:
+        """Send an action and reschedule its character; the future may be cancelled while the action is in flight."""
+        try:
+            if future.cancelled():
+                self._done(name, action, future, None)
+                return
+
+            sent_at = self._sent()
+            try:
+                result = await action()
+            except Exception as error:
+                self._done(name, action, future, None)
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if self._done(name, action, future, result, sent_at) and not future.done():
+                    future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._wakeup.set()
+
+    def stop(
+        self,
+    ) -> None:
+        """Make `run` return; the actions in flight complete on their own."""
+        self._stopped = True
+        self._wakeup.set()
@@ -0,0 +1,139 @@
+"""Estimation of the server clock."""
+
+import threading
+import time
+
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping
+
+from .models.actions import CooldownSchema
+
+
+class ServerClock:
+    """Offset between the server clock and the local clock, to turn server timestamps into local times.
+
+    Every response bounds the offset: the server stamped it at `t` (its `Date` header, to the second, or the
+    start of a cooldown, `expiration - total_seconds`) at a local time between the moment the request was
+    sent and the moment the response was received, so `t - received <= offset <= t + resolution - sent`.
+    The bounds of the samples are intersected, so that the fastest round trips set the estimate, and widened
+    by `drift` seconds per second since, so that older samples count less and a drifting clock is followed.
+    A sample out of the bounds (e.g. the server clock was adjusted) starts the estimate over from it.
+    `offset` is the middle of the bounds; it is 0 until a sample is observed.
+    """
+
+    def __init__(
+        self,
+        drift: float = 1e-4,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Init."""
+        self.drift = drift
+        self.clock = clock
+        self.samples = 0
+        self.low = -float("inf")
+        self.high = float("inf")
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def offset(
+        self,
+    ) -> float:
+        """Return the estimated server time minus the local time, in seconds."""
+        return (self.low + self.high) / 2 if self.samples else 0.0
+
+    @property
+    def uncertainty(
+        self,
+    ) -> float:
+        """Return the half-width of the bounds of the offset, in seconds, as of now."""
+        with self._lock:
+            return (self.high - self.low) / 2 + self.drift * (self.clock() - self.updated_at)
+
+    def observe(
+        self,
+        server_time: float,
+        sent_at: float,
+        received_at: float,
+        resolution: float = 0.0,
+    ) -> None:
+        """Record a server timestamp (truncated to `resolution` seconds) of a request sent and answered locally."""
+        low, high = server_time - received_at, server_time + resolution - sent_at
+        with self._lock:
+            widening = self.drift * max(0.0, received_at - self.updated_at)
+            current_low, current_high = self.low - widening, self.high + widening
+            if high < current_low or low > current_high:
+                current_low, current_high = low, high
+            self.low, self.high = max(low, current_low), min(high, current_high)
+            self.updated_at = max(self.updated_at, received_at)
+            self.samples += 1
+
+    def observe_response(
+        self,
+        headers: Mapping[str, str],
+        sent_at: float,
+        received_at: float,
+    ) -> None:
+        """Record the `Date` header of a response, if any."""
+        date = headers.get("Date")
+        if not date:
+            return
+
+        try:
+            server_time = parsedate_to_datetime(date).timestamp()
+        except (TypeError, ValueError):
+            return
+
+        self.observe(server_time, sent_at, received_at, resolution=1.0)
+
+    def observe_cooldown(
+        self,
+        cooldown: CooldownSchema,
+        sent_at: float,
+        received_at: float,
+    ) -> None:
+        """Record the cooldown of an action, whose whole `total_seconds` may be rounded by up to half a second."""
+        start = timestamp(cooldown.expiration) - cooldown.total_seconds
+        self.observe(start - 0.5, sent_at, received_at, resolution=1.0)
+
+    def now(
+        self,
+    ) -> float:
+        """Return the estimated server time, as a POSIX timestamp."""
+        return self.clock() + self.offset
+
+    def local_time(
+        self,
+        server_time: Any,
+        latest: bool = False,
+    ) -> float:
+        """Return the local time of a server time (an ISO 8601 string, a datetime or a POSIX timestamp).
+
+        With `latest`, return the latest local time the observations allow instead, so that e.g. a cooldown is
+        never taken as over before it is.
+        """
+        if latest and self.samples:
+            return timestamp(server_time) - self.low + self.drift * max(0.0, self.clock() - self.updated_at)
+
+        return timestamp(server_time) - self.offset
+
+    def seconds_until(
+        self,
+        server_time: Any,
+        latest: bool = False,
+    ) -> float:
+        """Return the seconds before a server time is reached, e.g. `CharacterSchema.cooldown_expiration`."""
+        return self.local_time(server_time, latest) - self.clock()
+
+
+def timestamp(
+    value: Any,
+) -> float:
+    """Return the POSIX timestamp of an ISO 8601 string (as sent by the server), a datetime or a number."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        return value.timestamp()
+
+    return float(value)
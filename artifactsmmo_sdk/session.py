@@ -0,0 +1,229 @@
+"""HTTP sessions shared by the sub-clients."""
+
+import asyncio
+import time
+
+from typing import Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+
+from .exceptions import DeadlineExceeded
+from .pool import ConnectionPool
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .server_clock import ServerClock
+from .transport import Transport
+
+
+Timeout = float | Tuple[float, float] | None
+
+DEFAULT_TIMEOUT: Timeout = (5, 30)
+
+
+class ArtifactsSession(requests.Session):
+    """Requests session applying the timeouts, the rate limiter and the retry policy to every request."""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool: Optional[ConnectionPool] = None,
+        transport: Optional[Transport] = None,
+        server_clock: Optional[ServerClock] = None,
+    ) -> None:
+        """Init."""
+        super().__init__()
+        self.pool = pool or ConnectionPool()
+        adapter = transport.adapter() if transport else self.pool.adapter()
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+        if not self.pool.keep_alive:
+            self.headers["Connection"] = "close"
+
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.server_clock = server_clock
+
+    def request(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Timeout = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request once the rate limiter allows it, retrying as the retry policy says.
+
+        `timeout` is the (connect, read) timeout of each attempt, `deadline` the total number of seconds the
+        call may take, retries included. `DeadlineExceeded` is raised once it is spent.
+        """
+        path = urlsplit(url).path
+        policy = self.retry_policy.for_request(method, path) if self.retry_policy else None
+        timeout = timeout if timeout is not None else self.timeout
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter:
+                self.rate_limiter.acquire(path)
+
+            remaining = _remaining(expires_at, f"{method} {path}")
+            sent_at = self.server_clock.clock() if self.server_clock else 0.0
+            try:
+                response = super().request(method, url, timeout=_clamp(timeout, remaining), **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                delay = policy.delay_for_error(attempt) if policy else None
+                if delay is None or not _fits(expires_at, delay):
+                    raise
+                time.sleep(delay)
+                continue
+
+            if self.server_clock:
+                self.server_clock.observe_response(response.headers, sent_at, self.server_clock.clock())
+            if self.rate_limiter:
+                self.rate_limiter.update(path, response.status_code, response.headers)
+
+            delay = policy.delay_for_response(attempt, response.status_code, response.content) if policy else None
+            if delay is None or not _fits(expires_at, delay):
+                return response
+            time.sleep(delay)
+
+
+class AsyncArtifactsSession(httpx.AsyncClient):
+    """HTTPX async client applying the timeouts, the rate limiter and the retry policy to every request."""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        pool: Optional[ConnectionPool] = None,
+        transport: Transport | httpx.AsyncBaseTransport | None = None,
+        server_clock: Optional[ServerClock] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Init."""
+        self.pool = pool or ConnectionPool()
+        if isinstance(transport, Transport):
+            transport = transport.async_transport()
+
+        super().__init__(
+            timeout=_httpx_timeout(timeout),
+            transport=transport or self.pool.async_transport(),
+            **kwargs,
+        )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.server_clock = server_clock
+
+    async def request(  # type: ignore[override]
+        self,
+        method: str,
+        url: httpx.URL | str,
+        *,
+        timeout: Any = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request once the rate limiter allows it, retrying as the retry policy says.
+
+        `timeout` is the (connect, read) timeout of each attempt, the client's when None or
+        `httpx.USE_CLIENT_DEFAULT` (as passed by `get`, `post`...), `deadline` the total number of seconds the
+        call may take, retries included. `DeadlineExceeded` is raised once it is spent.
+        """
+        path = httpx.URL(url).path
+        policy = self.retry_policy.for_request(method, path) if self.retry_policy else None
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async(path)
+
+            remaining = _remaining(expires_at, f"{method} {path}")
+            attempt_timeout = (
+                self.timeout if timeout is None or timeout is httpx.USE_CLIENT_DEFAULT else _httpx_timeout(timeout)
+            )
+            if remaining is not None:
+                attempt_timeout = _httpx_timeout(_clamp(attempt_timeout.as_dict(), remaining))
+
+            sent_at = self.server_clock.clock() if self.server_clock else 0.0
+            try:
+                response = await super().request(method, url, timeout=attempt_timeout, **kwargs)
+            except httpx.TransportError:
+                delay = policy.delay_for_error(attempt) if policy else None
+                if delay is None or not _fits(expires_at, delay):
+                    raise
+                await asyncio.sleep(delay)
+                continue
+
+            if self.server_clock:
+                self.server_clock.observe_response(response.headers, sent_at, self.server_clock.clock())
+            if self.rate_limiter:
+                self.rate_limiter.update(path, response.status_code, response.headers)
+
+            delay = policy.delay_for_response(attempt, response.status_code, response.content) if policy else None
+            if delay is None or not _fits(expires_at, delay):
+                return response
+            await asyncio.sleep(delay)
+
+
+def _remaining(
+    expires_at: Optional[float],
+    request: str,
+) -> Optional[float]:
+    """Return the seconds left before the deadline, raising `DeadlineExceeded` when there are none."""
+    if expires_at is None:
+        return None
+
+    remaining = expires_at - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded for {request}.")
+
+    return remaining
+
+
+def _fits(
+    expires_at: Optional[float],
+    delay: float,
+) -> bool:
+    """Return whether waiting `delay` seconds still leaves time before the deadline."""
+    return expires_at is None or time.monotonic() + delay < expires_at
+
+
+def _clamp(
+    timeout: Any,
+    remaining: Optional[float],
+) -> Any:
+    """Cap every part of a timeout to the seconds left before the deadline."""
+    if remaining is None:
+        return timeout
+
+    if isinstance(timeout, dict):
+        return {key: remaining if value is None else min(value, remaining) for key, value in timeout.items()}
+
+    if isinstance(timeout, tuple):
+        return tuple(remaining if value is None else min(value, remaining) for value in timeout)
+
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def _httpx_timeout(
+    timeout: Any,
+) -> httpx.Timeout:
+    """Convert a requests style timeout to an httpx timeout."""
+    if isinstance(timeout, dict):
+        return httpx.Timeout(**timeout)
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+
+    return httpx.Timeout(timeout)
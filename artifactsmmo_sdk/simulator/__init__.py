@@ -0,0 +1,14 @@
+"""Init Simulator."""
+
+from .payload import InvalidPayloadError, SimulatorError
+from .server import make_server, serve
+from .simulator import Simulator
+
+
+__all__ = [
+    "InvalidPayloadError",
+    "Simulator",
+    "SimulatorError",
+    "make_server",
+    "serve",
+]
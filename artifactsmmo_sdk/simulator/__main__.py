@@ -0,0 +1,31 @@
+"""Run the simulator over HTTP: `python -m artifactsmmo_sdk.simulator --port 8000`."""
+
+import argparse
+
+from .server import serve
+from .simulator import WORLD, Simulator
+
+
+def main() -> None:
+    """Parse the arguments and serve the simulator."""
+    parser = argparse.ArgumentParser(description="Local Artifacts MMO server simulator.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    parser.add_argument("--world", default=str(WORLD), help="JSON seed file of the world.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the fights and drops.")
+    parser.add_argument("--cooldown-scale", type=float, default=1.0, help="Factor applied to every cooldown.")
+    parser.add_argument("--action-latency", type=float, default=0, help="Seconds an action locks its character.")
+    args = parser.parse_args()
+
+    simulator = Simulator(
+        world=args.world,
+        seed=args.seed,
+        cooldown_scale=args.cooldown_scale,
+        action_latency=args.action_latency,
+    )
+    print(f"Simulator listening on http://{args.host}:{args.port}")
+    serve(simulator, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Movement, fight, gathering and task actions of the simulator."""
+
+from typing import Any, Dict, Tuple
+
+from .payload import SimulatorError, integer
+from .rules import fight, monster_xp, skill_xp
+from .state import SimulatorState
+
+
+class WorldActions(SimulatorState):
+    """Handlers of the actions on the map of the character: movement, fights, gathering and tasks."""
+
+    def _move(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Move to a map; the cooldown grows with the distance."""
+        destination = self.maps.get((integer(body, "x"), integer(body, "y")))
+        if destination is None:
+            raise SimulatorError(404, "Map not found.")
+
+        distance = abs(destination["x"] - character["x"]) + abs(destination["y"] - character["y"])
+        if distance == 0:
+            raise SimulatorError(490, "Character already at destination.")
+
+        character["x"], character["y"] = destination["x"], destination["y"]
+        return "movement", self.MOVE_SECONDS * distance, {"destination": destination}
+
+    def _fight(
+        self,
+        character: Dict[str, Any],
+        _: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Fight the monster of the map."""
+        monster = self.monsters[self._content(character, "monster", "Monster not found on this map.")]
+        if sum(stack["quantity"] for stack in character["inventory"]) >= character["inventory_max_items"]:
+            raise SimulatorError(497, "Character inventory is full.")
+
+        result = fight(character, monster, self.random, self.MAX_TURNS)
+        xp, gold, drops = 0, 0, {}
+        if result["result"] == "win":
+            xp = monster_xp(character["level"], monster["level"])
+            gold = self.random.randint(monster["min_gold"], monster["max_gold"])
+            for code, quantity in self._roll_drops(monster["drops"]).items():
+                try:
+                    self._add_items(character, {code: quantity})
+                    drops[code] = quantity
+                except SimulatorError:
+                    pass
+            self._gain_xp(character, xp)
+            character["gold"] += gold
+            if character["task"] == monster["code"] and character["task_progress"] < character["task_total"]:
+                character["task_progress"] += 1
+
+        seconds = self.FIGHT_SECONDS_PER_TURN * result["turns"] * (1 - character["haste"] / 100)
+        fight_data = {
+            **result,
+            "xp": xp,
+            "gold": gold,
+            "drops": [{"code": code, "quantity": quantity} for code, quantity in drops.items()],
+        }
+        return "fight", seconds, {"fight": fight_data}
+
+    def _gathering(
+        self,
+        character: Dict[str, Any],
+        _: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Gather the resource of the map."""
+        resource = self.resources[self._content(character, "resource", "Resource not found on this map.")]
+        skill = resource["skill"]
+        if character[f"{skill}_level"] < resource["level"]:
+            raise SimulatorError(493, "Not skill level required.")
+
+        drops = self._roll_drops(resource["drops"])
+        self._add_items(character, drops)
+        xp = skill_xp(character[f"{skill}_level"], resource["level"])
+        self._gain_xp(character, xp, skill)
+
+        tool = self.items.get(character["weapon_slot"])
+        bonus = sum(effect["value"] for effect in tool["effects"] if effect["name"] == skill) if tool else 0
+        seconds = self.GATHERING_SECONDS * (1 + bonus / 100)
+        items = [{"code": code, "quantity": quantity} for code, quantity in drops.items()]
+        return "gathering", seconds, {"details": {"xp": xp, "items": items}}
+
+    def _task_new(
+        self,
+        character: Dict[str, Any],
+        _: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Accept a task to kill monsters of the character's level."""
+        self._content(character, "tasks_master", "Tasks Master not found on this map.")
+        if character["task"]:
+            raise SimulatorError(489, "Character already has a task.")
+
+        monsters = [code for code, monster in self.monsters.items() if monster["level"] <= character["level"]]
+        code = self.random.choice(monsters or list(self.monsters))
+        total = self.random.randint(10, 30)
+        character.update({"task": code, "task_type": "monsters", "task_progress": 0, "task_total": total})
+        return "task", self.ACTION_SECONDS, {"task": {"code": code, "type": "monsters", "total": total}}
+
+    def _task_complete(
+        self,
+        character: Dict[str, Any],
+        _: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Complete the task and receive a tasks coin."""
+        self._content(character, "tasks_master", "Tasks Master not found on this map.")
+        if not character["task"]:
+            raise SimulatorError(487, "Character has no task.")
+        if character["task_progress"] < character["task_total"]:
+            raise SimulatorError(488, "Character has not completed the task.")
+
+        self._add_items(character, {"tasks_coin": 1})
+        character.update({"task": "", "task_type": "", "task_progress": 0, "task_total": 0})
+        return "task", self.ACTION_SECONDS, {"reward": {"code": "tasks_coin", "quantity": 1}}
+
+    def _task_exchange(
+        self,
+        character: Dict[str, Any],
+        _: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Exchange tasks coins for a random reward."""
+        self._content(character, "tasks_master", "Tasks Master not found on this map.")
+        self._remove_items(character, {"tasks_coin": self.TASK_COINS})
+        code = self.random.choice(self.task_rewards)
+        try:
+            self._add_items(character, {code: 1})
+        except SimulatorError:
+            self._add_items(character, {"tasks_coin": self.TASK_COINS})
+            raise
+
+        return "task", self.ACTION_SECONDS, {"reward": {"code": code, "quantity": 1}}
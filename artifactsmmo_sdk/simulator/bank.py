@@ -0,0 +1,120 @@
+"""Bank and Grand Exchange actions of the simulator."""
+
+from typing import Any, Dict, List, Tuple
+
+from .payload import SimulatorError, integer, text
+from .state import SimulatorState
+
+
+class BankActions(SimulatorState):
+    """Handlers of the bank deposits and withdrawals and of the Grand Exchange orders."""
+
+    def _deposit_bank(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Deposit items in the bank."""
+        self._content(character, "bank", "Bank not found on this map.")
+        item = self._item(text(body, "code"))
+        quantity = integer(body, "quantity", 1, minimum=1)
+        self._remove_items(character, {item["code"]: quantity})
+        self.bank[item["code"]] = self.bank.get(item["code"], 0) + quantity
+        return "deposit_bank", self.ACTION_SECONDS, {"item": item, "bank": self._bank_items()}
+
+    def _withdraw_bank(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Withdraw items from the bank."""
+        self._content(character, "bank", "Bank not found on this map.")
+        item = self._item(text(body, "code"))
+        quantity = integer(body, "quantity", 1, minimum=1)
+        if not self.bank.get(item["code"]):
+            raise SimulatorError(404, "Item not found.")
+        if self.bank[item["code"]] < quantity:
+            raise SimulatorError(478, "Missing item or insufficient quantity in your inventory.")
+
+        self._add_items(character, {item["code"]: quantity})
+        self.bank[item["code"]] -= quantity
+        return "withdraw_bank", self.ACTION_SECONDS, {"item": item, "bank": self._bank_items()}
+
+    def _deposit_bank_gold(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Deposit gold in the bank."""
+        self._content(character, "bank", "Bank not found on this map.")
+        quantity = integer(body, "quantity", minimum=1)
+        if character["gold"] < quantity:
+            raise SimulatorError(492, "Insufficient golds on your character.")
+
+        character["gold"] -= quantity
+        self.bank_gold += quantity
+        return "deposit_bank", self.ACTION_SECONDS, {"bank": {"quantity": self.bank_gold}}
+
+    def _withdraw_bank_gold(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Withdraw gold from the bank."""
+        self._content(character, "bank", "Bank not found on this map.")
+        quantity = integer(body, "quantity", minimum=1)
+        if self.bank_gold < quantity:
+            raise SimulatorError(460, "Insufficient golds in your bank.")
+
+        character["gold"] += quantity
+        self.bank_gold -= quantity
+        return "withdraw_bank", self.ACTION_SECONDS, {"bank": {"quantity": self.bank_gold}}
+
+    def _bank_items(
+        self,
+    ) -> List[Dict[str, Any]]:
+        """Return the content of the bank."""
+        return [{"code": code, "quantity": quantity} for code, quantity in self.bank.items() if quantity]
+
+    def _ge_buy(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Buy items at the Grand Exchange."""
+        self._content(character, "grand_exchange", "Grand Exchange not found on this map.")
+        ge_item = self.grand_exchange.get(text(body, "code"))
+        quantity, price = integer(body, "quantity", minimum=1), integer(body, "price", minimum=1)
+        if ge_item is None or ge_item["stock"] < quantity:
+            raise SimulatorError(480, "No stock for this item.")
+        if ge_item["buy_price"] != price:
+            raise SimulatorError(482, "No item at this price.")
+        if character["gold"] < price * quantity:
+            raise SimulatorError(492, "Insufficient golds on your character.")
+
+        self._add_items(character, {ge_item["code"]: quantity})
+        character["gold"] -= price * quantity
+        ge_item["stock"] -= quantity
+        transaction = {"code": ge_item["code"], "quantity": quantity, "price": price, "total_price": price * quantity}
+        return "buy_ge", self.ACTION_SECONDS, {"transaction": transaction}
+
+    def _ge_sell(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Sell items at the Grand Exchange."""
+        self._content(character, "grand_exchange", "Grand Exchange not found on this map.")
+        ge_item = self.grand_exchange.get(text(body, "code"))
+        if ge_item is None:
+            raise SimulatorError(404, "Item not found.")
+
+        quantity, price = integer(body, "quantity", minimum=1), integer(body, "price", minimum=1)
+        if ge_item["sell_price"] != price:
+            raise SimulatorError(482, "No item at this price.")
+
+        self._remove_items(character, {ge_item["code"]: quantity})
+        character["gold"] += price * quantity
+        ge_item["stock"] += quantity
+        transaction = {"code": ge_item["code"], "quantity": quantity, "price": price, "total_price": price * quantity}
+        return "sell_ge", self.ACTION_SECONDS, {"transaction": transaction}
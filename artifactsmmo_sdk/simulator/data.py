@@ -0,0 +1,255 @@
+"""Data endpoints of the simulator."""
+
+from copy import deepcopy
+
+from ..transport import TransportRequest, TransportResponse
+from .payload import SimulatorError, body, in_levels, integer, paginate, text
+from .rules import SKILLS
+from .state import SimulatorState
+
+
+class DataHandlers(SimulatorState):
+    """Handlers of the characters, account, maps, items, monsters, resources, events and Grand Exchange data."""
+
+    def _get_status(
+        self,
+        _: TransportRequest,
+    ) -> TransportResponse:
+        """Status of the server."""
+        return TransportResponse(json={"data": {**self.status, "characters_online": len(self.characters)}})
+
+    def _get_all_characters(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the characters, sorted by XP, gold or skill."""
+        with self.lock:
+            characters = [deepcopy(character) for character in self.characters.values()]
+
+        sort = request.params.get("sort")
+        if sort and sort != "None":
+            key = "gold" if sort == "gold" else f"{sort}_xp" if sort in SKILLS else "xp"
+            level = "gold" if sort == "gold" else f"{sort}_level" if sort in SKILLS else "level"
+            characters.sort(key=lambda character: (character[level], character[key]), reverse=True)
+
+        return paginate(request, characters)
+
+    def _get_character(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One character."""
+        with self.lock:
+            character = self.characters.get(request.path_params["name"])
+            if character is None:
+                raise SimulatorError(404, "Character not found.")
+
+            return TransportResponse(json={"data": deepcopy(character)})
+
+    def _get_my_characters(
+        self,
+        _: TransportRequest,
+    ) -> TransportResponse:
+        """Characters of the account."""
+        with self.lock:
+            return TransportResponse(json={"data": [deepcopy(character) for character in self.characters.values()]})
+
+    def _create_character(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Create a character."""
+        data = body(request)
+        name, skin = text(data, "name"), text(data, "skin")
+        with self.lock:
+            if name in self.characters:
+                raise SimulatorError(494, "Name already used.")
+            if len(self.characters) >= self.MAX_CHARACTERS:
+                raise SimulatorError(495, "Maximum characters reached on your account.")
+
+            character = self.add_character(name, skin)
+            return TransportResponse(json={"data": deepcopy(character)})
+
+    def _delete_character(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Delete a character."""
+        with self.lock:
+            character = self._character(text(body(request), "name"))
+            del self.characters[character["name"]]
+            return TransportResponse(json={"data": character})
+
+    def _get_logs(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Logs of the actions, most recent first."""
+        with self.lock:
+            return paginate(request, list(self.logs))
+
+    def _get_bank_items(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Items in the bank."""
+        code = request.params.get("item_code")
+        with self.lock:
+            items = [
+                {"code": item, "quantity": quantity}
+                for item, quantity in self.bank.items()
+                if quantity and (not code or item == code)
+            ]
+
+        return paginate(request, items)
+
+    def _get_bank_gold(
+        self,
+        _: TransportRequest,
+    ) -> TransportResponse:
+        """Gold in the bank."""
+        return TransportResponse(json={"data": {"quantity": self.bank_gold}})
+
+    def _change_password(
+        self,
+        _: TransportRequest,
+    ) -> TransportResponse:
+        """Passwords are not checked by the simulator."""
+        return TransportResponse(json={"message": "Password changed successfully."})
+
+    def _get_all_maps(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the maps, filtered by content."""
+        content_type = request.params.get("content_type")
+        content_code = request.params.get("content_code")
+        maps = [
+            tile
+            for tile in self.maps.values()
+            if (not content_type or (tile["content"] and tile["content"]["type"] == content_type))
+            and (not content_code or (tile["content"] and tile["content"]["code"] == content_code))
+        ]
+
+        return paginate(request, maps)
+
+    def _get_map(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One map."""
+        tile = self.maps.get((integer(request.path_params, "x"), integer(request.path_params, "y")))
+        if tile is None:
+            raise SimulatorError(404, "Map not found.")
+
+        return TransportResponse(json={"data": tile})
+
+    def _get_all_items(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the items, filtered by type, level, name and craft."""
+        params = request.params
+        items = [
+            item
+            for item in self.items.values()
+            if (not params.get("type") or item["type"] == params["type"])
+            and (not params.get("name") or params["name"].lower() in item["name"].lower())
+            and in_levels(item["level"], params)
+            and (not params.get("craft_skill") or (item["craft"] and item["craft"]["skill"] == params["craft_skill"]))
+            and (
+                not params.get("craft_material")
+                or (item["craft"] and any(c["code"] == params["craft_material"] for c in item["craft"]["items"]))
+            )
+        ]
+
+        return paginate(request, items)
+
+    def _get_item(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One item, with its Grand Exchange prices."""
+        item = self._item(request.path_params["code"])
+        return TransportResponse(json={"data": {"item": item, "ge": self.grand_exchange.get(item["code"])}})
+
+    def _get_all_monsters(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the monsters, filtered by level and drop."""
+        drop = request.params.get("drop")
+        monsters = [
+            monster
+            for monster in self.monsters.values()
+            if in_levels(monster["level"], request.params)
+            and (not drop or any(item["code"] == drop for item in monster["drops"]))
+        ]
+
+        return paginate(request, monsters)
+
+    def _get_monster(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One monster."""
+        monster = self.monsters.get(request.path_params["code"])
+        if monster is None:
+            raise SimulatorError(404, "Monster not found.")
+
+        return TransportResponse(json={"data": monster})
+
+    def _get_all_resources(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the resources, filtered by skill, level and drop."""
+        drop = request.params.get("drop")
+        skill = request.params.get("skill")
+        resources = [
+            resource
+            for resource in self.resources.values()
+            if in_levels(resource["level"], request.params)
+            and (not skill or resource["skill"] == skill)
+            and (not drop or any(item["code"] == drop for item in resource["drops"]))
+        ]
+
+        return paginate(request, resources)
+
+    def _get_resource(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One resource."""
+        resource = self.resources.get(request.path_params["code"])
+        if resource is None:
+            raise SimulatorError(404, "Resource not found.")
+
+        return TransportResponse(json={"data": resource})
+
+    def _get_all_events(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the active events."""
+        return paginate(request, self.events)
+
+    def _get_all_ge_items(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """List of the Grand Exchange items."""
+        with self.lock:
+            return paginate(request, [dict(item) for item in self.grand_exchange.values()])
+
+    def _get_ge_item(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """One Grand Exchange item."""
+        with self.lock:
+            item = self.grand_exchange.get(request.path_params["code"])
+            if item is None:
+                raise SimulatorError(404, "Item not found.")
+
+            return TransportResponse(json={"data": dict(item)})
@@ -0,0 +1,123 @@
+"""Equipment, crafting and inventory actions of the simulator."""
+
+from typing import Any, Dict, Tuple
+
+from .payload import InvalidPayloadError, SimulatorError, integer, text
+from .rules import SLOTS, skill_xp
+from .state import SimulatorState
+
+
+class ItemActions(SimulatorState):
+    """Handlers of the actions on the items of the character: equipment, crafting, recycling and deletion."""
+
+    def _equip(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Equip an item from the inventory."""
+        item = self._item(text(body, "code"))
+        slot = text(body, "slot")
+        if slot not in SLOTS:
+            raise InvalidPayloadError(f"unknown slot {slot}")
+        if character[f"{slot}_slot"] == item["code"]:
+            raise SimulatorError(485, "This item is already equipped.")
+        if character[f"{slot}_slot"]:
+            raise SimulatorError(491, "Slot is not empty.")
+        if item["level"] > character["level"]:
+            raise SimulatorError(496, "Character level is insufficient.")
+
+        self._remove_items(character, {item["code"]: 1})
+        character[f"{slot}_slot"] = item["code"]
+        self._apply_effects(character, item, 1)
+        return "equip", self.ACTION_SECONDS, {"slot": slot, "item": item}
+
+    def _unequip(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Unequip an item to the inventory."""
+        slot = text(body, "slot")
+        if slot not in SLOTS:
+            raise InvalidPayloadError(f"unknown slot {slot}")
+        if not character[f"{slot}_slot"]:
+            raise SimulatorError(491, "Slot is empty.")
+
+        item = self._item(character[f"{slot}_slot"])
+        self._add_items(character, {item["code"]: 1})
+        character[f"{slot}_slot"] = ""
+        self._apply_effects(character, item, -1)
+        return "unequip", self.ACTION_SECONDS, {"slot": slot, "item": item}
+
+    def _crafting(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Craft an item in the workshop of its skill."""
+        item = self.items.get(text(body, "code"))
+        if item is None or not item["craft"]:
+            raise SimulatorError(404, "Craft not found.")
+
+        craft, quantity = item["craft"], integer(body, "quantity", 1, minimum=1)
+        if self._content(character, "workshop", "Workshop not found on this map.") != craft["skill"]:
+            raise SimulatorError(598, "Workshop not found on this map.")
+        if character[f"{craft['skill']}_level"] < craft["level"]:
+            raise SimulatorError(493, "Not skill level required.")
+
+        materials = {material["code"]: material["quantity"] * quantity for material in craft["items"]}
+        crafted = {item["code"]: craft["quantity"] * quantity}
+        self._remove_items(character, materials)
+        try:
+            self._add_items(character, crafted)
+        except SimulatorError:
+            self._add_items(character, materials)
+            raise
+
+        xp = skill_xp(character[f"{craft['skill']}_level"], craft["level"]) * quantity
+        self._gain_xp(character, xp, craft["skill"])
+        items = [{"code": code, "quantity": count} for code, count in crafted.items()]
+        return "crafting", self.CRAFTING_SECONDS * quantity, {"details": {"xp": xp, "items": items}}
+
+    def _recycling(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Recycle crafted items into part of their materials."""
+        item = self._item(text(body, "code"))
+        quantity = integer(body, "quantity", 1, minimum=1)
+        craft = item["craft"]
+        if not craft or craft["skill"] == "cooking" or item["type"] == "resource":
+            raise SimulatorError(473, "This item cannot be recycled.")
+        if self._content(character, "workshop", "Workshop not found on this map.") != craft["skill"]:
+            raise SimulatorError(598, "Workshop not found on this map.")
+        if character[f"{craft['skill']}_level"] < craft["level"]:
+            raise SimulatorError(493, "Not skill level required.")
+
+        recycled = {item["code"]: quantity}
+        self._remove_items(character, recycled)
+        recovered: Dict[str, int] = {}
+        for _ in range(quantity):
+            material = self.random.choice(craft["items"])
+            recovered[material["code"]] = recovered.get(material["code"], 0) + max(1, material["quantity"] // 2)
+        try:
+            self._add_items(character, recovered)
+        except SimulatorError:
+            self._add_items(character, recycled)
+            raise
+
+        items = [{"code": code, "quantity": count} for code, count in recovered.items()]
+        return "recycling", self.CRAFTING_SECONDS * quantity, {"details": {"items": items}}
+
+    def _delete_item(
+        self,
+        character: Dict[str, Any],
+        body: Dict[str, Any],
+    ) -> Tuple[str, float, Dict[str, Any]]:
+        """Delete items from the inventory."""
+        item = self._item(text(body, "code"))
+        quantity = integer(body, "quantity", 1, minimum=1)
+        self._remove_items(character, {item["code"]: quantity})
+        return "delete_item", self.ACTION_SECONDS, {"item": {"code": item["code"], "quantity": quantity}}
@@ -0,0 +1,122 @@
+"""Errors, validation and pagination of the simulator requests."""
+
+import math
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional
+
+from ..transport import TransportRequest, TransportResponse
+
+
+class SimulatorError(Exception):
+    """Game error answered with its status code."""
+
+    def __init__(
+        self,
+        code: int,
+        message: str,
+    ) -> None:
+        """Init."""
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class InvalidPayloadError(SimulatorError):
+    """Request body or parameter the server rejects, answered 422."""
+
+    def __init__(
+        self,
+        message: str,
+    ) -> None:
+        """Init."""
+        super().__init__(422, f"Invalid payload: {message}.")
+
+
+def body(
+    request: TransportRequest,
+) -> Dict[str, Any]:
+    """Return the JSON object of a request body (empty without body), or answer 422."""
+    try:
+        data = request.json()
+    except ValueError as error:
+        raise InvalidPayloadError("malformed JSON") from error
+
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        raise InvalidPayloadError("the body must be an object")
+
+    return data
+
+
+def text(
+    values: Mapping[str, Any],
+    name: str,
+) -> str:
+    """Return a required string of a body, or answer 422."""
+    value = values.get(name)
+    if not isinstance(value, str) or not value:
+        raise InvalidPayloadError(f"{name} must be a non-empty string")
+
+    return value
+
+
+def integer(
+    values: Mapping[str, Any],
+    name: str,
+    default: Optional[int] = None,
+    minimum: Optional[int] = None,
+) -> int:
+    """Return an integer of a body, a query or a path (where it is a string), or answer 422."""
+    value = values.get(name, default)
+    if isinstance(value, str):
+        try:
+            value = int(value)
+        except ValueError:
+            pass
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise InvalidPayloadError(f"{name} must be an integer")
+    if minimum is not None and value < minimum:
+        raise InvalidPayloadError(f"{name} must be at least {minimum}")
+
+    return value
+
+
+def in_levels(
+    level: int,
+    params: Dict[str, str],
+) -> bool:
+    """Return whether a level is within the `min_level` and `max_level` filters."""
+    minimum = integer(params, "min_level") if params.get("min_level") else 0
+    maximum = integer(params, "max_level") if params.get("max_level") else math.inf
+    return minimum <= level <= maximum
+
+
+def paginate(
+    request: TransportRequest,
+    data: List[Any],
+) -> TransportResponse:
+    """Answer a page of the data, as the list endpoints do."""
+    page = integer(request.params, "page", 1, minimum=1)
+    size = integer(request.params, "size", 50, minimum=1)
+    if size > 100:
+        raise InvalidPayloadError("size must be at most 100")
+
+    start, end = (page - 1) * size, page * size
+    return TransportResponse(
+        json={
+            "data": data[start:end],
+            "total": len(data),
+            "page": page,
+            "size": size,
+            "pages": math.ceil(len(data) / size),
+        }
+    )
+
+
+def iso(
+    timestamp: float,
+) -> str:
+    """Format a timestamp the way the server does."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
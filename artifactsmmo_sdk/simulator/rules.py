@@ -0,0 +1,117 @@
+"""Game rules of the simulator: stats, fights and experience."""
+
+import random
+
+from typing import Any, Dict, List, Optional
+
+
+ELEMENTS = ("fire", "earth", "water", "air")
+SKILLS = ("mining", "woodcutting", "fishing", "weaponcrafting", "gearcrafting", "jewelrycrafting", "cooking")
+SLOTS = (
+    "weapon",
+    "shield",
+    "helmet",
+    "body_armor",
+    "leg_armor",
+    "boots",
+    "ring1",
+    "ring2",
+    "amulet",
+    "artifact1",
+    "artifact2",
+    "artifact3",
+    "consumable1",
+    "consumable2",
+)
+STATS = tuple(f"{stat}_{element}" for stat in ("attack", "dmg", "res") for element in ELEMENTS) + (
+    "haste",
+    "critical_strike",
+)
+
+
+def fight(
+    character: Dict[str, Any],
+    monster: Dict[str, Any],
+    rng: random.Random,
+    max_turns: int = 100,
+) -> Dict[str, Any]:
+    """Simulate a fight, the character striking first.
+
+    Every turn the attacker hits with each of its elements: the attack is raised by the attacker's damage
+    bonus then lowered by the defender's resistance, and is blocked with a probability of resistance / 10 %.
+    Character hits are critical (x1.5) with a probability of `critical_strike` %.
+    """
+    hp = {"character": character["hp"], "monster": monster["hp"]}
+    blocked = {side: dict.fromkeys(ELEMENTS, 0) for side in ("character", "monster")}
+    logs: List[str] = []
+
+    turn = 0
+    while turn < max_turns and hp["character"] > 0 and hp["monster"] > 0:
+        turn += 1
+        attacker, defender = ("character", monster) if turn % 2 else ("monster", character)
+        target = "monster" if attacker == "character" else "character"
+        stats = character if attacker == "character" else monster
+        for element in ELEMENTS:
+            if stats[f"attack_{element}"] <= 0:
+                continue
+            critical = character["critical_strike"] if attacker == "character" else None
+            damage = _damage(stats, defender, element, critical, rng)
+            if damage is None:
+                blocked[target][element] += 1
+                logs.append(f"Turn {turn}: The {target} blocked a {element} attack.")
+                continue
+            hp[target] -= damage
+            logs.append(f"Turn {turn}: The {attacker} used {element} attack and dealt {damage} damage.")
+
+    return {
+        "turns": turn,
+        "monster_blocked_hits": {**blocked["monster"], "total": sum(blocked["monster"].values())},
+        "player_blocked_hits": {**blocked["character"], "total": sum(blocked["character"].values())},
+        "logs": logs,
+        "result": "win" if hp["monster"] <= 0 else "lose",
+    }
+
+
+def _damage(
+    stats: Dict[str, Any],
+    defender: Dict[str, Any],
+    element: str,
+    critical: Optional[float],
+    rng: random.Random,
+) -> Optional[int]:
+    """Return the damage of an attack of an element, or None when it is blocked.
+
+    Only the character lands critical hits: `critical` is None for the monster.
+    """
+    resistance = defender[f"res_{element}"]
+    if rng.random() < resistance / 1000:
+        return None
+
+    damage = stats[f"attack_{element}"] * (1 + stats.get(f"dmg_{element}", 0) / 100) * (1 - resistance / 100)
+    if critical is not None and rng.random() < critical / 100:
+        damage *= 1.5
+
+    return round(damage)
+
+
+def max_xp(
+    level: int,
+) -> int:
+    """Return the XP needed to reach the next level."""
+    return int(150 * 1.25 ** (level - 1))
+
+
+def monster_xp(
+    character_level: int,
+    monster_level: int,
+) -> int:
+    """Return the XP won by killing a monster, reduced when the character outlevels it."""
+    return max(0, 10 * monster_level * (10 - max(0, character_level - monster_level)) // 10)
+
+
+def skill_xp(
+    skill_level: int,
+    resource_level: int,
+) -> int:
+    """Return the skill XP of a gathering or a craft, reduced when the skill outlevels it."""
+    return max(0, (10 + 2 * resource_level) * (10 - max(0, skill_level - resource_level)) // 10)
@@ -0,0 +1,83 @@
+"""HTTP server exposing a simulator."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from ..transport import Transport, TransportRequest
+
+
+def make_server(
+    transport: Transport,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> ThreadingHTTPServer:
+    """Return a threaded HTTP server answering the requests with a transport, e.g. a `Simulator`.
+
+    Use port 0 to let the system pick a free port, then read it from `server.server_address`.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        """Request handler forwarding to the transport."""
+
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(  # pylint: disable=invalid-name
+            self,
+        ) -> None:
+            """Answer a GET request."""
+            self.forward()
+
+        def do_POST(  # pylint: disable=invalid-name
+            self,
+        ) -> None:
+            """Answer a POST request."""
+            self.forward()
+
+        def forward(
+            self,
+        ) -> None:
+            """Forward the request to the transport and write its response."""
+            url = urlsplit(self.path)
+            response = transport.handle(
+                TransportRequest(
+                    method=self.command,
+                    path=url.path,
+                    params=dict(parse_qsl(url.query)),
+                    headers=dict(self.headers),
+                    body=self.rfile.read(int(self.headers.get("Content-Length") or 0)),
+                ),
+            )
+
+            body = response.body()
+            self.send_response(response.status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in response.headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(  # pylint: disable=redefined-builtin
+            self,
+            format: str,
+            *args: object,
+        ) -> None:
+            """Do not log every request."""
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+
+    return server
+
+
+def serve(
+    transport: Transport,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> None:
+    """Serve a transport over HTTP until interrupted."""
+    with make_server(transport, host, port) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
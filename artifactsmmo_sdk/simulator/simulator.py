@@ -0,0 +1,204 @@
+"""Local server implementing the endpoints called by the SDK."""
+
+import time
+
+from copy import deepcopy
+from dataclasses import replace
+from datetime import datetime
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..transport import TransportRequest, TransportResponse
+from .actions import WorldActions
+from .bank import BankActions
+from .data import DataHandlers
+from .items import ItemActions
+from .payload import SimulatorError, body, iso
+from .state import WORLD
+
+
+Action = Callable[[Dict[str, Any], Dict[str, Any]], Tuple[str, float, Dict[str, Any]]]
+
+
+class Simulator(DataHandlers, WorldActions, ItemActions, BankActions):
+    """Local ArtifactsMMO server implementing the endpoints called by the SDK.
+
+    The world (maps, items, monsters, resources, Grand Exchange, characters) is loaded from a JSON seed file,
+    by default the small world shipped in `data/world.json`. The simulator is a transport, so clients use it
+    in-process with `ArtifactsClient(transport=Simulator())`, or over HTTP with `serve` (see `__main__`).
+
+    Actions put the character in cooldown and answer 499 until it expires, and the game errors (404, 478, 486,
+    490, 497, 598...) are answered with the status codes of the real server. All the accounts share the same
+    characters and bank; tokens are not checked.
+
+    - `clock`: function returning the current time, replace it to fast-forward the cooldowns in tests. It also
+      dates the responses (`Date` header).
+    - `seed`: seed of the random generator used by the fights and the drops.
+    - `cooldown_scale`: factor applied to every cooldown, e.g. 0.01 to replay a bot fleet 100 times faster.
+    - `action_latency`: seconds an action keeps its character locked, so concurrent actions answer 486.
+    """
+
+    def __init__(
+        self,
+        world: str | Path | Dict[str, Any] = WORLD,
+        clock: Callable[[], float] = time.time,
+        seed: Optional[int] = None,
+        cooldown_scale: float = 1.0,
+        action_latency: float = 0,
+    ) -> None:
+        """Init."""
+        super().__init__(world, clock, seed, cooldown_scale, action_latency)
+        self._add_routes()
+
+    def handle(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Route a request, answering the game errors with their status codes."""
+        try:
+            response = super().handle(request)
+        except SimulatorError as error:
+            response = TransportResponse(
+                status_code=error.code,
+                json={"error": {"code": error.code, "message": error.message}},
+            )
+
+        return replace(response, headers={"Date": formatdate(self.clock(), usegmt=True), **response.headers})
+
+    def _add_routes(
+        self,
+    ) -> None:
+        """Register the routes of the API."""
+        self.add("GET", "/", self._get_status)
+
+        self.add("GET", "/characters", self._get_all_characters)
+        self.add("POST", "/characters/create", self._create_character)
+        self.add("POST", "/characters/delete", self._delete_character)
+        self.add("GET", "/characters/{name}", self._get_character)
+        self.add("GET", "/my/characters", self._get_my_characters)
+        self.add("GET", "/my/logs", self._get_logs)
+        self.add("GET", "/my/bank/items", self._get_bank_items)
+        self.add("GET", "/my/bank/gold", self._get_bank_gold)
+        self.add("POST", "/my/change_password", self._change_password)
+
+        self.add("GET", "/maps", self._get_all_maps)
+        self.add("GET", "/maps/{x}/{y}", self._get_map)
+        self.add("GET", "/items", self._get_all_items)
+        self.add("GET", "/items/{code}", self._get_item)
+        self.add("GET", "/monsters", self._get_all_monsters)
+        self.add("GET", "/monsters/{code}", self._get_monster)
+        self.add("GET", "/resources", self._get_all_resources)
+        self.add("GET", "/resources/{code}", self._get_resource)
+        self.add("GET", "/events", self._get_all_events)
+        self.add("GET", "/ge", self._get_all_ge_items)
+        self.add("GET", "/ge/{code}", self._get_ge_item)
+
+        actions: Dict[str, Action] = {
+            "move": self._move,
+            "equip": self._equip,
+            "unequip": self._unequip,
+            "fight": self._fight,
+            "gathering": self._gathering,
+            "crafting": self._crafting,
+            "bank/deposit": self._deposit_bank,
+            "bank/deposit/gold": self._deposit_bank_gold,
+            "bank/withdraw": self._withdraw_bank,
+            "bank/withdraw/gold": self._withdraw_bank_gold,
+            "recycling": self._recycling,
+            "delete": self._delete_item,
+            "ge/buy": self._ge_buy,
+            "ge/sell": self._ge_sell,
+            "task/new": self._task_new,
+            "task/complete": self._task_complete,
+            "task/exchange": self._task_exchange,
+        }
+        for path, action in actions.items():
+            self.add("POST", f"/my/{{name}}/action/{path}", self._action(action))
+
+    def _action(
+        self,
+        action: Action,
+    ) -> Callable[[TransportRequest], TransportResponse]:
+        """Wrap an action with the lock and cooldown checks shared by all the actions.
+
+        The action returns the cooldown reason, its duration and the data of the response; the cooldown
+        and the character are added to the data.
+        """
+
+        def handler(request: TransportRequest) -> TransportResponse:
+            name, data = request.path_params["name"], body(request)
+            with self.lock:
+                character = self._character(name)
+                if name in self.locked:
+                    raise SimulatorError(486, "Character is locked. Action is already in progress.")
+
+                remaining = self._remaining_cooldown(character)
+                if remaining > 0:
+                    raise SimulatorError(499, f"Character in cooldown: {remaining:.2f} seconds left.")
+
+                self.locked.add(name)
+
+            try:
+                if self.action_latency:
+                    time.sleep(self.action_latency)
+
+                with self.lock:
+                    reason, seconds, data = action(character, data)
+                    data["cooldown"] = self._start_cooldown(character, reason, seconds)
+                    data["character"] = deepcopy(character)
+                    self._log(character, reason, data)
+
+                return TransportResponse(json={"data": data})
+
+            finally:
+                with self.lock:
+                    self.locked.discard(name)
+
+        return handler
+
+    def _remaining_cooldown(
+        self,
+        character: Dict[str, Any],
+    ) -> float:
+        """Return the seconds left before the character's cooldown expires."""
+        expiration = datetime.fromisoformat(character["cooldown_expiration"].replace("Z", "+00:00"))
+        return expiration.timestamp() - self.clock()
+
+    def _start_cooldown(
+        self,
+        character: Dict[str, Any],
+        reason: str,
+        seconds: float,
+    ) -> Dict[str, Any]:
+        """Put the character in cooldown and return the cooldown schema."""
+        seconds *= self.cooldown_scale
+        character["cooldown"] = round(seconds)
+        character["cooldown_expiration"] = iso(self.clock() + seconds)
+
+        return {
+            "total_seconds": round(seconds),
+            "remaining_seconds": round(seconds),
+            "expiration": character["cooldown_expiration"],
+            "reason": reason,
+        }
+
+    def _log(
+        self,
+        character: Dict[str, Any],
+        reason: str,
+        data: Dict[str, Any],
+    ) -> None:
+        """Record an action in the logs."""
+        self.logs.appendleft(
+            {
+                "character": character["name"],
+                "account": "simulator",
+                "type": reason,
+                "description": f"{reason.replace('_', ' ').capitalize()} action.",
+                "content": {key: value for key, value in data.items() if key not in ("character", "cooldown")},
+                "cooldown": character["cooldown"],
+                "cooldown_expiration": character["cooldown_expiration"],
+                "created_at": iso(self.clock()),
+            }
+        )
@@ -0,0 +1,263 @@
+"""State of the simulated world, shared by the handlers of the simulator."""
+
+import json
+import random
+import threading
+import time
+
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..transport import MemoryTransport
+from .payload import SimulatorError, iso
+from .rules import SKILLS, SLOTS, STATS, max_xp
+
+
+WORLD = Path(__file__).parent / "data" / "world.json"
+
+
+class SimulatorState(MemoryTransport):
+    """World of a `Simulator` (maps, items, monsters, resources, bank, characters) and the helpers of its handlers."""
+
+    MOVE_SECONDS = 5
+    FIGHT_SECONDS_PER_TURN = 2
+    GATHERING_SECONDS = 25
+    CRAFTING_SECONDS = 5
+    ACTION_SECONDS = 3
+    MAX_TURNS = 100
+    MAX_CHARACTERS = 5
+    INVENTORY_SLOTS = 20
+    INVENTORY_MAX_ITEMS = 100
+    BASE_HP = 115
+    HP_PER_LEVEL = 5
+    TASK_COINS = 3
+
+    def __init__(
+        self,
+        world: str | Path | Dict[str, Any] = WORLD,
+        clock: Callable[[], float] = time.time,
+        seed: Optional[int] = None,
+        cooldown_scale: float = 1.0,
+        action_latency: float = 0,
+    ) -> None:
+        """Init."""
+        super().__init__()
+        data: Dict[str, Any] = world if isinstance(world, dict) else json.loads(Path(world).read_text(encoding="utf-8"))
+
+        self.clock = clock
+        self.random = random.Random(seed)
+        self.cooldown_scale = cooldown_scale
+        self.action_latency = action_latency
+
+        self.status: Dict[str, Any] = data["status"]
+        self.items: Dict[str, Dict[str, Any]] = {item["code"]: item for item in data["items"]}
+        self.monsters: Dict[str, Dict[str, Any]] = {monster["code"]: monster for monster in data["monsters"]}
+        self.resources: Dict[str, Dict[str, Any]] = {resource["code"]: resource for resource in data["resources"]}
+        self.grand_exchange: Dict[str, Dict[str, Any]] = {item["code"]: item for item in data["grand_exchange"]}
+        self.events: List[Dict[str, Any]] = data.get("events", [])
+        self.task_rewards: List[str] = data.get("task_rewards", [])
+        self.maps = self._load_maps(data)
+
+        self.characters: Dict[str, Dict[str, Any]] = {}
+        self.bank: Dict[str, int] = dict(data.get("bank", {}))
+        self.bank_gold: int = data.get("bank_gold", 0)
+        self.logs: Deque[Dict[str, Any]] = deque(maxlen=1000)
+
+        self.lock = threading.RLock()
+        self.locked: set[str] = set()
+
+        for character in data.get("characters", []):
+            self.add_character(**character)
+
+    # ---------------------------------------------------------
+    # STATE
+    # ---------------------------------------------------------
+
+    def add_character(
+        self,
+        name: str,
+        skin: str = "men1",
+        **fields: Any,
+    ) -> Dict[str, Any]:
+        """Create a character, overriding any of its fields (e.g. `x`, `gold`, `mining_level`)."""
+        character: Dict[str, Any] = {"name": name, "skin": skin, "level": 1, "xp": 0, "max_xp": max_xp(1), "gold": 0}
+        character["speed"] = 0
+        for skill in SKILLS:
+            character.update({f"{skill}_level": 1, f"{skill}_xp": 0, f"{skill}_max_xp": max_xp(1)})
+        character.update({"hp": self.BASE_HP + self.HP_PER_LEVEL, "stamina": 0, "x": 0, "y": 0, "cooldown": 0})
+        character.update({stat: 0 for stat in STATS})
+        character["cooldown_expiration"] = iso(self.clock())
+        character.update({f"{slot}_slot": "" for slot in SLOTS})
+        character.update({"consumable1_slot_quantity": 0, "consumable2_slot_quantity": 0})
+        character.update({"task": "", "task_type": "", "task_progress": 0, "task_total": 0})
+        character["inventory_max_items"] = self.INVENTORY_MAX_ITEMS
+        character["inventory"] = [
+            {"slot": slot, "code": "", "quantity": 0} for slot in range(1, self.INVENTORY_SLOTS + 1)
+        ]
+
+        if "wooden_stick" in self.items:
+            character["weapon_slot"] = "wooden_stick"
+            self._apply_effects(character, self.items["wooden_stick"], 1)
+
+        inventory = fields.pop("inventory", [])
+        character.update(fields)
+        for stack in inventory:
+            self._add_items(character, {stack["code"]: stack["quantity"]})
+
+        with self.lock:
+            self.characters[name] = character
+
+        return character
+
+    def _load_maps(
+        self,
+        world: Dict[str, Any],
+    ) -> Dict[Tuple[int, int], Dict[str, Any]]:
+        """Return the maps by position, filling the bounds of the world with empty tiles."""
+        maps: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        bounds = world.get("bounds")
+        if bounds:
+            for x in range(bounds["min_x"], bounds["max_x"] + 1):
+                for y in range(bounds["min_y"], bounds["max_y"] + 1):
+                    maps[x, y] = {"name": bounds["name"], "skin": bounds["skin"], "x": x, "y": y, "content": None}
+
+        for tile in world["maps"]:
+            maps[tile["x"], tile["y"]] = {"content": None, **tile}
+
+        return dict(sorted(maps.items(), key=lambda item: (item[0][1], item[0][0])))
+
+    def _character(
+        self,
+        name: str,
+    ) -> Dict[str, Any]:
+        """Return a character, or answer 498."""
+        character = self.characters.get(name)
+        if character is None:
+            raise SimulatorError(498, "Character not found.")
+
+        return character
+
+    def _item(
+        self,
+        code: Any,
+    ) -> Dict[str, Any]:
+        """Return an item, or answer 404."""
+        item = self.items.get(code)
+        if item is None:
+            raise SimulatorError(404, "Item not found.")
+
+        return item
+
+    def _content(
+        self,
+        character: Dict[str, Any],
+        content_type: str,
+        message: str,
+    ) -> str:
+        """Return the code of the content of the character's map, or answer 598 when it is of another type."""
+        content = self.maps[character["x"], character["y"]]["content"]
+        if not content or content["type"] != content_type:
+            raise SimulatorError(598, message)
+
+        return content["code"]
+
+    # ---------------------------------------------------------
+    # INVENTORY
+    # ---------------------------------------------------------
+
+    def _quantity(
+        self,
+        character: Dict[str, Any],
+        code: str,
+    ) -> int:
+        """Return the quantity of an item in the inventory."""
+        return sum(stack["quantity"] for stack in character["inventory"] if stack["code"] == code)
+
+    def _check_space(
+        self,
+        character: Dict[str, Any],
+        items: Dict[str, int],
+        removed: int = 0,
+    ) -> None:
+        """Answer 497 when the items do not fit in the inventory once `removed` items have been taken out."""
+        total = sum(stack["quantity"] for stack in character["inventory"]) - removed
+        codes = {stack["code"] for stack in character["inventory"] if stack["code"]}
+        new_slots = len({code for code, quantity in items.items() if quantity and code not in codes})
+        free_slots = sum(1 for stack in character["inventory"] if not stack["code"])
+        if total + sum(items.values()) > character["inventory_max_items"] or new_slots > free_slots:
+            raise SimulatorError(497, "Character inventory is full.")
+
+    def _add_items(
+        self,
+        character: Dict[str, Any],
+        items: Dict[str, int],
+    ) -> None:
+        """Add items to the inventory, answering 497 when they do not fit."""
+        self._check_space(character, items)
+        for code, quantity in items.items():
+            if quantity <= 0:
+                continue
+            stack = next((stack for stack in character["inventory"] if stack["code"] == code), None)
+            stack = stack or next(stack for stack in character["inventory"] if not stack["code"])
+            stack["code"] = code
+            stack["quantity"] += quantity
+
+    def _remove_items(
+        self,
+        character: Dict[str, Any],
+        items: Dict[str, int],
+    ) -> None:
+        """Remove items from the inventory, answering 478 when some are missing."""
+        if any(self._quantity(character, code) < quantity for code, quantity in items.items()):
+            raise SimulatorError(478, "Missing item or insufficient quantity in your inventory.")
+
+        for code, quantity in items.items():
+            for stack in character["inventory"]:
+                if stack["code"] == code:
+                    stack["quantity"] -= quantity
+                    if stack["quantity"] == 0:
+                        stack["code"] = ""
+                    break
+
+    def _apply_effects(
+        self,
+        character: Dict[str, Any],
+        item: Dict[str, Any],
+        sign: int,
+    ) -> None:
+        """Add (sign 1) or remove (sign -1) the effects of an equipped item to the character."""
+        for effect in item["effects"]:
+            if effect["name"] in STATS or effect["name"] == "hp":
+                character[effect["name"]] += sign * effect["value"]
+            elif effect["name"] == "inventory_space":
+                character["inventory_max_items"] += sign * effect["value"]
+
+    def _gain_xp(
+        self,
+        character: Dict[str, Any],
+        xp: int,
+        skill: str = "",
+    ) -> None:
+        """Give XP to the character (or to one of its skills) and level it up."""
+        prefix = f"{skill}_" if skill else ""
+        character[f"{prefix}xp"] += xp
+        while character[f"{prefix}xp"] >= character[f"{prefix}max_xp"]:
+            character[f"{prefix}xp"] -= character[f"{prefix}max_xp"]
+            character[f"{prefix}level"] += 1
+            character[f"{prefix}max_xp"] = max_xp(character[f"{prefix}level"])
+            if not skill:
+                character["hp"] += self.HP_PER_LEVEL
+
+    def _roll_drops(
+        self,
+        drops: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Roll the drops of a monster or a resource."""
+        items: Dict[str, int] = {}
+        for drop in drops:
+            if self.random.randint(1, drop["rate"]) == 1:
+                quantity = self.random.randint(drop["min_quantity"], drop["max_quantity"])
+                items[drop["code"]] = items.get(drop["code"], 0) + quantity
+
+        return items
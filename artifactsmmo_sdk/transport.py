@@ -0,0 +1,250 @@
+"""Pluggable transports.
+
+By default the sessions send requests over HTTP. A `Transport` replaces the network: the sessions hand every
+request to its `handle` method instead, while the sub-clients, the rate limiter, the retry policy and the
+schema validation run exactly as they do against the real server.
+"""
+
+import re
+
+from dataclasses import dataclass, field
+from json import dumps, loads
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import requests
+
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+@dataclass
+class TransportRequest:
+    """Request received by a transport."""
+
+    method: str
+    path: str
+    params: Dict[str, str] = field(default_factory=dict)
+    path_params: Dict[str, str] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(
+        self,
+    ) -> Any:
+        """Return the decoded JSON body, or None when the body is empty."""
+        return loads(self.body) if self.body else None
+
+
+@dataclass
+class TransportResponse:
+    """Response returned by a transport."""
+
+    status_code: int = 200
+    json: Any = None
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def body(
+        self,
+    ) -> bytes:
+        """Return the encoded body."""
+        if self.json is not None:
+            return dumps(self.json).encode()
+
+        return self.content
+
+
+Handler = Callable[[TransportRequest], TransportResponse]
+
+
+class Transport:
+    """Base of the transports."""
+
+    def handle(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Return the response to a request."""
+        raise NotImplementedError
+
+    def adapter(
+        self,
+    ) -> BaseAdapter:
+        """Return a requests adapter sending the requests to this transport."""
+        return TransportAdapter(self)
+
+    def async_transport(
+        self,
+    ) -> httpx.AsyncBaseTransport:
+        """Return an httpx transport sending the requests to this transport."""
+        return AsyncTransportBridge(self)
+
+
+class MemoryTransport(Transport):
+    """In-memory transport serving canned responses or routing requests to Python handlers.
+
+    Routes are matched in the order they were added. Path patterns use `{name}` placeholders, which are
+    passed to the handlers in `request.path_params`. Unknown routes answer 404.
+    """
+
+    def __init__(
+        self,
+    ) -> None:
+        """Init."""
+        self.routes: List[Tuple[str, Pattern[str], Handler]] = []
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        handler: Optional[Handler] = None,
+        json: Any = None,
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Answer the requests matching the method and path with a handler or a canned response."""
+        if handler is None:
+            response = TransportResponse(status_code=status_code, json=json, headers=headers or {})
+
+            def handler(_: TransportRequest) -> TransportResponse:
+                return response
+
+        pattern = re.compile("^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(path)) + "$")
+        self.routes.append((method.upper(), pattern, handler))
+
+    def route(
+        self,
+        method: str,
+        path: str,
+    ) -> Callable[[Handler], Handler]:
+        """Register the decorated function as the handler of a route."""
+
+        def decorator(handler: Handler) -> Handler:
+            self.add(method, path, handler=handler)
+            return handler
+
+        return decorator
+
+    def handle(
+        self,
+        request: TransportRequest,
+    ) -> TransportResponse:
+        """Route a request to its handler."""
+        for method, pattern, handler in self.routes:
+            match = pattern.match(request.path)
+            if method == request.method and match:
+                request.path_params = match.groupdict()
+                return handler(request)
+
+        return TransportResponse(
+            status_code=404,
+            json={"error": {"code": 404, "message": f"No route for {request.method} {request.path}."}},
+        )
+
+
+class TransportAdapter(BaseAdapter):
+    """Requests adapter sending the requests to a transport."""
+
+    def __init__(
+        self,
+        transport: Transport,
+    ) -> None:
+        """Init."""
+        super().__init__()
+        self.transport = transport
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Send a prepared request to the transport.
+
+        The transport answers in-process: the network options (`timeout`, `verify`, `cert`, `proxies`) do not
+        apply, and the whole body is read at once whatever `stream`.
+        """
+        del stream, timeout, verify, cert, proxies
+        url = urlsplit(request.url or "")
+
+        transport_response = self.transport.handle(
+            TransportRequest(
+                method=(request.method or "GET").upper(),
+                path=url.path,
+                params=dict(parse_qsl(url.query)),
+                headers={key: _text(value) for key, value in request.headers.items()},
+                body=_bytes(request.body),
+            ),
+        )
+
+        response = requests.Response()
+        response.status_code = transport_response.status_code
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json", **transport_response.headers})
+        response._content = transport_response.body()
+        response.encoding = "utf-8"
+        response.url = request.url or ""
+        response.request = request
+
+        return response
+
+    def close(
+        self,
+    ) -> None:
+        """Nothing to close."""
+
+
+def _text(
+    value: str | bytes,
+) -> str:
+    """Return a header value as a string."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _bytes(
+    body: Any,
+) -> bytes:
+    """Return the body of a prepared request as bytes, reading it when it is a file or an iterable of chunks."""
+    if hasattr(body, "read"):
+        body = body.read()
+    elif body is not None and not isinstance(body, (str, bytes)):
+        body = b"".join(chunk.encode() if isinstance(chunk, str) else chunk for chunk in body)
+
+    return body.encode() if isinstance(body, str) else body or b""
+
+
+class AsyncTransportBridge(httpx.AsyncBaseTransport):
+    """HTTPX transport sending the requests to a transport."""
+
+    def __init__(
+        self,
+        transport: Transport,
+    ) -> None:
+        """Init."""
+        self.transport = transport
+
+    async def handle_async_request(
+        self,
+        request: httpx.Request,
+    ) -> httpx.Response:
+        """Send a request to the transport."""
+        transport_response = self.transport.handle(
+            TransportRequest(
+                method=request.method.upper(),
+                path=request.url.path,
+                params=dict(request.url.params),
+                headers=dict(request.headers),
+                body=await request.aread(),
+            ),
+        )
+
+        return httpx.Response(
+            status_code=transport_response.status_code,
+            headers={"Content-Type": "application/json", **transport_response.headers},
+            content=transport_response.body(),
+            request=request,
+        )
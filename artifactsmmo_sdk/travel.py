@@ -0,0 +1,168 @@
+"""Travel costs between the maps."""
+
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .map_index import Position, content_type_name, manhattan
+from .models.actions import CharacterMovementDataSchema
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+class TravelModel:
+    """Movement cooldown of a trip: `base_seconds + seconds_per_tile * distance`, and nothing when not moving.
+
+    It starts from the 5 seconds per tile of the game. `observe` records actual cooldowns (e.g. with
+    `observe_move` after each `Actions.move`) and fits both coefficients by least squares, so that the
+    estimates follow the server if its movement costs change.
+    """
+
+    def __init__(
+        self,
+        seconds_per_tile: float = 5.0,
+        base_seconds: float = 0.0,
+    ) -> None:
+        """Init."""
+        self.seconds_per_tile = seconds_per_tile
+        self.base_seconds = base_seconds
+        self.observations = 0
+
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    def observe(
+        self,
+        distance: int,
+        seconds: float,
+    ) -> None:
+        """Record the cooldown of a trip and refit the model."""
+        if distance <= 0:
+            return
+
+        self.observations += 1
+        self._sum_x += distance
+        self._sum_y += seconds
+        self._sum_xx += distance * distance
+        self._sum_xy += distance * seconds
+
+        variance = self.observations * self._sum_xx - self._sum_x * self._sum_x
+        if variance > 0:
+            self.seconds_per_tile = (self.observations * self._sum_xy - self._sum_x * self._sum_y) / variance
+            self.base_seconds = (self._sum_y - self.seconds_per_tile * self._sum_x) / self.observations
+        else:
+            # Every trip had the same length: only the rate can be told apart.
+            self.seconds_per_tile = self._sum_xy / self._sum_xx
+            self.base_seconds = 0.0
+
+    def observe_move(
+        self,
+        origin: Position,
+        data: CharacterMovementDataSchema,
+    ) -> None:
+        """Record the cooldown of a move from `origin`, as returned by `Actions.move`."""
+        distance = manhattan(origin[0], origin[1], data.destination.x, data.destination.y)
+        self.observe(distance, data.cooldown.total_seconds)
+
+    def seconds(
+        self,
+        distance: Any,
+    ) -> Any:
+        """Return the cooldown of a trip of `distance` tiles (a number or a NumPy array of them)."""
+        return (distance > 0) * (self.base_seconds + self.seconds_per_tile * distance)
+
+    def estimate(
+        self,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+    ) -> float:
+        """Return the cooldown of a move between two positions."""
+        return self.seconds(manhattan(x1, y1, x2, y2))
+
+
+class TravelMatrix:
+    """Distances and movement cooldowns between every pair of points of interest.
+
+    The points of interest are the maps holding a content (banks, workshops, resources, monsters, the Grand
+    Exchange, the tasks masters). `distances` and `seconds` are (n, n) NumPy arrays indexed like `tiles`, so
+    that choosing a target or a route is done with array operations. Requires NumPy
+    (`pip install artifactsmmo-sdk[numpy]`).
+    """
+
+    def __init__(
+        self,
+        maps: Iterable[Any],
+        model: Optional[TravelModel] = None,
+    ) -> None:
+        """Init."""
+        if np is None:
+            raise ImportError("The travel matrix requires the numpy package.")
+
+        self.model = model or TravelModel()
+        self.tiles: List[Any] = sorted((tile for tile in maps if tile.content), key=lambda tile: (tile.x, tile.y))
+        self.index = {(tile.x, tile.y): i for i, tile in enumerate(self.tiles)}
+
+        self.positions = np.array([(tile.x, tile.y) for tile in self.tiles], dtype=np.int32).reshape(-1, 2)
+        self.codes = np.array([tile.content.code for tile in self.tiles], dtype=object)
+        self.types = np.array([content_type_name(tile.content.type) for tile in self.tiles], dtype=object)
+        self.distances = np.abs(self.positions[:, None, :] - self.positions[None, :, :]).sum(axis=2)
+        self.seconds = self.model.seconds(self.distances)
+
+    def refresh(
+        self,
+    ) -> None:
+        """Recompute the cooldowns after the model was refitted."""
+        self.seconds = self.model.seconds(self.distances)
+
+    def mask(
+        self,
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Any:
+        """Return the boolean array of the points of interest holding a content code and/or a content type."""
+        mask = np.ones(len(self.tiles), dtype=bool)
+        if code is not None:
+            mask &= self.codes == code
+        if content_type is not None:
+            mask &= self.types == content_type_name(content_type)
+
+        return mask
+
+    def distances_from(
+        self,
+        x: int,
+        y: int,
+    ) -> Any:
+        """Return the distances from any position to every point of interest."""
+        return np.abs(self.positions - np.array([x, y], dtype=np.int32)).sum(axis=1)
+
+    def seconds_from(
+        self,
+        x: int,
+        y: int,
+    ) -> Any:
+        """Return the movement cooldowns from any position to every point of interest."""
+        return self.model.seconds(self.distances_from(x, y))
+
+    def nearest(
+        self,
+        x: int,
+        y: int,
+        code: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Optional[Tuple[int, Any]]:
+        """Return the nearest point of interest holding a content code and/or type, as (distance, tile)."""
+        candidates = np.flatnonzero(self.mask(code, content_type))
+        if not candidates.size:
+            return None
+
+        distances = self.distances_from(x, y)[candidates]
+        best = candidates[np.argmin(distances)]
+
+        return int(distances.min()), self.tiles[best]
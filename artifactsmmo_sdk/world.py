@@ -0,0 +1,139 @@
+"""Snapshot of the world."""
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .drops import DropIndex
+from .map_index import MapIndex
+from .models.actions import ItemSchema
+from .models.grand_exchange import GEItemSchema
+from .models.maps import MapSchema
+from .models.monsters import MonsterSchema
+from .models.resources import ResourceSchema
+from .pagination import MAX_PAGE_SIZE, fetch_all_pages, fetch_all_pages_async
+from .recipes import RecipeGraph
+from .world_store import DATASETS, Datasets, WorldStore, dataset_pages
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncArtifactsClient
+    from .client import ArtifactsClient
+
+
+class World:
+    """Items, monsters, resources, maps and Grand Exchange items, indexed by code and by coordinates."""
+
+    def __init__(
+        self,
+        items: Iterable[ItemSchema] = (),
+        monsters: Iterable[MonsterSchema] = (),
+        resources: Iterable[ResourceSchema] = (),
+        maps: Iterable[MapSchema] = (),
+        ge_items: Iterable[GEItemSchema] = (),
+    ) -> None:
+        """Init."""
+        self.items: Dict[str, ItemSchema] = {item.code: item for item in items}
+        self.monsters: Dict[str, MonsterSchema] = {monster.code: monster for monster in monsters}
+        self.resources: Dict[str, ResourceSchema] = {resource.code: resource for resource in resources}
+        self.maps: Dict[Tuple[int, int], MapSchema] = {(tile.x, tile.y): tile for tile in maps}
+        self.ge_items: Dict[str, GEItemSchema] = {item.code: item for item in ge_items}
+
+        self.contents: Dict[str, List[MapSchema]] = {}
+        for tile in self.maps.values():
+            if tile.content:
+                self.contents.setdefault(tile.content.code, []).append(tile)
+
+    def map_at(
+        self,
+        x: int,
+        y: int,
+    ) -> Optional[MapSchema]:
+        """Return the map at a position."""
+        return self.maps.get((x, y))
+
+    def maps_with(
+        self,
+        content_code: str,
+    ) -> List[MapSchema]:
+        """Return the maps holding a content, e.g. a monster, a resource or a workshop."""
+        return self.contents.get(content_code, [])
+
+    @cached_property
+    def map_index(
+        self,
+    ) -> MapIndex:
+        """Return the spatial index of the maps, built on first use."""
+        return MapIndex(self.maps.values())
+
+    @cached_property
+    def recipes(
+        self,
+    ) -> RecipeGraph:
+        """Return the graph of the crafting recipes, built on first use."""
+        return RecipeGraph(self.items.values())
+
+    @cached_property
+    def drops(
+        self,
+    ) -> DropIndex:
+        """Return the index of the monsters and resources dropping each item, built on first use."""
+        return DropIndex(self.monsters.values(), self.resources.values())
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Representation."""
+        return (
+            f"World(items={len(self.items)}, monsters={len(self.monsters)}, resources={len(self.resources)}, "
+            f"maps={len(self.maps)}, ge_items={len(self.ge_items)})"
+        )
+
+
+def _world_pages(
+    client: Any,
+    names: Iterable[str],
+) -> Dict[str, Callable[[int], Any]]:
+    """Return the page fetchers of the collections of the world."""
+    pages = dataset_pages(client)
+    pages["ge_items"] = lambda page: client.grand_exchange.get_all_ge_item(page=page, size=MAX_PAGE_SIZE)
+
+    return {name: pages[name] for name in names}
+
+
+def load_world(
+    client: "ArtifactsClient",
+    concurrency: int = 8,
+    store: Optional[WorldStore] = None,
+) -> World:
+    """Fetch the whole world, at most `concurrency` pages at a time.
+
+    The first page of every collection is fetched at once, then the remaining ones as soon as their count is
+    known. With a `store`, the items, monsters, resources and maps are read from it while the server version
+    and wipe are unchanged; the Grand Exchange items, whose stocks and prices move, are always fetched.
+    """
+    status = client.status().data if store else None
+    datasets: Optional[Datasets] = store.get(status) if store and status else None
+
+    names = ["ge_items"] if datasets else [*DATASETS, "ge_items"]
+    fetched = fetch_all_pages(_world_pages(client, names), concurrency)
+    if store and status and not datasets:
+        store.put(status, fetched)
+
+    return World(**{**(datasets or {}), **fetched})
+
+
+async def load_world_async(
+    client: "AsyncArtifactsClient",
+    concurrency: int = 8,
+    store: Optional[WorldStore] = None,
+) -> World:
+    """Fetch the whole world, at most `concurrency` pages at a time (see `load_world`)."""
+    status = (await client.status()).data if store else None
+    datasets: Optional[Datasets] = store.get(status) if store and status else None
+
+    names = ["ge_items"] if datasets else [*DATASETS, "ge_items"]
+    fetched = await fetch_all_pages_async(_world_pages(client, names), concurrency)
+    if store and status and not datasets:
+        store.put(status, fetched)
+
+    return World(**{**(datasets or {}), **fetched})
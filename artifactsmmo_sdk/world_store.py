@@ -0,0 +1,187 @@
+"""Persistent store of the world datasets."""
+
+import sqlite3
+import time
+
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+from .models.actions import ItemSchema
+from .models.maps import MapSchema
+from .models.monsters import MonsterSchema
+from .models.resources import ResourceSchema
+from .models.status import StatusSchema
+from .pagination import MAX_PAGE_SIZE, fetch_all_pages, fetch_all_pages_async
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_client import AsyncArtifactsClient
+    from .client import ArtifactsClient
+
+
+DATASETS: Dict[str, Type[BaseModel]] = {
+    "items": ItemSchema,
+    "monsters": MonsterSchema,
+    "resources": ResourceSchema,
+    "maps": MapSchema,
+}
+
+DEFAULT_PATH = Path.home() / ".cache" / "artifactsmmo-sdk" / "world.sqlite3"
+
+Datasets = Dict[str, List[Any]]
+
+
+class WorldStore:
+    """SQLite store of the items, monsters, resources and maps.
+
+    Each dataset is stored as one JSON blob together with the server `version` and `last_wipe` it was fetched
+    under. `load` returns the stored datasets while the server reports the same version and wipe, and fetches
+    and stores them again otherwise, so restarted or new processes start without downloading the world.
+    Several processes may share the same file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_PATH,
+    ) -> None:
+        """Init."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.adapters = {name: TypeAdapter(List[schema]) for name, schema in DATASETS.items()}  # type: ignore
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS datasets ("
+                "name TEXT PRIMARY KEY, version TEXT NOT NULL, last_wipe TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, data BLOB NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(
+        self,
+    ) -> Iterator[sqlite3.Connection]:
+        """Open a connection to the store, commit its transaction (or roll it back on error), then close it."""
+        with closing(sqlite3.connect(self.path, timeout=30)) as connection:
+            with connection:
+                yield connection
+
+    def get(
+        self,
+        status: StatusSchema,
+    ) -> Optional[Datasets]:
+        """Return the stored datasets if they were all fetched under this version and wipe, else None."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT name, data FROM datasets WHERE version = ? AND last_wipe = ?",
+                (status.version, status.last_wipe),
+            ).fetchall()
+
+        blobs = dict(rows)
+        if set(blobs) != set(DATASETS):
+            return None
+
+        return {name: self.adapters[name].validate_json(blobs[name]) for name in DATASETS}
+
+    def put(
+        self,
+        status: StatusSchema,
+        datasets: Datasets,
+    ) -> None:
+        """Store the datasets fetched under this version and wipe, replacing the previous ones."""
+        rows = [
+            (name, status.version, status.last_wipe, time.time(), self.adapters[name].dump_json(datasets[name]))
+            for name in DATASETS
+        ]
+        with self._connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?)", rows)
+
+    def clear(
+        self,
+    ) -> None:
+        """Forget the stored datasets."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM datasets")
+
+    def load(
+        self,
+        client: "ArtifactsClient",
+    ) -> Datasets:
+        """Return the datasets of the world, from the store unless the server reports a new version or wipe."""
+        status = client.status().data
+        datasets = self.get(status)
+        if datasets is None:
+            datasets = fetch_datasets(client)
+            self.put(status, datasets)
+
+        return datasets
+
+    async def load_async(
+        self,
+        client: "AsyncArtifactsClient",
+    ) -> Datasets:
+        """Return the datasets of the world, from the store unless the server reports a new version or wipe."""
+        status = (await client.status()).data
+        datasets = self.get(status)
+        if datasets is None:
+            datasets = await fetch_datasets_async(client)
+            self.put(status, datasets)
+
+        return datasets
+
+
+def dataset_pages(
+    client: Any,
+) -> Dict[str, Callable[[int], Any]]:
+    """Return, for each dataset, a function fetching one of its pages with a client (sync or async)."""
+    return {
+        "items": lambda page: client.items.get_all_items(
+            craft_material="",
+            craft_skill="",
+            max_level=0,
+            min_level=0,
+            name="",
+            type_item="",
+            page=page,
+            size=MAX_PAGE_SIZE,
+        ),
+        "monsters": lambda page: client.monsters.get_all_monsters(
+            drop="",
+            max_level=0,
+            min_level=0,
+            page=page,
+            size=MAX_PAGE_SIZE,
+        ),
+        "resources": lambda page: client.resources.get_all_resources(
+            drop="",
+            max_level=0,
+            min_level=0,
+            skill="",
+            page=page,
+            size=MAX_PAGE_SIZE,
+        ),
+        "maps": lambda page: client.maps.get_all_maps(
+            content_code="",
+            content_type="",
+            page=page,
+            size=MAX_PAGE_SIZE,
+        ),
+    }
+
+
+def fetch_datasets(
+    client: "ArtifactsClient",
+    concurrency: int = 8,
+) -> Datasets:
+    """Fetch every page of the datasets."""
+    return fetch_all_pages(dataset_pages(client), concurrency)
+
+
+async def fetch_datasets_async(
+    client: "AsyncArtifactsClient",
+    concurrency: int = 8,
+) -> Datasets:
+    """Fetch every page of the datasets."""
+    return await fetch_all_pages_async(dataset_pages(client), concurrency)
@@ -0,0 +1,260 @@
+"""Expected yields of the monsters and resources."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .craft_planner import ActionCosts, item_counts
+from .drops import COMBAT, character_levels
+from .fights import estimate_fights
+from .models.actions import CharacterFightDataSchema, ItemSchema, SkillDataSchema
+from .models.characters import CharacterSchema
+from .models.grand_exchange import GEItemSchema
+from .models.monsters import MonsterSchema
+from .models.resources import ResourceSchema
+from .travel import TravelMatrix
+
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+@dataclass
+class YieldEstimates:
+    """Expected rates of every target (monster or resource) for a character, as NumPy arrays indexed like `codes`.
+
+    - `kinds`, `skills`: `monster` or `resource`, and the skill gaining the XP (`combat` for a monster).
+    - `available`: whether the target is within the character's levels and reachable.
+    - `seconds`: cooldown of an action, travel included.
+    - `xp_per_hour`, `gold_per_hour` (gold and Grand Exchange sell value of the drops).
+    - `items_per_hour`: (targets, `items`) array of the items obtained per hour.
+    """
+
+    codes: Tuple[str, ...]
+    kinds: Any
+    skills: Any
+    available: Any
+    seconds: Any
+    xp_per_hour: Any
+    gold_per_hour: Any
+    items: Tuple[str, ...]
+    items_per_hour: Any
+
+    def rank(
+        self,
+        by: str = "xp",
+        skill: Optional[str] = None,
+        k: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return the best available targets as (code, rate per hour), best first.
+
+        `by` is `xp`, `gold` or an item code; `skill` keeps the targets of a skill (`combat` for the monsters).
+        """
+        if by == "xp":
+            rates = self.xp_per_hour
+        elif by == "gold":
+            rates = self.gold_per_hour
+        elif by in self.items:
+            rates = self.items_per_hour[:, self.items.index(by)]
+        else:
+            return []
+
+        mask = self.available & (rates > 0)
+        if skill is not None:
+            mask &= self.skills == skill
+        candidates = np.flatnonzero(mask)
+        order = candidates[np.argsort(-rates[candidates], kind="stable")][:k]
+
+        return [(self.codes[i], float(rates[i])) for i in order]
+
+
+class YieldModel:
+    """Expected XP, gold and items per hour of every monster and resource, for any character.
+
+    The priors come from the cached data: drop rates and quantities, gold of the monsters and Grand Exchange
+    prices, the XP formulas of the game, the fight estimator (a lost fight yields nothing) and the gathering
+    cooldown reduced by the equipped tool. With a `travel` matrix, the trip to the nearest tile of a target is
+    spread over `actions_per_trip` actions. Every target is estimated at once with array operations.
+
+    `observe` (or `observe_fight` and `observe_gathering`) records actual results. The estimates are then
+    corrected by the mean gap between the observed and the expected values of the target, shrunk towards the
+    prior by `prior_weight` pseudo-observations, so that they converge to the server's actual rates.
+    Requires NumPy (`pip install artifactsmmo-sdk[numpy]`).
+    """
+
+    def __init__(
+        self,
+        monsters: Iterable[MonsterSchema] = (),
+        resources: Iterable[ResourceSchema] = (),
+        items: Iterable[ItemSchema] = (),
+        ge_items: Iterable[GEItemSchema] = (),
+        travel: Optional[TravelMatrix] = None,
+        costs: ActionCosts = ActionCosts(),
+        actions_per_trip: int = 50,
+        prior_weight: float = 5.0,
+    ) -> None:
+        """Init."""
+        if np is None:
+            raise ImportError("The yield model requires the numpy package.")
+
+        self.monsters = list(monsters)
+        self.resources = list(resources)
+        self.items: Dict[str, ItemSchema] = {item.code: item for item in items}
+        self.travel = travel
+        self.costs = costs
+        self.actions_per_trip = actions_per_trip
+        self.prior_weight = prior_weight
+
+        targets: List[Tuple[str, str, MonsterSchema | ResourceSchema]]
+        targets = [("monster", COMBAT, monster) for monster in self.monsters]
+        targets += [("resource", resource.skill, resource) for resource in self.resources]
+        self.codes: Tuple[str, ...] = tuple(target.code for _, _, target in targets)
+        self.index = {code: i for i, code in enumerate(self.codes)}
+        self.kinds = np.array([kind for kind, _, _ in targets], dtype=object)
+        self.skills = np.array([skill for _, skill, _ in targets], dtype=object)
+        self.levels = np.array([target.level for _, _, target in targets])
+        self.is_monster = self.kinds == "monster"
+
+        # Expected quantity of each item per successful action.
+        self.drop_items: Tuple[str, ...] = tuple(sorted({drop.code for _, _, t in targets for drop in t.drops}))
+        self.drops = np.zeros((len(targets), len(self.drop_items)))
+        for i, (_, _, target) in enumerate(targets):
+            for drop in target.drops:
+                expected = (drop.min_quantity + drop.max_quantity) / 2 / drop.rate
+                self.drops[i, self.drop_items.index(drop.code)] += expected
+
+        self.gold = np.array([(m.min_gold + m.max_gold) / 2 for m in self.monsters] + [0.0] * len(self.resources))
+        prices = {item.code: item.sell_price for item in ge_items}
+        self.prices = np.array([prices.get(code, 0) for code in self.drop_items], dtype=np.float64)
+
+        if travel is not None:
+            self._tile_targets = np.array([self.index.get(code, -1) for code in travel.codes], dtype=np.int64)
+
+        # Observed and expected sums of the seconds, XP, gold and items of each target.
+        self.observations = np.zeros(len(targets))
+        self._observed = np.zeros((len(targets), 3 + len(self.drop_items)))
+        self._expected = np.zeros_like(self._observed)
+
+    def _priors(
+        self,
+        character: CharacterSchema,
+    ) -> Tuple[Any, Any]:
+        """Return the expected (targets, seconds, XP, gold, items) values of an action, and the available mask."""
+        levels = character_levels(character)
+        skill_levels = np.array([levels.get(skill, 0) for skill in self.skills])
+        available = self.is_monster | (skill_levels >= self.levels)
+
+        # XP of the game, reduced by 10 % per level above the target.
+        outlevel = np.maximum(0, skill_levels - self.levels)
+        xp = np.where(self.is_monster, 10 * self.levels, 10 + 2 * self.levels) * (10 - outlevel) // 10
+        xp = np.maximum(xp, 0).astype(np.float64)
+
+        success = np.ones(len(self.codes))
+        seconds = np.empty(len(self.codes))
+        if self.monsters:
+            outcomes = estimate_fights([character], self.monsters)
+            success[self.is_monster] = outcomes.wins[0]
+            seconds[self.is_monster] = outcomes.seconds[0]
+
+        tool = self.items.get(character.weapon_slot)
+        bonus = {effect.name: effect.value for effect in tool.effects} if tool is not None else {}
+        gathering = np.array([self.costs.gathering * (1 + bonus.get(skill, 0) / 100) for skill in self.skills])
+        seconds = np.where(self.is_monster, seconds, gathering)
+
+        values = np.column_stack([seconds, success * xp, success * self.gold, success[:, None] * self.drops])
+
+        return values, available
+
+    def _corrections(
+        self,
+    ) -> Any:
+        """Return the mean gap between the observed and the expected values, shrunk towards zero."""
+        return (self._observed - self._expected) / (self.observations + self.prior_weight)[:, None]
+
+    def estimate(
+        self,
+        character: CharacterSchema,
+    ) -> YieldEstimates:
+        """Return the expected rates of every target for a character, from its position."""
+        values, available = self._priors(character)
+        values = values + self._corrections()
+        values[:, 1:] = np.maximum(values[:, 1:], 0)
+        seconds = np.maximum(values[:, 0], 1e-9)
+
+        if self.travel is not None:
+            trip = np.full(len(self.codes), np.inf)
+            known = self._tile_targets >= 0
+            np.minimum.at(trip, self._tile_targets[known], self.travel.seconds_from(character.x, character.y)[known])
+            available &= np.isfinite(trip)
+            seconds = seconds + np.where(np.isfinite(trip), trip, 0) / self.actions_per_trip
+
+        per_hour = 3600 / seconds
+        items_per_hour = values[:, 3:] * per_hour[:, None]
+
+        return YieldEstimates(
+            codes=self.codes,
+            kinds=self.kinds,
+            skills=self.skills,
+            available=available,
+            seconds=seconds,
+            xp_per_hour=values[:, 1] * per_hour,
+            gold_per_hour=values[:, 2] * per_hour + items_per_hour @ self.prices,
+            items=self.drop_items,
+            items_per_hour=items_per_hour,
+        )
+
+    def observe(
+        self,
+        code: str,
+        character: CharacterSchema,
+        seconds: float,
+        xp: int,
+        gold: int = 0,
+        drops: Mapping[str, int] | Iterable[Any] = (),
+    ) -> None:
+        """Record the cooldown, XP, gold and drops of an action on a target, by the character before it.
+
+        The expected values are those of the `character` that acted: after the action, it may have levelled up
+        or lost HP, which changes them.
+        """
+        i = self.index[code]
+        expected, _ = self._priors(character)
+
+        observed = np.zeros(self._observed.shape[1])
+        observed[:3] = (seconds, xp, gold)
+        for item, quantity in item_counts(drops).items():
+            if item in self.drop_items:
+                observed[3 + self.drop_items.index(item)] += quantity
+
+        self.observations[i] += 1
+        self._observed[i] += observed
+        self._expected[i] += expected[i]
+
+    def observe_fight(
+        self,
+        code: str,
+        data: CharacterFightDataSchema,
+        character: Optional[CharacterSchema] = None,
+    ) -> None:
+        """Record a fight against the monster `code`, as returned by `Actions.fight`.
+
+        `character` is the character before the fight, e.g. from the result of its previous action; the one
+        after it, `data.character`, stands in for it when omitted.
+        """
+        fight = data.fight
+        character = character or data.character
+        self.observe(code, character, data.cooldown.total_seconds, fight.xp, fight.gold, fight.drops)
+
+    def observe_gathering(
+        self,
+        code: str,
+        data: SkillDataSchema,
+        character: Optional[CharacterSchema] = None,
+    ) -> None:
+        """Record a gathering of the resource `code`, as returned by `Actions.gathering`.
+
+        `character` is the character before the gathering, `data.character` (after it) when omitted.
+        """
+        character = character or data.character
+        self.observe(code, character, data.cooldown.total_seconds, data.details.xp, 0, data.details.items)
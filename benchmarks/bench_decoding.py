@@ -0,0 +1,65 @@
+"""Measure the validation time of the response bodies per schema and JSON backend.
+
+The bodies are produced by the simulator. `json` is the former path (stdlib dict tree, then validation),
+`pydantic` validates the raw bytes and `orjson` parses with orjson before validating.
+
+Usage: python -m benchmarks.bench_decoding [runs]
+"""
+
+import sys
+import time
+
+from artifactsmmo_sdk import decoding
+from artifactsmmo_sdk.models.actions import CharacterFightDataResponseSchema, LogsResponseSchema
+from artifactsmmo_sdk.models.characters import CharacterResponseSchema
+from artifactsmmo_sdk.models.items import ListItemsResponseSchema
+from artifactsmmo_sdk.models.maps import ListMapResponseSchema
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.transport import TransportRequest
+
+
+def bodies(
+) -> dict:
+    """Return a response body per schema."""
+    simulator = Simulator(seed=1, cooldown_scale=0)
+
+    def get(path: str, **params: str) -> bytes:
+        return simulator.handle(TransportRequest(method="GET", path=path, params=params)).body()
+
+    simulator.handle(TransportRequest(method="POST", path="/my/billy1/action/move", body=b'{"x": 0, "y": 1}'))
+    fight = simulator.handle(TransportRequest(method="POST", path="/my/billy1/action/fight")).body()
+    for _ in range(99):
+        simulator.handle(TransportRequest(method="POST", path="/my/billy1/action/fight"))
+
+    return {
+        CharacterResponseSchema: get("/characters/billy1"),
+        CharacterFightDataResponseSchema: fight,
+        ListItemsResponseSchema: get("/items", size="100"),
+        ListMapResponseSchema: get("/maps", size="100"),
+        LogsResponseSchema: get("/my/logs", size="100"),
+    }
+
+
+def main(
+    runs: int,
+) -> None:
+    """Run the benchmark."""
+    backends = [backend for backend in decoding.JSON_BACKENDS if backend != "orjson" or decoding.orjson]
+    print(f"{'schema':<36} {'bytes':>8} " + " ".join(f"{backend + ' us':>12}" for backend in backends))
+
+    for schema, body in bodies().items():
+        timings = []
+        for backend in backends:
+            decoding.set_json_backend(backend)
+            start = time.perf_counter()
+            for _ in range(runs):
+                decoding.validate(schema, body)
+            timings.append((time.perf_counter() - start) / runs * 1e6)
+
+        print(f"{schema.__name__:<36} {len(body):>8} " + " ".join(f"{timing:12.1f}" for timing in timings))
+
+    decoding.set_json_backend("pydantic")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,50 @@
+"""Measure the gear optimizer over random items of every equipment type.
+
+Usage: python -m benchmarks.bench_gear [items]
+"""
+
+import random
+import sys
+import time
+
+from artifactsmmo_sdk.fights import CHARACTER_STATS
+from artifactsmmo_sdk.gear import SLOT_GROUPS, GearOptimizer
+from artifactsmmo_sdk.models.actions import EffectSchema, ItemSchema
+from artifactsmmo_sdk.models.characters import CharacterSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def main(
+    count: int,
+) -> None:
+    """Run the benchmark."""
+    rng = random.Random(1)
+    simulator = Simulator(seed=1)
+    items = [ItemSchema(**item) for item in simulator.items.values()]
+    items += [
+        ItemSchema(
+            name=f"item{i}",
+            code=f"item{i}",
+            level=1,
+            type=SLOT_GROUPS[i % len(SLOT_GROUPS)][0],
+            subtype="",
+            description="",
+            craft=None,
+            effects=[
+                EffectSchema(name=name, value=rng.randint(1, 20)) for name in rng.sample(CHARACTER_STATS[3:], 3)
+            ],
+        )
+        for i in range(count)
+    ]
+    character = CharacterSchema(**{**simulator.characters["billy1"], "level": 10})
+    monster = MonsterSchema(**simulator.monsters["wolf"])
+    optimizer = GearOptimizer(items)
+
+    start = time.perf_counter()
+    loadout = optimizer.optimize(character, monster=monster, inventory={item.code: 3 for item in items})
+    print(f"{count} items {(time.perf_counter() - start) * 1e3:10.1f} ms {loadout.score}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
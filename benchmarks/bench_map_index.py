@@ -0,0 +1,56 @@
+"""Measure the nearest-content queries of the map index against a scan of every tile.
+
+Usage: python -m benchmarks.bench_map_index [size]
+"""
+
+import random
+import sys
+import time
+
+from artifactsmmo_sdk.map_index import MapIndex, manhattan
+from artifactsmmo_sdk.models.maps import MapContentSchema, MapSchema
+
+
+def main(
+    size: int,
+) -> None:
+    """Run the benchmark."""
+    rng = random.Random(1)
+    maps = [
+        MapSchema(
+            name="tile",
+            skin="grass",
+            x=x,
+            y=y,
+            content=MapContentSchema(type="resource", code="copper_rocks") if rng.random() < 0.01 else None,
+        )
+        for x in range(size)
+        for y in range(size)
+    ]
+    positions = [(rng.randrange(size), rng.randrange(size)) for _ in range(1000)]
+
+    start = time.perf_counter()
+    map_index = MapIndex(maps)
+    print(f"{len(maps)} tiles, index built in {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    start = time.perf_counter()
+    for x, y in positions:
+        min(
+            (manhattan(x, y, tile.x, tile.y), tile.x, tile.y)
+            for tile in maps
+            if tile.content and tile.content.code == "copper_rocks"
+        )
+    print(f"scan     {(time.perf_counter() - start) / len(positions) * 1e6:10.1f} us/query")
+
+    start = time.perf_counter()
+    for x, y in positions:
+        map_index.closest(x, y, code="copper_rocks")
+    print(f"index    {(time.perf_counter() - start) / len(positions) * 1e6:10.1f} us/query")
+
+    start = time.perf_counter()
+    map_index.nearest_many(positions, code="copper_rocks", k=3)
+    print(f"batch k3 {(time.perf_counter() - start) / len(positions) * 1e6:10.1f} us/query")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,54 @@
+"""Measure the route planner across stop counts: exact search against the heuristic, in time and cooldown.
+
+Usage: python -m benchmarks.bench_routes [trips]
+"""
+
+import random
+import sys
+import time
+
+from artifactsmmo_sdk.routes import RoutePlanner, Stop
+
+
+def trip(
+    rng: random.Random,
+    n: int,
+) -> list:
+    """Return random stops: resources, a workshop after half of them and a bank last."""
+    stops = [Stop(name=f"resource{i}", x=rng.randint(-20, 20), y=rng.randint(-20, 20)) for i in range(n - 2)]
+    materials = tuple(stop.name for stop in stops[: max(1, (n - 2) // 2)])
+    stops.append(Stop(name="workshop", x=rng.randint(-20, 20), y=rng.randint(-20, 20), after=materials))
+    stops.append(Stop(name="bank", x=rng.randint(-20, 20), y=rng.randint(-20, 20), last=True))
+
+    return stops
+
+
+def main(
+    trips: int,
+) -> None:
+    """Run the benchmark."""
+    exact = RoutePlanner(exact_limit=64)
+    heuristic = RoutePlanner(exact_limit=0)
+    print(f"{'stops':>5} {'exact ms':>10} {'heuristic ms':>13} {'heuristic / exact':>18}")
+
+    for n in (3, 4, 6, 8, 10, 12, 20, 50, 100):
+        rng = random.Random(n)
+        stops = [trip(rng, n) for _ in range(trips)]
+
+        exact_ms = ratio = float("nan")
+        if n <= 12:
+            start = time.perf_counter()
+            optimal = [exact.plan((0, 0), trip_stops).seconds for trip_stops in stops]
+            exact_ms = (time.perf_counter() - start) / trips * 1e3
+
+        start = time.perf_counter()
+        found = [heuristic.plan((0, 0), trip_stops).seconds for trip_stops in stops]
+        heuristic_ms = (time.perf_counter() - start) / trips * 1e3
+
+        if n <= 12:
+            ratio = sum(found) / sum(optimal)
+        print(f"{n:>5} {exact_ms:>10.2f} {heuristic_ms:>13.2f} {ratio:>18.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
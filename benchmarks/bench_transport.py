@@ -0,0 +1,57 @@
+"""Measure the SDK overhead per call, without any network, through the in-memory transport.
+
+Usage: python -m benchmarks.bench_transport [calls]
+"""
+
+import sys
+import time
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.transport import MemoryTransport
+
+
+ITEM = {
+    "name": "Copper Ore",
+    "code": "copper_ore",
+    "level": 1,
+    "type": "resource",
+    "subtype": "mining",
+    "description": "",
+    "effects": [],
+    "craft": None,
+}
+
+
+def main(
+    calls: int,
+) -> None:
+    """Run the benchmark."""
+    transport = MemoryTransport()
+    transport.add("GET", "/items/copper_ore", json={"data": {"item": ITEM, "ge": None}})
+    transport.add(
+        "GET",
+        "/items",
+        json={"data": [ITEM] * 100, "total": 100, "page": 1, "size": 100, "pages": 1},
+    )
+
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://memory",
+        transport=transport,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+    )
+
+    for name, call in (
+        ("get_item", lambda: artifacts_client.items.get_item(code="copper_ore")),
+        ("get_all_items (100)", lambda: artifacts_client.items.get_all_items("", None, 0, 0, "", None, size=100)),
+    ):
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<24} {elapsed / calls * 1e6:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,36 @@
+"""Measure the cooldowns from every point of interest to all the others, with the travel matrix and with loops.
+
+Usage: python -m benchmarks.bench_travel [points]
+"""
+
+import random
+import sys
+import time
+
+from artifactsmmo_sdk.models.maps import MapContentSchema, MapSchema
+from artifactsmmo_sdk.travel import TravelMatrix, TravelModel
+
+
+def main(
+    points: int,
+) -> None:
+    """Run the benchmark."""
+    rng = random.Random(1)
+    positions = rng.sample([(x, y) for x in range(200) for y in range(200)], points)
+    maps = [
+        MapSchema(name="tile", skin="grass", x=x, y=y, content=MapContentSchema(type="resource", code="copper_rocks"))
+        for x, y in positions
+    ]
+    model = TravelModel()
+
+    start = time.perf_counter()
+    estimates = [[model.estimate(a.x, a.y, b.x, b.y) for b in maps] for a in maps]
+    print(f"loops  {(time.perf_counter() - start) * 1e3:10.1f} ms ({len(estimates) ** 2} estimates)")
+
+    start = time.perf_counter()
+    TravelMatrix(maps, model)
+    print(f"matrix {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
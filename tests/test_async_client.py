@@ -0,0 +1,80 @@
+"""Test async client."""
+
+import asyncio
+
+from icecream import ic
+
+from artifactsmmo_sdk import AsyncArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+
+
+async def get_character_and_events():
+    """Fetch a character and the events concurrently."""
+    async with AsyncArtifactsClient() as artifacts_client:
+        return await asyncio.gather(
+            artifacts_client.characters.get_character(name="billy1"),
+            artifacts_client.events.get_all_events(),
+        )
+
+
+def test_get_character_and_events():
+    """Tests."""
+    (error, character), (_, events) = asyncio.run(get_character_and_events())
+
+    if not character:
+        print(error)
+
+    else:
+        assert character
+        assert events
+        ic(character, events)
+
+
+def test_status():
+    """Tests."""
+
+    async def status():
+        async with AsyncArtifactsClient() as artifacts_client:
+            return await artifacts_client.status()
+
+    result = asyncio.run(status())
+
+    assert result
+    ic(result)
+
+
+def test_simulator():
+    """Tests."""
+    simulator = Simulator(seed=1, cooldown_scale=0)
+
+    async def play():
+        async with AsyncArtifactsClient(
+            token="token",
+            api_url="http://simulator",
+            transport=simulator,
+            rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        ) as artifacts_client:
+            character, items = await asyncio.gather(
+                artifacts_client.characters.get_character(name="billy1"),
+                artifacts_client.items.get_all_items(
+                    craft_material="",
+                    craft_skill="",
+                    max_level=0,
+                    min_level=0,
+                    name="",
+                    type_item="",
+                    size=100,
+                ),
+            )
+            move = await artifacts_client.actions.move(name="billy1", x=1, y=0)
+            missing = await artifacts_client.characters.get_character(name="nobody")
+            return character, items, move, missing
+
+    (_, character), (_, items), (error, move), (missing, _) = asyncio.run(play())
+    assert character.data.name == "billy1"
+    assert items.total == len(simulator.items)
+    assert move, error
+    assert (move.data.character.x, move.data.character.y) == (1, 0)
+    assert simulator.characters["billy1"]["x"] == 1
+    assert missing == "Character not found."
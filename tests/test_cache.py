@@ -0,0 +1,83 @@
+"""Test cache."""
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.cache import ResponseCache
+from artifactsmmo_sdk.hooks import Hooks
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def make_client(
+    cache: ResponseCache,
+    requests: list,
+) -> ArtifactsClient:
+    """Return a client of the simulator recording its requests."""
+    hooks = Hooks()
+    hooks.add(before_request=lambda call: requests.append(call.path))
+
+    return ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=Simulator(seed=1),
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        hooks=hooks,
+        cache=cache,
+    )
+
+
+def test_cache_hits():
+    """Tests."""
+    requests: list = []
+    cache = ResponseCache()
+    artifacts_client = make_client(cache, requests)
+
+    first = artifacts_client.items.get_item(code="copper_ore")
+    second = artifacts_client.items.get_item(code="copper_ore")
+    artifacts_client.items.get_item(code="unknown")
+    artifacts_client.items.get_item(code="unknown")
+    artifacts_client.characters.get_character(name="billy1")
+    artifacts_client.characters.get_character(name="billy1")
+
+    assert second is first
+    assert requests == [
+        "/items/copper_ore",
+        "/items/unknown",
+        "/items/unknown",
+        "/characters/billy1",
+        "/characters/billy1",
+    ]
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 3, "evictions": 0, "expirations": 0}
+
+
+def test_cache_pages_and_invalidation():
+    """Tests."""
+    requests: list = []
+    cache = ResponseCache()
+    artifacts_client = make_client(cache, requests)
+
+    for _ in range(2):
+        artifacts_client.maps.get_all_maps(content_code="", content_type="", page=1)
+        artifacts_client.maps.get_all_maps(content_code="", content_type="", page=2)
+    assert len(requests) == 2
+
+    assert cache.invalidate(r"^/maps\?page=2") == 1
+    artifacts_client.maps.get_all_maps(content_code="", content_type="", page=2)
+    assert len(requests) == 3
+
+
+def test_cache_eviction_and_expiration():
+    """Tests."""
+    cache = ResponseCache(maxsize=2, ttl=60)
+    cache.set("/items/a", 1)
+    cache.set("/items/b", 2)
+    assert cache.get("/items/a") == 1
+    cache.set("/items/c", 3)
+
+    assert cache.get("/items/b") is None
+    assert cache.get("/items/a") == 1
+    assert cache.stats()["evictions"] == 1
+
+    expired = ResponseCache(ttl=-1)
+    expired.set("/items/a", 1)
+    assert expired.get("/items/a") is None
+    assert expired.stats()["expirations"] == 1
@@ -0,0 +1,69 @@
+"""Test craft planner."""
+
+from artifactsmmo_sdk.craft_planner import ActionCosts, CraftPlanner, PlanStep
+from artifactsmmo_sdk.drops import DropIndex
+from artifactsmmo_sdk.models.actions import ItemSchema, SimpleItemSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.models.resources import ResourceSchema
+from artifactsmmo_sdk.recipes import RecipeGraph
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def make_planner():
+    """Return a planner of the simulator world."""
+    simulator = Simulator(seed=1)
+    recipes = RecipeGraph(ItemSchema(**item) for item in simulator.items.values())
+    drops = DropIndex(
+        [MonsterSchema(**monster) for monster in simulator.monsters.values()],
+        [ResourceSchema(**resource) for resource in simulator.resources.values()],
+    )
+    return CraftPlanner(recipes, drops, ActionCosts(gathering=25, fight=20, crafting=5, bank=3))
+
+
+def test_craft_planner():
+    """Tests."""
+    planner = make_planner()
+
+    plan = planner.plan("iron_sword")
+    assert plan.steps == (
+        PlanStep("fight", "chicken", 40, 800),
+        PlanStep("gather", "iron_rocks", 36, 900),
+        PlanStep("craft", "iron", 6, 30),
+        PlanStep("craft", "iron_sword", 1, 5),
+    )
+    assert plan.seconds == 1735
+    assert plan.levels == {"combat": 1, "mining": 10, "weaponcrafting": 10}
+    assert not plan.missing
+
+    plan = planner.plan(
+        "iron_sword",
+        inventory={"iron": 2, "feather": 5},
+        bank=[SimpleItemSchema(code="iron", quantity=1), SimpleItemSchema(code="iron_ore", quantity=10)],
+        deposit=True,
+    )
+    assert plan.steps == (
+        PlanStep("withdraw", "iron", 1, 3),
+        PlanStep("withdraw", "iron_ore", 10, 3),
+        PlanStep("gather", "iron_rocks", 8, 200),
+        PlanStep("craft", "iron", 3, 15),
+        PlanStep("craft", "iron_sword", 1, 5),
+        PlanStep("deposit", "iron_sword", 1, 3),
+    )
+
+    plan = planner.plan("small_health_potion", quantity=6)
+    assert PlanStep("craft", "small_health_potion", 2, 10) in plan.steps
+    assert PlanStep("gather", "ash_tree", 20, 500) in plan.steps
+
+    plan = planner.plan("iron_sword", levels={"combat": 1, "mining": 1})
+    assert plan.missing == {"iron_ore": 36}
+    assert planner.plan("tasks_coin").missing == {"tasks_coin": 1}
+    assert planner.plan("iron_sword", inventory={"iron_sword": 1}).steps == ()
+
+    # The same inputs are planned once; each call gets a copy that it may alter.
+    misses = planner.misses
+    plans = [planner.plan("iron_sword", levels={"combat": 1, "mining": 1}) for _ in range(1000)]
+    assert (planner.hits, planner.misses) == (1000, misses)
+    plans[0].missing["iron_ore"] = 0
+    plans[0].levels.clear()
+    assert planner.plan("iron_sword", levels={"combat": 1, "mining": 1}).missing == {"iron_ore": 36}
+    assert plans[1].levels == {"combat": 1, "mining": 10, "weaponcrafting": 10}
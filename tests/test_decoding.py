@@ -0,0 +1,28 @@
+"""Test decoding."""
+
+import pytest
+
+from artifactsmmo_sdk import decoding
+from artifactsmmo_sdk.models.maps import MapResponseSchema
+
+
+BODY = b'{"data": {"name": "Forest", "skin": "forest_1", "x": 0, "y": 1, "content": {"type": "monster", "code": "a"}}}'
+
+
+@pytest.mark.parametrize("backend", decoding.JSON_BACKENDS)
+def test_json_backends(backend):
+    """Tests."""
+    decoding.set_json_backend(backend)
+    try:
+        result = decoding.validate(MapResponseSchema, BODY)
+    finally:
+        decoding.set_json_backend("pydantic")
+
+    assert result.data.content
+    assert result.data.content.code == "a"
+
+
+def test_unknown_backend():
+    """Tests."""
+    with pytest.raises(ValueError):
+        decoding.set_json_backend("yaml")
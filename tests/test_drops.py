@@ -0,0 +1,40 @@
+"""Test drops."""
+
+from artifactsmmo_sdk.drops import COMBAT, DropIndex, character_levels
+from artifactsmmo_sdk.models.characters import CharacterSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.models.resources import ResourceSchema
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def test_drop_index():
+    """Tests."""
+    simulator = Simulator(seed=1)
+    monsters = [MonsterSchema(**monster) for monster in simulator.monsters.values()]
+    resources = [ResourceSchema(**resource) for resource in simulator.resources.values()]
+    drops = DropIndex(monsters, resources)
+
+    assert "copper_ore" in drops
+    assert "copper" not in drops
+    assert drops.sources_of("copper") == []
+
+    source = drops.best_source("copper_ore")
+    assert (source.kind, source.code, source.skill, source.level) == ("resource", "copper_rocks", "mining", 1)
+    assert source.expected_quantity == 1
+    assert source.expected_actions(10) == 10
+
+    source = drops.best_source("cowhide")
+    assert (source.kind, source.code, source.skill) == ("monster", "cow", COMBAT)
+    assert source.expected_quantity == 0.25
+    assert source.expected_actions(5) == 20
+
+    assert [source.code for source in drops.sources_of("sap", kind="resource")] == ["ash_tree"]
+    assert drops.sources_of("sap", kind="monster") == []
+
+    character = CharacterSchema(**simulator.characters["billy1"])
+    levels = character_levels(character)
+    assert levels[COMBAT] == character.level
+    assert levels["mining"] == character.mining_level
+    assert drops.best_source("iron_ore", levels=levels) is None
+    assert drops.best_source("iron_ore", levels={**levels, "mining": 10}).code == "iron_rocks"
+    assert drops.best_source("wolf_hair", levels=levels) is None
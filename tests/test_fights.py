@@ -0,0 +1,51 @@
+"""Test fights."""
+
+import random
+
+import pytest
+
+from artifactsmmo_sdk.fights import estimate_fights
+from artifactsmmo_sdk.models.characters import CharacterSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.simulator.rules import fight
+
+
+def test_estimate_fights():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    billy = simulator.characters["billy1"]
+    strong = {**billy, "hp": 215, "attack_earth": 60, "attack_fire": 30, "critical_strike": 5, "haste": 10}
+    monsters = list(simulator.monsters.values())
+
+    outcomes = estimate_fights([CharacterSchema(**billy), strong], [MonsterSchema(**monster) for monster in monsters])
+    assert outcomes.wins.shape == (2, len(monsters))
+
+    rng = random.Random(1)
+    for i, character in enumerate((billy, strong)):
+        for j, monster in enumerate(monsters):
+            results = [fight(character, monster, rng) for _ in range(200)]
+            win_rate = sum(result["result"] == "win" for result in results) / len(results)
+            turns = sum(result["turns"] for result in results) / len(results)
+            assert outcomes.wins[i, j] == (win_rate > 0.5)
+            assert outcomes.turns[i, j] == pytest.approx(turns, abs=1.5)
+            assert (outcomes.hp_left[i, j] > 0) == outcomes.wins[i, j]
+
+    chicken = monsters.index(simulator.monsters["chicken"])
+    assert outcomes.seconds[1, chicken] == pytest.approx(2 * outcomes.turns[1, chicken] * 0.9)
+
+
+def test_estimate_fights_unarmed():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    billy = simulator.characters["billy1"]
+
+    unarmed = {f"attack_{element}": 0 for element in ("fire", "earth", "water", "air")}
+    harmless = {**simulator.monsters["chicken"], **unarmed}
+    pacifist = {**billy, **unarmed}
+    outcomes = estimate_fights([billy, pacifist], [harmless])
+    assert outcomes.wins.tolist() == [[True], [False]]
+    assert outcomes.hp_left[0, 0] == billy["hp"]
+    assert outcomes.turns[1, 0] == 100
@@ -0,0 +1,116 @@
+"""Test gear."""
+
+import random
+
+import pytest
+
+from artifactsmmo_sdk.fights import CHARACTER_STATS, estimate_fights
+from artifactsmmo_sdk.gear import SLOT_GROUPS, GearCall, GearOptimizer
+from artifactsmmo_sdk.models.actions import EffectSchema, ItemSchema
+from artifactsmmo_sdk.models.characters import CharacterSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.recipes import RecipeGraph
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def test_gear_optimizer():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    items = [ItemSchema(**item) for item in simulator.items.values()]
+    billy = simulator.characters["billy1"]
+    character = CharacterSchema(**{**billy, "ring1_slot": "copper_ring"})
+    chicken = MonsterSchema(**simulator.monsters["chicken"])
+    optimizer = GearOptimizer(items)
+
+    with pytest.raises(ValueError):
+        optimizer.optimize(character)
+
+    # The ring already worn stays in place, the iron sword is above the character level.
+    inventory = {"copper_ring": 1, "copper_helmet": 1, "iron_sword": 1}
+    loadout = optimizer.optimize(character, monster=chicken, inventory=inventory, bank={"wooden_staff": 1})
+    assert loadout.equipment["weapon"] == "wooden_staff"
+    assert loadout.equipment["helmet"] == "copper_helmet"
+    assert loadout.equipment["ring1"] == loadout.equipment["ring2"] == "copper_ring"
+    assert loadout.calls == [
+        GearCall("unequip", "weapon", "wooden_stick"),
+        GearCall("equip", "weapon", "wooden_staff"),
+        GearCall("equip", "helmet", "copper_helmet"),
+        GearCall("equip", "ring2", "copper_ring"),
+    ]
+    assert loadout.sources == {"wooden_staff": "bank", "copper_helmet": "inventory", "copper_ring": "inventory"}
+
+    before = estimate_fights([character], [chicken])
+    assert loadout.score["wins"] == 1.0
+    assert loadout.score["turns"] < before.turns[0, 0]
+
+    # Nothing better at hand: no call.
+    assert optimizer.optimize(character, monster=chicken, inventory={}).calls == []
+
+    # Craftable items are candidates with the recipes.
+    crafted = GearOptimizer(items, RecipeGraph(items)).optimize(character, skill="mining", inventory={})
+    assert crafted.equipment["weapon"] == "copper_pickaxe"
+    assert crafted.sources == {"copper_pickaxe": "craft"}
+    assert crafted.score == {"mining": -10.0}
+    assert crafted.calls == [
+        GearCall("unequip", "weapon", "wooden_stick"),
+        GearCall("equip", "weapon", "copper_pickaxe"),
+    ]
+
+    # Never worse than the current equipment.
+    for monster in simulator.monsters.values():
+        monster = MonsterSchema(**monster)
+        score = GearOptimizer(items, RecipeGraph(items)).optimize(character, monster=monster).score
+        before = estimate_fights([character], [monster])
+        assert score["wins"] >= before.wins[0, 0]
+        if before.wins[0, 0]:
+            assert score["turns"] <= before.turns[0, 0]
+
+
+def test_gear_optimizer_elemental_weapon():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    items = [ItemSchema(**item) for item in simulator.items.values()]
+    character = CharacterSchema(**{**simulator.characters["billy1"], "level": 10, "hp": 200})
+    chicken = MonsterSchema(**simulator.monsters["chicken"])
+
+    # The chicken only attacks with water: its attacks must not mask the fire attack of the staff.
+    loadout = GearOptimizer(items).optimize(character, monster=chicken, inventory={"fire_staff": 1})
+    assert loadout.equipment["weapon"] == "fire_staff"
+    assert loadout.calls == [
+        GearCall("unequip", "weapon", "wooden_stick"),
+        GearCall("equip", "weapon", "fire_staff"),
+    ]
+
+
+def test_gear_optimizer_many_items():
+    """Tests."""
+    pytest.importorskip("numpy")
+    rng = random.Random(1)
+    simulator = Simulator(seed=1)
+    items = [
+        ItemSchema(
+            name=f"item{i}",
+            code=f"item{i}",
+            level=1,
+            type=SLOT_GROUPS[i % len(SLOT_GROUPS)][0],
+            subtype="",
+            description="",
+            craft=None,
+            effects=[EffectSchema(name=name, value=rng.randint(1, 20)) for name in rng.sample(CHARACTER_STATS[3:], 3)],
+        )
+        for i in range(400)
+    ]
+    character = CharacterSchema(**{**simulator.characters["billy1"], "level": 10})
+    wolf = MonsterSchema(**simulator.monsters["wolf"])
+
+    # Far more combinations than loadouts kept: every slot is still filled once, with items at hand.
+    loadout = GearOptimizer(items, max_loadouts=5_000, beam_width=64).optimize(
+        character, monster=wolf, inventory={item.code: 3 for item in items}
+    )
+    assert set(loadout.equipment) == {slot for _, slots in SLOT_GROUPS for slot in slots}
+    assert all(code.startswith("item") for code in loadout.equipment.values())
+    artifacts = [loadout.equipment[slot] for slot in ("artifact1", "artifact2", "artifact3")]
+    assert len(set(artifacts)) == len(artifacts)
+    assert loadout.score["wins"] == 1.0
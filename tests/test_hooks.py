@@ -0,0 +1,51 @@
+"""Test hooks."""
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.hooks import Hooks, endpoint
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+
+
+hooks = Hooks()
+collector = hooks.add_collector()
+calls = []
+hooks.add(before_request=lambda call: calls.append(call.endpoint))
+
+artifacts_client = ArtifactsClient(
+    token="token",
+    api_url="http://simulator",
+    transport=Simulator(seed=1),
+    rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+    hooks=hooks,
+)
+
+
+def test_endpoint():
+    """Tests."""
+    assert endpoint("post", "/my/billy1/action/fight") == "POST /my/{name}/action/fight"
+    assert endpoint("GET", "/maps/-2/3") == "GET /maps/{x}/{y}"
+    assert endpoint("GET", "/items?page=1&size=50") == "GET /items"
+    assert endpoint("POST", "/characters/create") == "POST /characters/create"
+    assert endpoint("GET", "/characters/billy1") == "GET /characters/{name}"
+
+
+def test_collector():
+    """Tests."""
+    collector.reset()
+    artifacts_client.maps.get_map(x=0, y=1)
+    artifacts_client.maps.get_map(x=0, y=2)
+    artifacts_client.maps.get_map(x=100, y=100)
+    artifacts_client.actions.fight(name="billy1")
+
+    snapshot = collector.snapshot()
+    maps = snapshot["GET /maps/{x}/{y}"]
+    assert maps["calls"] == 3
+    assert maps["statuses"] == {200: 2, 404: 1}
+    assert maps["validation_seconds"]["count"] == 2
+    assert maps["response_bytes"] > 0
+    assert snapshot["POST /my/{name}/action/fight"]["statuses"] == {598: 1}
+    assert calls[-1] == "POST /my/{name}/action/fight"
+
+    exported = collector.export_prometheus()
+    assert 'artifactsmmo_responses_total{endpoint="GET /maps/{x}/{y}",status="404"} 1' in exported
+    assert 'artifactsmmo_network_seconds_count{endpoint="GET /maps/{x}/{y}"} 3' in exported
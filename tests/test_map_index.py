@@ -0,0 +1,73 @@
+"""Test map index."""
+
+import random
+
+import pytest
+
+from artifactsmmo_sdk.map_index import MapIndex, manhattan
+from artifactsmmo_sdk.models.maps import MapContentSchema, MapSchema
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.world import World
+
+
+def make_maps(seed, width, height, density):
+    """Return a random map."""
+    rng = random.Random(seed)
+    codes = {"bank": "bank", "workshop": "weaponcrafting", "resource": "copper_rocks", "monster": "chicken"}
+    maps = []
+    for x in range(-width // 2, width // 2):
+        for y in range(-height // 2, height // 2):
+            content = None
+            if rng.random() < density:
+                content_type = rng.choice(list(codes))
+                content = MapContentSchema(type=content_type, code=codes[content_type])
+            maps.append(MapSchema(name="tile", skin="grass", x=x, y=y, content=content))
+
+    return maps
+
+
+def brute_force(maps, x, y, code, k):
+    """Return the k nearest tiles by scanning the whole map."""
+    tiles = [tile for tile in maps if tile.content and tile.content.code == code]
+    found = [(manhattan(x, y, tile.x, tile.y), tile.x, tile.y) for tile in tiles]
+    return [(distance, (tx, ty)) for distance, tx, ty in sorted(found)[:k]]
+
+
+def test_map_index():
+    """Tests."""
+    maps = make_maps(seed=1, width=60, height=40, density=0.02)
+    map_index = MapIndex(maps, cell_size=4)
+    rng = random.Random(2)
+
+    assert map_index.at(0, 0).x == 0
+    assert map_index.at(1000, 0) is None
+
+    for _ in range(200):
+        x, y, k = rng.randint(-50, 50), rng.randint(-40, 40), rng.randint(1, 5)
+        for code in ("bank", "copper_rocks"):
+            expected = brute_force(maps, x, y, code, k)
+            nearest = map_index.nearest(x, y, code=code, k=k)
+            assert [(distance, (tile.x, tile.y)) for distance, tile in nearest] == expected
+
+    assert map_index.closest(0, 0, content_type="bank").content.code == "bank"
+    assert map_index.nearest(0, 0, code="unknown") == []
+    assert map_index.closest(0, 0, code="unknown") is None
+    assert len(map_index.positions(code="chicken")) == len(map_index.positions(content_type="monster"))
+    with pytest.raises(ValueError):
+        map_index.nearest(0, 0)
+
+    positions = [(0, 0), (5, 5), (0, 0)]
+    answers = map_index.nearest_many(positions, code="chicken", k=2)
+    assert answers == [map_index.nearest(x, y, code="chicken", k=2) for x, y in positions]
+
+
+def test_world_map_index():
+    """Tests."""
+    simulator = Simulator(seed=1)
+    maps = [MapSchema(**tile) for tile in simulator.maps.values()]
+    world = World(maps=maps)
+
+    map_index = world.map_index
+    tile = map_index.closest(0, 0, code="chicken")
+    assert tile.content.code == "chicken"
+    assert world.map_index is map_index
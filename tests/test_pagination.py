@@ -0,0 +1,68 @@
+"""Test pagination."""
+
+import asyncio
+import itertools
+import threading
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.exceptions import PageError
+from artifactsmmo_sdk.hooks import Hooks
+from artifactsmmo_sdk.pagination import iter_pages
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def make_client(client_class, simulator, hooks=None):
+    """Return a client of the simulator."""
+    return client_class(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        hooks=hooks,
+    )
+
+
+def test_iter_pages():
+    """Tests."""
+    requests: list = []
+    hooks = Hooks()
+    hooks.add(before_request=lambda call: requests.append(call.path))
+    prefetched = threading.Event()
+    hooks.add(after_response=lambda call: "page=2" in call.path and prefetched.set())
+    simulator = Simulator(seed=1)
+    artifacts_client = make_client(ArtifactsClient, simulator, hooks)
+
+    maps = artifacts_client.maps.iter_maps()
+    first = next(maps)
+    assert (first.x, first.y) in simulator.maps
+    prefetched.wait(timeout=1)
+    assert requests == ["/maps?page=1&size=100", "/maps?page=2&size=100"]
+
+    assert len([first, *maps]) == len(simulator.maps)
+    assert len(requests) == -(-len(simulator.maps) // 100)
+
+    assert {item.code for item in artifacts_client.items.iter_items(size=10)} == set(simulator.items)
+    assert all(tile.content.code == "chicken" for tile in artifacts_client.maps.iter_maps(content_code="chicken"))
+    assert len(list(artifacts_client.grand_exchange.iter_ge_items())) == len(simulator.grand_exchange)
+    assert len(list(itertools.islice(artifacts_client.monsters.iter_monsters(size=1), 3))) == 3
+
+    with pytest.raises(PageError):
+        list(iter_pages(lambda page: ("Maps not found.", None), "maps"))
+
+
+def test_iter_pages_async():
+    """Tests."""
+    simulator = Simulator(seed=1)
+
+    async def iterate():
+        async with make_client(AsyncArtifactsClient, simulator) as artifacts_client:
+            maps = [tile async for tile in artifacts_client.maps.iter_maps(size=50)]
+            resources = [resource async for resource in artifacts_client.resources.iter_resources()]
+            return maps, resources
+
+    maps, resources = asyncio.run(iterate())
+    assert {(tile.x, tile.y) for tile in maps} == set(simulator.maps)
+    assert {resource.code for resource in resources} == set(simulator.resources)
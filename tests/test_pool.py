@@ -0,0 +1,40 @@
+"""Test connection pool."""
+
+import asyncio
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.pool import ConnectionPool
+
+
+def test_shared_adapter():
+    """Tests."""
+    pool = ConnectionPool(pool_maxsize=32, pool_block=True)
+    first_client = ArtifactsClient(token="first", api_url="https://api.artifactsmmo.com", pool=pool)
+    second_client = ArtifactsClient(token="second", api_url="https://api.artifactsmmo.com", pool=pool)
+
+    adapter = first_client.session.get_adapter("https://api.artifactsmmo.com")
+
+    assert adapter is second_client.session.get_adapter("https://api.artifactsmmo.com")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block
+
+
+def test_shared_async_transport():
+    """Tests."""
+    pool = ConnectionPool(keep_alive=False)
+
+    async def open_and_close():
+        async with AsyncArtifactsClient(token="first", api_url="https://api.artifactsmmo.com", pool=pool):
+            pass
+        async with AsyncArtifactsClient(token="second", api_url="https://api.artifactsmmo.com", pool=pool):
+            pass
+
+        transport = pool._async_transport
+        await pool.aclose()
+
+        return transport
+
+    transport = asyncio.run(open_and_close())
+
+    assert transport is not None
+    assert pool._async_transport is None
@@ -0,0 +1,63 @@
+"""Test rate limiter."""
+
+import time
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter, TokenBucket
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def test_token_bucket_burst():
+    """Tests."""
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+def test_rate_limiter_buckets():
+    """Tests."""
+    rate_limiter = RateLimiter()
+
+    assert rate_limiter.bucket("/my/billy1/action/move") is rate_limiter.action_bucket
+    assert rate_limiter.bucket("/my/billy1/action/bank/deposit") is rate_limiter.action_bucket
+    assert rate_limiter.bucket("/items/copper_ore") is rate_limiter.data_bucket
+    assert rate_limiter.bucket("/my/bank/items") is rate_limiter.data_bucket
+
+
+def test_rate_limiter_headers():
+    """Tests."""
+    rate_limiter = RateLimiter(data_rate=100, data_burst=100)
+
+    rate_limiter.update("/items", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+    assert 1.9 < rate_limiter.data_bucket.reserve() <= 2
+
+    rate_limiter.update("/my/billy1/action/fight", 429, {"Retry-After": "3"})
+    assert 2.9 < rate_limiter.action_bucket.reserve() <= 3
+
+
+def test_client_rate_limiter():
+    """Tests."""
+    simulator = Simulator(seed=1)
+
+    # Throttled by default, unless disabled.
+    artifacts_client = ArtifactsClient(token="token", api_url="http://simulator", transport=simulator)
+    assert isinstance(artifacts_client.rate_limiter, RateLimiter)
+    assert artifacts_client.session.rate_limiter is artifacts_client.rate_limiter
+
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=False,
+    )
+    assert artifacts_client.rate_limiter is None and artifacts_client.session.rate_limiter is None
+    start = time.monotonic()
+    for _ in range(50):
+        assert artifacts_client.characters.get_character(name="billy1").ok
+    assert time.monotonic() - start < 1
+
+    async_client = AsyncArtifactsClient(token="token", api_url="http://simulator", rate_limiter=False)
+    assert async_client.rate_limiter is None and async_client.session.rate_limiter is None
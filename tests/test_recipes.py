@@ -0,0 +1,67 @@
+"""Test recipes."""
+
+import time
+
+import pytest
+
+from artifactsmmo_sdk.exceptions import RecipeCycleError
+from artifactsmmo_sdk.models.actions import ItemSchema
+from artifactsmmo_sdk.recipes import RecipeGraph
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def make_item(code, craft=None):
+    """Return an item crafted from (code, quantity) materials."""
+    return ItemSchema(
+        name=code,
+        code=code,
+        level=1,
+        type="resource",
+        subtype="",
+        description="",
+        effects=[],
+        craft={
+            "skill": "mining",
+            "level": 1,
+            "items": [{"code": material, "quantity": quantity} for material, quantity in craft],
+            "quantity": 1,
+        } if craft else None,
+    )
+
+
+def test_recipe_graph():
+    """Tests."""
+    simulator = Simulator(seed=1)
+    recipes = RecipeGraph(ItemSchema(**item) for item in simulator.items.values())
+
+    order = recipes.order
+    for code, materials in recipes.materials.items():
+        assert all(order.index(material) < order.index(code) for material in materials)
+
+    assert recipes.is_raw("iron_ore")
+    assert recipes.recipe("iron").skill == "mining"
+    assert recipes.raw_materials("iron_ore", 3) == {"iron_ore": 3}
+    assert recipes.raw_materials("steel", 2) == {"iron_ore": 36, "coal": 14}
+    assert recipes.raw_materials("small_health_potion", 6) == {"sap": 2, "egg": 2}
+    assert recipes.raw_materials("iron_axe") == {"iron_ore": 36, "spruce_wood": 12}
+
+    assert "iron_sword" in recipes.uses("iron")
+    assert "steel" not in recipes.uses("iron_ore")
+    assert {"iron", "steel", "iron_sword"} <= set(recipes.uses("iron_ore", recursive=True))
+    assert recipes.uses("iron_sword", recursive=True) == []
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        recipes.raw_materials("steel", 2)
+    assert time.perf_counter() - start < 0.1
+
+
+def test_recipe_cycle():
+    """Tests."""
+    items = [make_item("a", [("b", 1)]), make_item("b", [("c", 2)]), make_item("c", [("a", 1)]), make_item("d")]
+    with pytest.raises(RecipeCycleError, match="a -> b -> c -> a"):
+        RecipeGraph(items)
+
+    recipes = RecipeGraph([make_item("a", [("b", 1), ("unknown", 2)]), make_item("b")])
+    assert recipes.raw_materials("a", 2) == {"b": 2, "unknown": 4}
+    assert recipes.order == ["b", "unknown", "a"]
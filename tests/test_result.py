@@ -0,0 +1,55 @@
+"""Test results."""
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.result import ErrorCode, Result
+from artifactsmmo_sdk.simulator import Simulator
+
+
+artifacts_client = ArtifactsClient(
+    token="token",
+    api_url="http://simulator",
+    transport=Simulator(seed=1),
+    rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+)
+
+
+def test_tuple_compatibility():
+    """Tests."""
+    result = artifacts_client.maps.get_map(x=0, y=1)
+    message, data = result
+
+    assert isinstance(result, tuple)
+    assert result == (message, data)
+    assert result.ok
+    assert result.status_code == 200
+    assert result.data is data
+    assert result[0] == "Successfully fetched map."
+
+
+def test_error_codes():
+    """Tests."""
+    result = artifacts_client.maps.get_map(x=100, y=100)
+
+    assert not result.ok
+    assert result.code == ErrorCode.NOT_FOUND
+    assert result.data is None
+    assert result.error and result.error.server_message == "Map not found."
+
+
+def test_cooldown():
+    """Tests."""
+    artifacts_client.actions.move(name="billy1", x=0, y=1)
+    result = artifacts_client.actions.fight(name="billy1")
+
+    assert result.code == ErrorCode.CHARACTER_IN_COOLDOWN
+    assert result.message == "Character in cooldown."
+    assert result.error and 0 < (result.error.cooldown or 0) <= 5
+
+
+def test_result():
+    """Tests."""
+    result: Result[int] = Result("Done.", 1, status_code=200)
+
+    assert tuple(result) == ("Done.", 1)
+    assert result.code is None
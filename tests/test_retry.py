@@ -0,0 +1,55 @@
+"""Test retry policy."""
+
+import asyncio
+
+import httpx
+
+from artifactsmmo_sdk.retry import RetryPolicy, cooldown_seconds
+from artifactsmmo_sdk.session import AsyncArtifactsSession
+
+
+COOLDOWN_BODY = b'{"error": {"code": 499, "message": "Character in cooldown: 0.05 seconds left."}}'
+
+
+def test_cooldown_seconds():
+    """Tests."""
+    assert cooldown_seconds(COOLDOWN_BODY) == 0.05
+    assert cooldown_seconds(b"not json") is None
+
+
+def test_retry_policy_overrides():
+    """Tests."""
+    retry_policy = RetryPolicy()
+    action_policy = retry_policy.for_request("post", "/my/billy1/action/fight")
+
+    assert retry_policy.for_request("GET", "/items/copper_ore") is retry_policy
+    assert action_policy is not retry_policy
+    assert retry_policy.delay_for_response(1, 503) is not None
+    assert action_policy.delay_for_response(1, 503) is None
+    assert action_policy.delay_for_error(1) is None
+    assert action_policy.delay_for_response(1, 499, COOLDOWN_BODY) == 0.05
+    assert action_policy.delay_for_response(1, 486) == action_policy.lock_delay
+    assert action_policy.delay_for_response(action_policy.max_attempts, 486) is None
+
+
+def test_retry_cooldown():
+    """Tests."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(499, content=COOLDOWN_BODY)
+        return httpx.Response(200, json={})
+
+    async def fight():
+        async with AsyncArtifactsSession(
+            retry_policy=RetryPolicy(),
+            transport=httpx.MockTransport(handler),
+        ) as session:
+            return await session.request("POST", "http://test/my/billy1/action/fight")
+
+    response = asyncio.run(fight())
+
+    assert response.status_code == 200
+    assert len(calls) == 2
@@ -0,0 +1,83 @@
+"""Test routes."""
+
+import itertools
+import random
+
+import pytest
+
+from artifactsmmo_sdk.map_index import manhattan
+from artifactsmmo_sdk.routes import RoutePlanner, Stop, plan_route
+
+
+def walk(start, stops):
+    """Return the movement cooldown of walking the stops in order."""
+    points = [start] + [(stop.x, stop.y) for stop in stops]
+    return sum(5 * manhattan(*a, *b) for a, b in zip(points, points[1:]))
+
+
+def valid(stops):
+    """Return whether every stop comes after its constraints (with a single last stop)."""
+    seen = set()
+    for i, stop in enumerate(stops):
+        if not set(stop.after) <= seen or (stop.last and i != len(stops) - 1):
+            return False
+        seen.add(stop.name)
+
+    return True
+
+
+def make_stops(rng, n):
+    """Return random stops: a workshop after the resources and a bank last."""
+    stops = [Stop(name=f"resource{i}", x=rng.randint(-10, 10), y=rng.randint(-10, 10)) for i in range(n - 2)]
+    materials = tuple(stop.name for stop in stops[: max(1, (n - 2) // 2)])
+    stops.append(Stop(name="workshop", x=rng.randint(-10, 10), y=rng.randint(-10, 10), after=materials))
+    stops.append(Stop(name="bank", x=rng.randint(-10, 10), y=rng.randint(-10, 10), last=True))
+    rng.shuffle(stops)
+
+    return stops
+
+
+def test_exact_route():
+    """Tests."""
+    rng = random.Random(1)
+    for n in range(3, 8):
+        stops = make_stops(rng, n)
+        route = plan_route((0, 0), stops)
+        assert route.exact
+        assert route.stops[-1].name == "bank"
+        assert valid(route.stops)
+        assert route.seconds == walk((0, 0), route.stops)
+        assert route.seconds == min(
+            walk((0, 0), order) for order in itertools.permutations(stops) if valid(order)
+        )
+
+
+def test_heuristic_route():
+    """Tests."""
+    rng = random.Random(2)
+    for n in (8, 9):
+        stops = make_stops(rng, n)
+        exact = RoutePlanner().plan((0, 0), stops)
+        heuristic = RoutePlanner(exact_limit=0).plan((0, 0), stops)
+        assert not heuristic.exact
+        assert valid(heuristic.stops)
+        assert heuristic.stops[-1].name == "bank"
+        assert exact.seconds <= heuristic.seconds <= 1.3 * exact.seconds
+
+    stops = make_stops(rng, 60)
+    route = plan_route((0, 0), stops)
+    assert sorted(stop.name for stop in route.stops) == sorted(stop.name for stop in stops)
+    assert valid(route.stops)
+
+
+def test_route_errors():
+    """Tests."""
+    assert plan_route((0, 0), []).stops == []
+    with pytest.raises(ValueError):
+        plan_route((0, 0), [Stop("a", 0, 1, after=("b",)), Stop("b", 1, 0, after=("a",))])
+    with pytest.raises(ValueError):
+        RoutePlanner(exact_limit=0).plan((0, 0), [Stop("a", 0, 1, after=("b",)), Stop("b", 1, 0, after=("a",))])
+    with pytest.raises(ValueError):
+        plan_route((0, 0), [Stop("a", 0, 1, after=("c",))])
+    with pytest.raises(ValueError):
+        plan_route((0, 0), [Stop("a", 0, 1), Stop("a", 1, 0)])
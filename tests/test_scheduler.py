@@ -0,0 +1,167 @@
+"""Test scheduler."""
+
+import asyncio
+import time
+
+from functools import partial
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.result import ApiError, ErrorCode, Result
+from artifactsmmo_sdk.scheduler import ActionScheduler, AsyncActionScheduler, result_cooldown
+from artifactsmmo_sdk.simulator import Simulator
+
+
+NAMES = ("billy1", "billy2", "billy3")
+
+
+def make_simulator():
+    """Return a simulator with a one second cooldown per move of one tile."""
+    simulator = Simulator(seed=1, cooldown_scale=0.2)
+    for name in NAMES[1:]:
+        simulator.add_character(name)
+
+    return simulator
+
+
+def test_action_scheduler():
+    """Tests."""
+    simulator = make_simulator()
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+    )
+    scheduler = ActionScheduler()
+    futures = [
+        scheduler.submit(name, partial(artifacts_client.actions.move, name=name, x=x, y=0))
+        for x in (1, 0)
+        for name in NAMES
+    ]
+    assert scheduler.pending() == 6 and scheduler.pending("billy1") == 2
+
+    # Three characters with two one-second moves each: the cooldowns overlap.
+    start = time.monotonic()
+    scheduler.run()
+    assert time.monotonic() - start < 1.8
+    assert all(future.result().ok for future in futures)
+    assert simulator.characters["billy3"]["x"] == 0
+    for name in NAMES:
+        stats = scheduler.stats[name]
+        assert stats.actions == 2
+        assert stats.cooldown == 2
+        assert stats.idle < 0.3
+        assert scheduler.free_at(name) == pytest.approx(time.monotonic() + 1, abs=0.3)
+
+    # Submitting from a result callback chains the actions.
+    done = []
+    future = scheduler.submit("billy1", partial(artifacts_client.actions.move, name="billy1", x=1, y=0))
+    future.add_done_callback(lambda _: done.append(scheduler.submit("billy1", lambda: "next")))
+    scheduler.run()
+    assert done[0].result() == "next"
+
+    cancelled = scheduler.submit("billy2", lambda: pytest.fail("cancelled"))
+    cancelled.cancel()
+    failed = scheduler.submit("billy2", lambda: 1 / 0)
+    scheduler.run()
+    assert isinstance(failed.exception(), ZeroDivisionError)
+    assert scheduler.pending() == 0
+
+
+def test_action_scheduler_cooldown():
+    """Tests."""
+    calls = []
+
+    def action():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return Result("In cooldown.", error=ApiError(499, "In cooldown.", b'{"error": {"message": "0.2 seconds"}}'))
+        return Result("Done.")
+
+    scheduler = ActionScheduler()
+    future = scheduler.submit("billy1", action)
+    scheduler.run()
+    assert future.result().ok
+    assert calls[1] - calls[0] == pytest.approx(0.2, abs=0.1)
+    assert scheduler.stats["billy1"].actions == 1
+
+    # No cooldown in the answer: the retries back off.
+    calls.clear()
+
+    def unknown():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            return Result("In cooldown.", error=ApiError(499, "In cooldown.", b'{"error": {"message": "no number"}}'))
+        return Result("Done.")
+
+    scheduler = ActionScheduler(retry_delay=0.1)
+    future = scheduler.submit("billy1", unknown)
+    scheduler.run()
+    assert future.result().ok
+    assert calls[1] - calls[0] == pytest.approx(0.1, abs=0.05)
+    assert calls[2] - calls[1] == pytest.approx(0.2, abs=0.05)
+    assert scheduler.stats["billy1"].actions == 1
+
+    assert result_cooldown(None) == 0
+    assert result_cooldown(Result("Error.", error=ApiError(ErrorCode.NOT_FOUND, "Error."))) == 0
+
+
+def test_async_action_scheduler():
+    """Tests."""
+    simulator = make_simulator()
+
+    async def main():
+        async with AsyncArtifactsClient(
+            token="token",
+            api_url="http://simulator",
+            transport=simulator,
+            rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        ) as artifacts_client:
+            scheduler = AsyncActionScheduler()
+            futures = [
+                scheduler.submit(name, partial(artifacts_client.actions.move, name=name, x=x, y=0))
+                for x in (1, 0)
+                for name in NAMES
+            ]
+            await scheduler.run()
+            return scheduler, await asyncio.gather(*futures)
+
+    start = time.monotonic()
+    scheduler, results = asyncio.run(main())
+    assert time.monotonic() - start < 1.8
+    assert all(result.ok for result in results)
+    assert all(scheduler.stats[name].actions == 2 for name in NAMES)
+
+
+def test_async_action_scheduler_cancel():
+    """Tests."""
+
+    async def main():
+        scheduler = AsyncActionScheduler()
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            await release.wait()
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        cancelled = scheduler.submit("billy1", slow)
+        following = scheduler.submit("billy1", fast)
+        running = asyncio.ensure_future(scheduler.run())
+
+        # Cancelled while in flight: the action completes, the next one is still sent and `run` returns.
+        await started.wait()
+        cancelled.cancel()
+        release.set()
+        await asyncio.wait_for(running, 5)
+        return cancelled, await following
+
+    cancelled, following = asyncio.run(main())
+    assert cancelled.cancelled()
+    assert following == "fast"
@@ -0,0 +1,94 @@
+"""Test server clock."""
+
+import time
+
+from email.utils import formatdate
+from functools import partial
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.models.actions import CooldownSchema
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.scheduler import ActionScheduler
+from artifactsmmo_sdk.server_clock import ServerClock, timestamp
+from artifactsmmo_sdk.simulator import Simulator
+
+
+def test_server_clock():
+    """Tests."""
+    now = [1000.0]
+    server_clock = ServerClock(drift=0.01, clock=lambda: now[0])
+    assert server_clock.offset == 0
+    assert server_clock.now() == 1000
+
+    # Server 2.3 seconds ahead: the Date headers, truncated to the second, narrow the offset down.
+    for sent_at in (1000.0, 1010.25, 1020.5, 1030.75):
+        server_clock.observe_response({"Date": formatdate(sent_at + 0.05 + 2.3, usegmt=True)}, sent_at, sent_at + 0.1)
+    assert server_clock.samples == 4
+    assert server_clock.low <= 2.3 <= server_clock.high
+    assert server_clock.offset == pytest.approx(2.3, abs=0.1)
+
+    # The bounds widen with the time elapsed since the last sample.
+    now[0] = 1030.85
+    uncertainty = server_clock.uncertainty
+    now[0] = 1130.85
+    assert server_clock.uncertainty == pytest.approx(uncertainty + 1)
+
+    # A cooldown started 2.3 seconds ahead of the local time.
+    cooldown = CooldownSchema(
+        total_seconds=30,
+        remaining_seconds=30,
+        expiration="1970-01-01T00:19:23.150Z",
+        reason="fight",
+    )
+    server_clock.observe_cooldown(cooldown, 1130.8, 1130.9)
+    assert server_clock.low <= 2.3 <= server_clock.high
+    assert server_clock.seconds_until(cooldown.expiration) == pytest.approx(30 - 0.05, abs=0.15)
+    assert server_clock.seconds_until(cooldown.expiration, latest=True) >= 30 - 0.05
+    assert server_clock.local_time(1163.15) == pytest.approx(1160.85, abs=0.15)
+
+    # The server clock was set back: start over.
+    server_clock.observe(2000.0, 2000.0, 2000.2)
+    assert server_clock.offset == pytest.approx(-0.1)
+
+    server_clock.observe_response({}, 0, 1)
+    server_clock.observe_response({"Date": "yesterday"}, 0, 1)
+    assert server_clock.samples == 6
+    assert timestamp("1970-01-01T00:00:01.500Z") == 1.5
+
+
+def test_server_clock_session():
+    """Tests."""
+    # The simulator runs 3 seconds ahead and a move of one tile cools down for 1.3 seconds.
+    simulator = Simulator(seed=1, clock=lambda: time.time() + 3, cooldown_scale=0.26)
+    server_clock = ServerClock()
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        server_clock=server_clock,
+    )
+    artifacts_client.characters.get_character(name="billy1")
+    assert server_clock.samples == 1
+    assert server_clock.offset == pytest.approx(3, abs=0.6)
+
+    statuses = []
+
+    def move(x):
+        result = artifacts_client.actions.move(name="billy1", x=x, y=0)
+        statuses.append(result.status_code)
+        return result
+
+    scheduler = ActionScheduler(server_clock=server_clock)
+    for x in (1, 0, 1):
+        scheduler.submit("billy1", partial(move, x))
+    start = time.monotonic()
+    scheduler.run()
+
+    # Dispatched once the cooldowns expired for sure, not after their rounded 1 second (answered 499).
+    assert statuses == [200, 200, 200]
+    assert 2.6 <= time.monotonic() - start <= 2.6 + 2 * (server_clock.high - server_clock.low) + 0.3
+    assert server_clock.low <= 3 <= server_clock.high
+    assert server_clock.samples > 4
@@ -0,0 +1,213 @@
+"""Test simulator."""
+
+import asyncio
+import threading
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.retry import RetryPolicy
+from artifactsmmo_sdk.simulator import Simulator, make_server
+from artifactsmmo_sdk.transport import TransportRequest
+
+
+class Clock:
+    """Manual clock."""
+
+    def __init__(
+        self,
+    ) -> None:
+        """Init."""
+        self.now = 1_700_000_000.0
+
+    def __call__(
+        self,
+    ) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_client(
+    simulator: Simulator,
+    **kwargs,
+) -> ArtifactsClient:
+    """Return a client of the simulator without rate limiting."""
+    return ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        **kwargs,
+    )
+
+
+def test_data_endpoints():
+    """Tests."""
+    artifacts_client = make_client(Simulator(seed=1))
+
+    error, maps = artifacts_client.maps.get_all_maps(content_code="", content_type="monster", size=100)
+    assert maps, error
+    assert {tile.content.type for tile in maps.data if tile.content} == {"monster"}
+
+    error, items = artifacts_client.items.get_all_items(
+        craft_material="copper",
+        craft_skill="gearcrafting",
+        max_level=0,
+        min_level=0,
+        name="",
+        type_item="",
+    )
+    assert items, error
+    assert "copper_helmet" in {item.code for item in items.data}
+
+    error, monster = artifacts_client.monsters.get_monster(code="unknown")
+    assert monster is None
+    assert error == "Monster not found."
+
+
+def test_cooldown():
+    """Tests."""
+    clock = Clock()
+    artifacts_client = make_client(Simulator(clock=clock, seed=1))
+
+    error, move = artifacts_client.actions.move(name="billy1", x=2, y=0)
+    assert move, error
+    assert move.data.cooldown.total_seconds == 2 * Simulator.MOVE_SECONDS
+
+    error, result = artifacts_client.actions.gathering(name="billy1")
+    assert result is None
+    assert error == "Character in cooldown."
+
+    clock.now += move.data.cooldown.total_seconds
+    error, result = artifacts_client.actions.move(name="billy1", x=2, y=0)
+    assert result is None
+    assert error == "Character already at destination."
+
+    error, result = artifacts_client.actions.gathering(name="billy1")
+    assert result, error
+    assert result.data.details.items[0].code == "copper_ore"
+
+
+def test_game_errors():
+    """Tests."""
+    simulator = Simulator(clock=Clock(), seed=1)
+    artifacts_client = make_client(simulator)
+
+    error, _ = artifacts_client.actions.fight(name="billy1")
+    assert error == "Monster not found on this map."
+
+    error, _ = artifacts_client.actions.fight(name="nobody")
+    assert error == "Character not found."
+
+    simulator.add_character("full", x=0, y=1, inventory=[{"code": "copper_ore", "quantity": 100}])
+    error, _ = artifacts_client.actions.fight(name="full")
+    assert error == "Character inventory is full."
+
+    simulator.locked.add("billy1")
+    response = simulator.handle(TransportRequest(method="POST", path="/my/billy1/action/fight"))
+    assert response.status_code == 486
+
+
+def test_invalid_payloads():
+    """Tests."""
+    simulator = Simulator(clock=Clock(), seed=1)
+
+    def post(path: str, body: bytes) -> dict:
+        response = simulator.handle(TransportRequest(method="POST", path=path, body=body))
+        assert response.status_code == 422
+        return response.json["error"]
+
+    error = post("/my/billy1/action/move", b'{"x": "east", "y": 0}')
+    assert error == {"code": 422, "message": "Invalid payload: x must be an integer."}
+    assert post("/my/billy1/action/equip", b'{"code": "copper_ring", "slot": "ring9"}')["code"] == 422
+    assert post("/my/billy1/action/crafting", b'{"code": "copper", "quantity": 0}')["code"] == 422
+    assert post("/my/billy1/action/move", b"{x: 1}")["message"] == "Invalid payload: malformed JSON."
+    assert post("/characters/create", b"[]")["message"] == "Invalid payload: the body must be an object."
+    response = simulator.handle(TransportRequest(method="GET", path="/maps", params={"page": "0"}))
+    assert response.status_code == 422
+
+    # A rejected payload neither locks the character nor starts a cooldown.
+    assert not simulator.locked
+    move = simulator.handle(TransportRequest(method="POST", path="/my/billy1/action/move", body=b'{"x": 1, "y": 0}'))
+    assert move.status_code == 200
+
+    # Bugs of the handlers are not answered as invalid payloads.
+    def broken(_: TransportRequest):
+        return {}["missing"]
+
+    simulator.add("GET", "/broken", broken)
+    with pytest.raises(KeyError):
+        simulator.handle(TransportRequest(method="GET", path="/broken"))
+
+
+def test_craft_and_fight():
+    """Tests."""
+    simulator = Simulator(clock=Clock(), seed=1)
+    simulator.add_character("smith", x=3, y=1, inventory=[{"code": "copper", "quantity": 6}])
+    artifacts_client = make_client(simulator)
+
+    error, craft = artifacts_client.actions.crafting(name="smith", code="copper_helmet")
+    assert craft, error
+    assert craft.data.character.gearcrafting_xp > 0
+    assert [(item.code, item.quantity) for item in craft.data.details.items] == [("copper_helmet", 1)]
+
+    # Recycling into a full inventory keeps the item.
+    simulator.characters["smith"]["cooldown_expiration"] = "2000-01-01T00:00:00.000Z"
+    simulator.characters["smith"]["inventory"][1].update({"code": "copper_ore", "quantity": 99})
+    error, _ = artifacts_client.actions.recycling(name="smith", code="copper_helmet")
+    assert error == "Character inventory is full."
+    assert simulator.characters["smith"]["inventory"][0]["code"] == "copper_helmet"
+    simulator.characters["smith"]["inventory"][1].update({"code": "", "quantity": 0})
+
+    simulator.characters["smith"].update({"x": 0, "y": 1, "cooldown_expiration": "2000-01-01T00:00:00.000Z"})
+    error, fight = artifacts_client.actions.fight(name="smith")
+    assert fight, error
+    assert fight.data.fight.result == "win"
+    assert fight.data.cooldown.total_seconds == Simulator.FIGHT_SECONDS_PER_TURN * fight.data.fight.turns
+
+
+def test_retry_on_cooldown():
+    """Tests."""
+    artifacts_client = make_client(Simulator(seed=1, cooldown_scale=0.01), retry_policy=RetryPolicy())
+
+    error, move = artifacts_client.actions.move(name="billy1", x=0, y=1)
+    assert move, error
+
+    error, fight = artifacts_client.actions.fight(name="billy1")
+    assert fight, error
+
+
+def test_http_server():
+    """Tests."""
+    server = make_server(Simulator(seed=1), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        host, port = server.server_address[:2]
+        artifacts_client = ArtifactsClient(token="token", api_url=f"http://{host}:{port}")
+
+        error, character = artifacts_client.characters.get_character(name="billy1")
+        assert character, error
+        assert character.data.weapon_slot == "wooden_stick"
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_async_http_server():
+    """Tests."""
+    server = make_server(Simulator(seed=1), port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    async def status():
+        async with AsyncArtifactsClient(token="token", api_url=f"http://{host}:{port}") as artifacts_client:
+            return await artifacts_client.status()
+
+    try:
+        host, port = server.server_address[:2]
+        assert asyncio.run(status()).data.status
+
+    finally:
+        server.shutdown()
+        server.server_close()
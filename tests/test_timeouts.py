@@ -0,0 +1,63 @@
+"""Test timeouts and deadlines."""
+
+import asyncio
+import socket
+import threading
+import time
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.retry import RetryPolicy
+
+
+def start_silent_server():
+    """Start a server accepting connections and never answering."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(50)
+    connections = []
+
+    def accept():
+        while True:
+            connections.append(server.accept())
+
+    threading.Thread(target=accept, daemon=True).start()
+
+    return f"http://127.0.0.1:{server.getsockname()[1]}"
+
+
+API_URL = start_silent_server()
+
+
+def test_read_timeout():
+    """Tests."""
+    artifacts_client = ArtifactsClient(token="token", api_url=API_URL, timeout=(1, 0.1))
+
+    error, result = artifacts_client.characters.get_character(name="billy1")
+
+    assert result is None
+    assert error == "Request timed out."
+
+
+def test_deadline_with_retries():
+    """Tests."""
+    artifacts_client = ArtifactsClient(token="token", api_url=API_URL, retry_policy=RetryPolicy())
+
+    start = time.monotonic()
+    error, result = artifacts_client.characters.with_options(deadline=0.3).get_character(name="billy1")
+
+    assert result is None
+    assert error == "Request timed out."
+    assert time.monotonic() - start < 1
+
+
+def test_async_deadline():
+    """Tests."""
+
+    async def get_character():
+        async with AsyncArtifactsClient(token="token", api_url=API_URL) as artifacts_client:
+            return await artifacts_client.characters.with_options(deadline=0.3).get_character(name="billy1")
+
+    error, result = asyncio.run(get_character())
+
+    assert result is None
+    assert error == "Request timed out."
@@ -0,0 +1,68 @@
+"""Test transports."""
+
+import asyncio
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.transport import MemoryTransport, TransportRequest, TransportResponse
+
+
+ITEM = {
+    "name": "Copper Ore",
+    "code": "copper_ore",
+    "level": 1,
+    "type": "resource",
+    "subtype": "mining",
+    "description": "",
+    "effects": [],
+    "craft": None,
+}
+
+transport = MemoryTransport()
+transport.add("GET", "/items/copper_ore", json={"data": {"item": ITEM, "ge": None}})
+
+
+@transport.route("GET", "/maps/{x}/{y}")
+def get_map(request: TransportRequest) -> TransportResponse:
+    """Answer the map at the requested position."""
+    x, y = int(request.path_params["x"]), int(request.path_params["y"])
+    return TransportResponse(json={"data": {"name": "Forest", "skin": "forest_1", "x": x, "y": y}})
+
+
+artifacts_client = ArtifactsClient(token="token", api_url="http://memory", transport=transport)
+
+
+def test_canned_response():
+    """Tests."""
+    error, result = artifacts_client.items.get_item(code="copper_ore")
+
+    assert result, error
+    assert result.data.item.code == "copper_ore"
+
+
+def test_handler():
+    """Tests."""
+    error, result = artifacts_client.maps.get_map(x=2, y=-1)
+
+    assert result, error
+    assert (result.data.x, result.data.y) == (2, -1)
+
+
+def test_unknown_route():
+    """Tests."""
+    error, result = artifacts_client.monsters.get_monster(code="chicken")
+
+    assert result is None
+    assert error == "Monster not found."
+
+
+def test_async_transport():
+    """Tests."""
+
+    async def get_item():
+        async with AsyncArtifactsClient(token="token", api_url="http://memory", transport=transport) as client:
+            return await client.items.get_item(code="copper_ore")
+
+    error, result = asyncio.run(get_item())
+
+    assert result, error
+    assert result.data.item.code == "copper_ore"
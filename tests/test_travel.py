@@ -0,0 +1,59 @@
+"""Test travel."""
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.map_index import manhattan
+from artifactsmmo_sdk.models.maps import MapSchema
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.travel import TravelMatrix, TravelModel
+
+
+def test_travel_model():
+    """Tests."""
+    model = TravelModel()
+    assert model.estimate(0, 0, 2, 1) == 15
+    assert model.estimate(3, 3, 3, 3) == 0
+
+    for distance in (1, 2, 4, 8):
+        model.observe(distance, 2 + 3 * distance)
+    assert model.seconds_per_tile == pytest.approx(3)
+    assert model.base_seconds == pytest.approx(2)
+
+    simulator = Simulator(seed=1, cooldown_scale=0)
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+    )
+    model = TravelModel(seconds_per_tile=1)
+    origin = (simulator.characters["billy1"]["x"], simulator.characters["billy1"]["y"])
+    _, data = artifacts_client.actions.move(name="billy1", x=origin[0] + 2, y=origin[1] + 1)
+    model.observe_move(origin, data.data)
+    assert model.seconds_per_tile == pytest.approx(data.data.cooldown.total_seconds / 3)
+
+
+def test_travel_matrix():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    maps = [MapSchema(**tile) for tile in simulator.maps.values()]
+    matrix = TravelMatrix(maps)
+
+    assert len(matrix.tiles) == len([tile for tile in maps if tile.content])
+    for i, a in enumerate(matrix.tiles):
+        for j, b in enumerate(matrix.tiles):
+            assert matrix.distances[i, j] == manhattan(a.x, a.y, b.x, b.y)
+    assert (matrix.seconds == 5 * matrix.distances).all()
+
+    distance, tile = matrix.nearest(0, 0, content_type="bank")
+    assert tile.content.code == "bank"
+    assert distance == min(manhattan(0, 0, t.x, t.y) for t in matrix.tiles if t.content.type == "bank")
+    assert matrix.nearest(0, 0, code="unknown") is None
+    assert matrix.seconds_from(tile.x, tile.y)[matrix.index[(tile.x, tile.y)]] == 0
+
+    matrix.model.observe(2, 20)
+    matrix.refresh()
+    assert (matrix.seconds == 10 * matrix.distances).all()
@@ -0,0 +1,62 @@
+"""Test world."""
+
+import asyncio
+
+from artifactsmmo_sdk import ArtifactsClient, AsyncArtifactsClient
+from artifactsmmo_sdk.hooks import Hooks
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.world import load_world, load_world_async
+from artifactsmmo_sdk.world_store import WorldStore
+
+
+def make_client(client_class, simulator, hooks=None):
+    """Return a client of the simulator."""
+    return client_class(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        hooks=hooks,
+    )
+
+
+def test_load_world(tmp_path):
+    """Tests."""
+    requests: list = []
+    hooks = Hooks()
+    hooks.add(before_request=lambda call: requests.append(call.path))
+    simulator = Simulator(seed=1)
+    artifacts_client = make_client(ArtifactsClient, simulator, hooks)
+
+    world = load_world(artifacts_client, concurrency=4)
+    assert set(world.items) == set(simulator.items)
+    assert set(world.monsters) == set(simulator.monsters)
+    assert set(world.maps) == set(simulator.maps)
+    assert len(world.ge_items) == len(simulator.grand_exchange)
+    assert world.map_at(0, 0).x == 0
+    assert all(tile.content.code == "chicken" for tile in world.maps_with("chicken"))
+    assert world.maps_with("chicken")
+    assert world.maps_with("unknown") == []
+    assert len([path for path in requests if path.startswith("/maps")]) == -(-len(simulator.maps) // 100)
+
+    store = WorldStore(tmp_path / "world.sqlite3")
+    load_world(artifacts_client, store=store)
+    requests.clear()
+    stored = load_world(artifacts_client, store=store)
+    assert stored.items == world.items
+    assert not [path for path in requests if path.startswith("/maps")]
+    assert [path for path in requests if path.startswith("/ge")]
+
+
+def test_load_world_async():
+    """Tests."""
+    simulator = Simulator(seed=1)
+
+    async def load():
+        async with make_client(AsyncArtifactsClient, simulator) as artifacts_client:
+            return await load_world_async(artifacts_client, concurrency=4)
+
+    world = asyncio.run(load())
+    assert set(world.maps) == set(simulator.maps)
+    assert set(world.resources) == set(simulator.resources)
@@ -0,0 +1,54 @@
+"""Test world store."""
+
+import sqlite3
+import warnings
+
+from contextlib import closing
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.hooks import Hooks
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.world_store import WorldStore
+
+
+def test_world_store(tmp_path):
+    """Tests."""
+    requests: list = []
+    hooks = Hooks()
+    hooks.add(before_request=lambda call: requests.append(call.endpoint))
+    simulator = Simulator(seed=1)
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+        hooks=hooks,
+    )
+    path = tmp_path / "world.sqlite3"
+
+    def written():
+        with closing(sqlite3.connect(path)) as connection:
+            return connection.execute("SELECT name, fetched_at FROM datasets").fetchall()
+
+    # The connections are closed, not left to the garbage collector.
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        store = WorldStore(path)
+        datasets = store.load(artifacts_client)
+    assert len(datasets["maps"]) == len(simulator.maps)
+    assert len(datasets["items"]) == len(simulator.items)
+    assert "GET /maps" in requests
+    rows = written()
+    assert len(rows) == 4
+
+    # Same version and wipe: read back, nothing fetched nor written.
+    requests.clear()
+    reloaded = WorldStore(path).load(artifacts_client)
+    assert reloaded == datasets
+    assert not requests
+    assert written() == rows
+
+    simulator.status["version"] = "2.0"
+    store.load(artifacts_client)
+    assert "GET /items" in requests
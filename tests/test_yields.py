@@ -0,0 +1,87 @@
+"""Test yields."""
+
+import pytest
+
+from artifactsmmo_sdk import ArtifactsClient
+from artifactsmmo_sdk.models.actions import ItemSchema
+from artifactsmmo_sdk.models.characters import CharacterSchema
+from artifactsmmo_sdk.models.grand_exchange import GEItemSchema
+from artifactsmmo_sdk.models.maps import MapSchema
+from artifactsmmo_sdk.models.monsters import MonsterSchema
+from artifactsmmo_sdk.models.resources import ResourceSchema
+from artifactsmmo_sdk.rate_limiter import RateLimiter
+from artifactsmmo_sdk.simulator import Simulator
+from artifactsmmo_sdk.travel import TravelMatrix
+from artifactsmmo_sdk.yields import YieldModel
+
+
+def test_yield_model():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1, cooldown_scale=0)
+    model = YieldModel(
+        monsters=[MonsterSchema(**monster) for monster in simulator.monsters.values()],
+        resources=[ResourceSchema(**resource) for resource in simulator.resources.values()],
+        items=[ItemSchema(**item) for item in simulator.items.values()],
+        ge_items=[GEItemSchema(**item) for item in simulator.grand_exchange.values()],
+    )
+    billy = CharacterSchema(**simulator.characters["billy1"])
+
+    estimates = model.estimate(billy)
+    copper_rocks = estimates.codes.index("copper_rocks")
+    assert estimates.seconds[copper_rocks] == 25
+    assert estimates.xp_per_hour[copper_rocks] == pytest.approx(12 * 3600 / 25)
+    assert estimates.rank("copper_ore") == [("copper_rocks", pytest.approx(3600 / 25))]
+    assert not estimates.available[estimates.codes.index("iron_rocks")]
+    assert [code for code, _ in estimates.rank("xp", skill="mining")] == ["copper_rocks"]
+    assert estimates.rank("unknown") == []
+
+    # Lost fights yield nothing.
+    xp = dict(estimates.rank("xp", skill="combat"))
+    assert "chicken" in xp and "wolf" not in xp
+
+    # A pickaxe shortens the gathering.
+    estimates = model.estimate(billy.model_copy(update={"weapon_slot": "copper_pickaxe"}))
+    assert estimates.seconds[copper_rocks] == pytest.approx(22.5)
+    assert estimates.rank("xp", skill="mining")[0][1] == pytest.approx(12 * 3600 / 22.5)
+
+    # Observations pull the estimates towards the actual results.
+    for _ in range(20):
+        model.observe("copper_rocks", billy, seconds=50, xp=12, drops={"copper_ore": 2})
+    estimates = model.estimate(billy)
+    assert estimates.seconds[copper_rocks] == pytest.approx(25 + 25 * 20 / 25)
+    copper_ore = estimates.items.index("copper_ore")
+    assert estimates.items_per_hour[copper_rocks, copper_ore] == pytest.approx((1 + 20 / 25) * 3600 / 45)
+
+    artifacts_client = ArtifactsClient(
+        token="token",
+        api_url="http://simulator",
+        transport=simulator,
+        rate_limiter=RateLimiter(action_rate=float("inf"), data_rate=float("inf")),
+    )
+    tile = next(tile for tile in simulator.maps.values() if tile["content"] and tile["content"]["code"] == "chicken")
+    artifacts_client.actions.move(name="billy1", x=tile["x"], y=tile["y"])
+    _, result = artifacts_client.actions.fight(name="billy1")
+    model.observe_fight("chicken", result.data, billy)
+    assert model.observations[model.index["chicken"]] == 1
+    assert model._expected[model.index["chicken"], 1] == model._priors(billy)[0][model.index["chicken"], 1]
+
+
+def test_yield_model_travel():
+    """Tests."""
+    pytest.importorskip("numpy")
+    simulator = Simulator(seed=1)
+    maps = [MapSchema(**tile) for tile in simulator.maps.values()]
+    model = YieldModel(
+        resources=[ResourceSchema(**resource) for resource in simulator.resources.values()],
+        travel=TravelMatrix(maps),
+        actions_per_trip=10,
+    )
+    billy = simulator.characters["billy1"]
+    tile = next(tile for tile in maps if tile.content and tile.content.code == "copper_rocks")
+
+    near = model.estimate(CharacterSchema(**{**billy, "x": tile.x, "y": tile.y}))
+    far = model.estimate(CharacterSchema(**{**billy, "x": tile.x + 4, "y": tile.y}))
+    copper_rocks = near.codes.index("copper_rocks")
+    assert near.seconds[copper_rocks] == 25
+    assert 25 < far.seconds[copper_rocks] <= 25 + 4 * 5 / 10